@@ -0,0 +1,348 @@
+##################################################################
+##                                                              ##
+## A headless benchmark of GameSaver                            ##
+##                                                              ##
+##################################################################
+##                                                              ##
+## This code is free for both commercial and private use.       ##
+## This module and related files are offered as-is, without any ##
+## warranty, with any and all defects or errors.                ##
+##                                                              ##
+##################################################################
+
+# This script builds synthetic hierarchies of SaveableObjects of
+# various shapes and sizes, and times each stage of saving and
+# loading them separately: "getSaveData", writing the resultant
+# GameSaveEntries to file, reading them back, and "loadFromSaveData".
+# For each it reports the time taken, the throughput, and (from a
+# second, separate run, as tracing memory slows everything down) the
+# peak memory allocated; the size of the file written is reported too.
+#
+# Finally, for each shape it compares the time per entry at the
+# largest size against that at the smallest, flagging any stage that
+# appears to scale worse than linearly.
+#
+# Run with "--help" to see the available options; for example:
+#
+#   python GameSaverBenchmark.py --shapes wide deep --sizes 1000 10000
+#   python GameSaverBenchmark.py --format binary --compression zlib
+#
+# Like the examples, this script expects the GameSaver folder to be
+# importable as a package; if it isn't, the folder above this
+# script's folder is added to the path.
+
+import sys, os, io, time, gc, tempfile, tracemalloc, argparse
+
+try:
+    from GameSaver.GameSaver import SaveableObject, GameSaveEntry, GameSaver
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from GameSaver.GameSaver import SaveableObject, GameSaveEntry, GameSaver
+
+# A simple type saved via GameSaver's "special types"
+class BenchmarkVector(object):
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+def getVectorForSave(vec):
+    return (vec.x, vec.y, vec.z)
+
+def makeVectorFromSave(description):
+    x = description.dataList[0].dataList[0]
+    y = description.dataList[1].dataList[0]
+    z = description.dataList[2].dataList[0]
+    return BenchmarkVector(float(x), float(y), float(z))
+
+# A small object of the sort that a game might hold many of
+class BenchmarkItem(SaveableObject):
+    def __init__(self, index = 0):
+        self.index = index
+        self.name = "item" + str(index)
+        self.health = index * 0.5
+        self.active = index % 2 == 0
+        self.inventory = [index, index + 1, index + 2]
+
+    def getSaveData(self, forLevelSave):
+        result = SaveableObject.getSaveData(self, forLevelSave)
+        result.addItem("index = ", self.index)
+        result.addItem("name = ", self.name)
+        result.addItem("health = ", self.health)
+        result.addItem("active = ", self.active)
+        result.addItem("inventory = ", self.inventory)
+        return result
+
+# The root of each hierarchy; the data that it holds
+# depends on the shape of hierarchy being built
+class BenchmarkRoot(SaveableObject):
+    def __init__(self):
+        self.data = None
+        self.items = []
+
+    def getSaveData(self, forLevelSave):
+        result = SaveableObject.getSaveData(self, forLevelSave)
+        result.addItem("data = ", self.data)
+        itemEntry = GameSaveEntry()
+        for item in self.items:
+            itemEntry.addItem("", item.getSaveData(forLevelSave))
+        result.addItem("loadItems", itemEntry)
+        return result
+
+    def loadItems(self, data, refObj):
+        self.items = []
+        for datum in data.dataList:
+            newObj = BenchmarkItem()
+            newObj.loadFromSaveData(datum, refObj)
+            self.items.append(newObj)
+
+# The shapes of hierarchy; each function takes a size and returns
+# a BenchmarkRoot holding data of roughly that many elements
+def makeWide(size):
+    root = BenchmarkRoot()
+    root.data = [(i, i * 0.25, "value" + str(i)) for i in range(size)]
+    return root
+
+def makeDeep(size):
+    root = BenchmarkRoot()
+    data = []
+    root.data = data
+    for i in range(size):
+        newData = [i]
+        data.append(newData)
+        data = newData
+    return root
+
+def makeDicts(size):
+    root = BenchmarkRoot()
+    root.data = [{"id" : i, "score" : i * 1.5, "tag" : "t" + str(i % 10)} for i in range(size)]
+    return root
+
+def makeStrings(size):
+    root = BenchmarkRoot()
+    text = "Kittens and meteors\nare magic! " * 32
+    blob = bytes(range(256)) * 4
+    root.data = [(text, blob) for i in range(size)]
+    return root
+
+def makeNumeric(size):
+    root = BenchmarkRoot()
+    root.data = [[i * 0.25 for i in range(64)] for j in range(max(size // 64, 1))]
+    return root
+
+def makeSpecial(size):
+    root = BenchmarkRoot()
+    root.data = [BenchmarkVector(i, i * 0.5, -i) for i in range(size)]
+    return root
+
+def makeObjects(size):
+    root = BenchmarkRoot()
+    root.items = [BenchmarkItem(i) for i in range(size)]
+    return root
+
+shapeBuilders = {
+    "wide" : makeWide,
+    "deep" : makeDeep,
+    "dicts" : makeDicts,
+    "strings" : makeStrings,
+    "numeric" : makeNumeric,
+    "special" : makeSpecial,
+    "objects" : makeObjects,
+}
+
+# Used by GameSaver to check whether the named class is a subclass
+# of the given class, since GameSaver doesn't know about the classes
+# defined here; see the examples for more on this.
+benchmarkClasses = dict((cls.__name__, cls) for cls in (BenchmarkVector, BenchmarkItem, BenchmarkRoot))
+
+def isSubclass(name, classToCheck):
+    if not name in benchmarkClasses:
+        return False
+    return issubclass(benchmarkClasses[name], classToCheck)
+
+stageNames = ("getSaveData", "write", "read", "loadFromSaveData")
+
+def countEntries(entry):
+    count = 0
+    stack = [entry]
+    while len(stack) > 0:
+        entry = stack.pop()
+        count += 1
+        for datum in entry.peekDataList():
+            if isinstance(datum, GameSaveEntry):
+                stack.append(datum)
+    return count
+
+def openForWriting(fileName, fileFormat, compression):
+    if compression is None:
+        if fileFormat == GameSaver.FORMAT_BINARY:
+            return open(fileName, "wb"), None
+        return open(fileName, "w"), None
+    rawFileObj = open(fileName, "wb")
+    fileObj = GameSaver.openCompressedWriter(rawFileObj, compression)
+    if fileFormat == GameSaver.FORMAT_TEXT:
+        fileObj = io.TextIOWrapper(fileObj, encoding = "utf-8")
+    return fileObj, rawFileObj
+
+def openForReading(fileName, fileFormat, compression):
+    if compression is None:
+        if fileFormat == GameSaver.FORMAT_BINARY:
+            return open(fileName, "rb"), None
+        return open(fileName, "r"), None
+    rawFileObj = open(fileName, "rb")
+    fileObj = GameSaver.openDecompressedReader(rawFileObj, compression)
+    if fileFormat == GameSaver.FORMAT_TEXT:
+        fileObj = io.TextIOWrapper(fileObj, encoding = "utf-8")
+    return fileObj, rawFileObj
+
+def runStages(root, fileName, fileFormat, compression, measure):
+    """Run each stage once, passing each stage's result on to the
+    next, and call "measure" around each; "measure" takes the
+    stage's name and a function that performs it, and returns
+    that function's result."""
+
+    def write():
+        fileObj, rawFileObj = openForWriting(fileName, fileFormat, compression)
+        if fileFormat == GameSaver.FORMAT_BINARY:
+            GameSaver.writeBinaryEntry(saveData, fileObj)
+        else:
+            GameSaver.writeEntry(saveData, fileObj)
+        fileObj.close()
+        if rawFileObj is not None:
+            rawFileObj.close()
+
+    def read():
+        fileObj, rawFileObj = openForReading(fileName, fileFormat, compression)
+        if fileFormat == GameSaver.FORMAT_BINARY:
+            result = GameSaver.readBinaryEntry(fileObj)
+        else:
+            result = GameSaver.readEntry(fileObj)
+        fileObj.close()
+        if rawFileObj is not None:
+            rawFileObj.close()
+        return result
+
+    saveData = measure("getSaveData", lambda: root.getSaveData(False))
+    measure("write", write)
+    loadedData = measure("read", read)
+    newRoot = BenchmarkRoot()
+    measure("loadFromSaveData", lambda: newRoot.loadFromSaveData(loadedData, newRoot))
+    return saveData
+
+def benchmark(shape, size, fileName, fileFormat, compression, repeats):
+    root = shapeBuilders[shape](size)
+
+    # Timing: the best of several runs, with the garbage
+    # collector disabled so that it doesn't add noise
+    times = dict((name, None) for name in stageNames)
+    def timeStage(name, fn):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        if times[name] is None or elapsed < times[name]:
+            times[name] = elapsed
+        return result
+    for i in range(repeats):
+        saveData = runStages(root, fileName, fileFormat, compression, timeStage)
+    numEntries = countEntries(saveData)
+    saveData = None
+    fileSize = os.path.getsize(fileName)
+
+    # Memory: a single, separate run with allocations traced
+    peaks = {}
+    def traceStage(name, fn):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = fn()
+            peaks[name] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return result
+    runStages(root, fileName, fileFormat, compression, traceStage)
+
+    return {"entries" : numEntries, "fileSize" : fileSize, "times" : times, "peaks" : peaks}
+
+def formatBytes(numBytes):
+    for unit in ("B", "KB", "MB"):
+        if numBytes < 1024:
+            return "{0:.1f}{1}".format(numBytes, unit)
+        numBytes /= 1024.0
+    return "{0:.1f}GB".format(numBytes)
+
+def printResult(shape, size, result):
+    print("{0} x {1}: {2} entries, file {3}".format(shape, size, result["entries"],
+                                                    formatBytes(result["fileSize"])))
+    for name in stageNames:
+        elapsed = result["times"][name]
+        line = "    {0:<17}{1:>10.2f} ms{2:>14.0f} entries/s".format(name, elapsed * 1000,
+                                                                     result["entries"] / max(elapsed, 1e-9))
+        if name in ("write", "read"):
+            line += "{0:>12}/s".format(formatBytes(result["fileSize"] / max(elapsed, 1e-9)))
+        else:
+            line += " " * 14
+        line += "    peak {0}".format(formatBytes(result["peaks"][name]))
+        print(line)
+
+def printScaling(shape, results):
+    # Compare the time per entry at the largest size against
+    # that at the smallest; a ratio well above one suggests
+    # that a stage scales worse than linearly
+    smallest = results[0]
+    largest = results[-1]
+    if smallest[1]["entries"] == largest[1]["entries"]:
+        return
+    print("{0}: time per entry, {1} vs. {2}".format(shape, largest[0], smallest[0]))
+    for name in stageNames:
+        smallPerEntry = smallest[1]["times"][name] / smallest[1]["entries"]
+        largePerEntry = largest[1]["times"][name] / largest[1]["entries"]
+        ratio = largePerEntry / max(smallPerEntry, 1e-12)
+        flag = ""
+        if ratio > 2:
+            flag = "  <-- non-linear?"
+        print("    {0:<17}{1:>8.2f}x{2}".format(name, ratio, flag))
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Benchmark GameSaver's saving and loading.")
+    parser.add_argument("--shapes", nargs = "+", choices = sorted(shapeBuilders.keys()),
+                        default = ["wide", "deep", "dicts", "strings", "numeric", "special", "objects"],
+                        help = "The shapes of hierarchy to benchmark")
+    parser.add_argument("--sizes", nargs = "+", type = int, default = [1000, 10000, 100000],
+                        help = "The sizes of hierarchy to benchmark, in elements")
+    parser.add_argument("--format", default = GameSaver.FORMAT_TEXT,
+                        choices = [GameSaver.FORMAT_TEXT, GameSaver.FORMAT_BINARY],
+                        help = "The file-format to write and read")
+    parser.add_argument("--compression", default = None,
+                        choices = [GameSaver.COMPRESSION_ZLIB, GameSaver.COMPRESSION_LZMA,
+                                   GameSaver.COMPRESSION_BZ2],
+                        help = "The compression, if any, to apply to the file")
+    parser.add_argument("--repeats", type = int, default = 3,
+                        help = "The number of timed runs of each benchmark; the best is reported")
+    args = parser.parse_args(argv)
+
+    GameSaver.addSpecialType(BenchmarkVector, makeVectorFromSave, getVectorForSave)
+    GameSaver.isSubclass = isSubclass
+
+    sizes = sorted(args.sizes)
+    fileHandle, fileName = tempfile.mkstemp(suffix = ".sav")
+    os.close(fileHandle)
+    try:
+        for shape in args.shapes:
+            results = []
+            for size in sizes:
+                result = benchmark(shape, size, fileName, args.format, args.compression, args.repeats)
+                printResult(shape, size, result)
+                results.append((size, result))
+            printScaling(shape, results)
+            print("")
+    finally:
+        os.remove(fileName)
+        GameSaver.destroy()
+
+if __name__ == "__main__":
+    main()
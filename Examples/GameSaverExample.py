@@ -164,6 +164,9 @@ class Game(DirectObject, SaveableObject):
         
         self.playerAcceleration = 20.0
         self.player = self.makePlayer()
+        
+        # The load under way, if any
+        self.loadJob = None
     
     def setKey(self, key, state):
         self.keys[key] = state
@@ -176,6 +179,10 @@ class Game(DirectObject, SaveableObject):
             dt = task.time - task.lastTime
         task.lastTime = task.time
         
+        if self.loadJob is not None:
+            self.errorText["text"] = "Loading: " + str(int(self.loadJob.getProgress()*100)) + "%"
+            return Task.cont
+        
         if self.player is None:
             return Task.cont
         
@@ -436,17 +443,31 @@ class Game(DirectObject, SaveableObject):
             taskMgr.doMethodLater(4, self.errorText.hide, "hide error", extraArgs=[])
     
     def load(self):
-        # Reactivate the save button in case it was 
+        if self.loadJob is not None:
+            return
+        
+        # The game is loaded a little at a time, so that the window
+        # doesn't freeze while it loads; "loadDone" is called once
+        # it's finished. (The simpler "GameSaver.loadGame", followed by
+        # a call to "loadFromSaveData", would load it all at once.)
+        self.saveButton["state"] = DGG.DISABLED
+        self.loadButton["state"] = DGG.DISABLED
+        self.errorText.show()
+        self.loadJob = GameSaver.loadGameIncremental(SAVE_GAME_FILE, self, self, callback = self.loadDone)
+    
+    def loadDone(self, job):
+        self.loadJob = None
+        # Reactivate the save button, including in case it was
         # deactivated by the player dying
         self.saveButton["state"] = DGG.NORMAL
-        
-        try:
-            result = GameSaver.loadGame(SAVE_GAME_FILE)
-            self.loadFromSaveData(result, self)
-        except IOError:
+        self.loadButton["state"] = DGG.NORMAL
+        self.errorText.hide()
+        if isinstance(job.error, IOError):
             self.errorText.show()
             self.errorText["text"] = "Failed to load game!"
             taskMgr.doMethodLater(4, self.errorText.hide, "hide error", extraArgs=[])
+        elif job.error is not None:
+            raise job.error
     
     ## Methods for the construction of types that are not
     ## simple types, but which do not derive from SaveableObject
@@ -504,6 +525,31 @@ class Game(DirectObject, SaveableObject):
         self.setLevelText()
         self.levelEndText.hide()
     
+    # The same, for loading a little at a time: this is a generator,
+    # the steps of which are run over a number of frames. Each item is
+    # restored in a step of its own, save that the enemies, which take
+    # a moment apiece to load their models, are restored a step apiece.
+    # The values yielded report how much of the game has been loaded.
+    def loadFromSaveDataStream(self, data, world):
+        self.cleanLevel()
+        self.player.destroy()
+        self.player = None
+        
+        items = data.dataList
+        for index, datum in enumerate(items):
+            if datum.loadFn == "loadEnemies":
+                for enemy in self.loadEnemiesStream(datum, world):
+                    yield index/len(items)
+            else:
+                itemData = GameSaveEntry()
+                itemData.dataList.append(datum)
+                SaveableObject.loadFromSaveData(self, itemData, world)
+            yield (index + 1)/len(items)
+        
+        self.setWaveText()
+        self.setLevelText()
+        self.levelEndText.hide()
+    
     def getSaveData(self, forLevelSave):
         # I strongly recommend getting the GameSaveEntry object
         # that you work with from the parent class, even if that's
@@ -557,6 +603,15 @@ class Game(DirectObject, SaveableObject):
                 newObj.scaleHealthRepresentation()
                 self.enemies.append(newObj)
     
+    # The same, for "loadFromSaveDataStream": a generator
+    # that restores the enemies one at a time
+    def loadEnemiesStream(self, data, world):
+        for datum in data.dataList:
+            enemyData = GameSaveEntry()
+            enemyData.dataList.append(datum)
+            self.loadEnemies(enemyData, world)
+            yield
+    
     def loadShots(self, data, world):
         for datum in data.dataList:
             newObj = Shot(0, 0, 0, world, None, (0, 0, 0, 0))
@@ -17,9 +17,28 @@
 ##                                                              ##
 ##################################################################
 
-import types, collections, codecs, builtins
+import types, collections.abc, codecs, builtins, struct, sys, threading, io, gzip, time
+import array, base64, mmap, os, weakref, collections
+import concurrent.futures, concurrent.futures.process, pickle
+
+# NumPy is optional; if it's present, its arrays may be saved in packed form
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# These compression-modules may be absent from some builds of Python
+try:
+    import lzma
+except ImportError:
+    lzma = None
+try:
+    import bz2
+except ImportError:
+    bz2 = None
 
 from direct.stdpy.file import *
+from direct.task import Task
 
 class SpecialTypeEntry(object):
     """A class that holds the callback functions used
@@ -30,6 +49,265 @@ class SpecialTypeEntry(object):
         self.restoreFn = restoreFn
         self.saveFn = saveFn
 
+class SaveField(object):
+    """A class that declares a field of a SaveableObject to be saved
+    and restored automatically. To use it, give the class a tuple of
+    SaveFields named "saveFields"; the fields declared by a class's
+    ancestors are saved along with its own (a field redeclared by a
+    descendant replacing its ancestor's), and before them.
+    
+    Fields are saved by "SaveableObject.getSaveData", so classes that
+    override that method should call it first, as usual. Fields declared
+    with a simple type (int, float, bool, str or bytes) are saved and
+    restored without their type being worked out anew each time."""
+    
+    def __init__(self, name, fieldType = None, loadFn = None, saveFn = None):
+        """Params: name -- The name of the attribute that holds
+                           the field's value
+                   fieldType -- The type of the field's value, if known
+                   loadFn -- The name of a method to call with the restored
+                             value and the "refObj" passed to
+                             "loadFromSaveData", as with any loadFn; if None,
+                             the value is assigned to the attribute
+                   saveFn -- The name of a method, taking no parameters,
+                             that returns the value to save; if None,
+                             the attribute's value is saved"""
+        
+        self.name = name
+        self.fieldType = fieldType
+        self.loadFn = loadFn
+        self.saveFn = saveFn
+
+class ReferenceScope(object):
+    """An internal class that tracks the objects saved or loaded over
+    the course of a single save or load, so that an object reached more
+    than once is described only once, and restored only once."""
+    
+    def __init__(self, forLevelSave = False, refObj = None, rootObj = None):
+        """Params: forLevelSave -- Whether the save in question is intended
+                                   for a level file, as passed on to the
+                                   "getSaveData" methods of saved objects
+                   refObj -- The object passed on to the "loadFromSaveData"
+                             methods of loaded objects
+                   rootObj -- The object being saved or loaded as a whole,
+                              if any; references to it are given the
+                              number GameSaver.ROOT_REFERENCE"""
+        
+        self.forLevelSave = forLevelSave
+        self.refObj = refObj
+        # When saving, each record holds an object (keeping it alive, so
+        # that its id can't be reused by another), the entry that first
+        # described it and the number by which it's referred to, if it
+        # has yet been referred to; if tracking is off, there are none
+        self.savedObjects = None
+        if GameSaver.trackReferences:
+            self.savedObjects = {}
+        self.nextReference = 1
+        # When loading, the objects restored so far, keyed by number
+        self.loadedObjects = {}
+        if rootObj is not None:
+            if self.savedObjects is not None:
+                self.savedObjects[id(rootObj)] = [rootObj, None, GameSaver.ROOT_REFERENCE]
+            self.loadedObjects[GameSaver.ROOT_REFERENCE] = rootObj
+
+class GameSaveEventHandler(object):
+    """A class that receives the contents of a file as a series of
+    events, from "GameSaver.parseGameEvents", without the file's entries
+    being built; tools that only scan files, such as to gather statistics
+    or to find particular entries, may thus handle files of any size in
+    little memory.
+    
+    To use it, subclass it and override those of its methods that
+    are of interest; by default, each does nothing."""
+    
+    def startEntry(self, objType, loadFn, numItems):
+        """Called as an entry begins.
+        
+        Params: objType -- The type of the entry
+                loadFn -- The loadFn of the entry
+                numItems -- The number of items held by the entry
+        
+        Returns: False to skip the entry's contents, in which case no
+                 further events are produced for it, "endEntry" included;
+                 anything else to receive events for its contents"""
+        
+        return True
+    
+    def scalar(self, value, objType, loadFn):
+        """Called for each simple value held by an entry.
+        
+        Params: value -- The value, as text
+                objType -- The type of the entry holding the value
+                loadFn -- The loadFn of the entry holding the value"""
+        
+        pass
+    
+    def endEntry(self, objType, loadFn):
+        """Called as an entry ends, after the events for its contents.
+        
+        Params: objType -- The type of the entry
+                loadFn -- The loadFn of the entry"""
+        
+        pass
+
+class GameSaveProfiler(object):
+    """A class that accumulates the cost of saving and loading,
+    per class-name ("objType") and per loadFn.
+    
+    To use it, assign an instance to "GameSaver.profiler"; while it's
+    set, the describing of data by "GameSaveEntry.addItem", the writing
+    and reading of files, and the restoring of data by
+    "SaveableObject.loadFromSaveData" report to it. While it's None,
+    nothing is measured.
+    
+    For each stage, and each objType and loadFn, a list is kept of the
+    number of entries handled, the time spent on them and the number of
+    bytes (or characters, in the text format) written or read for them.
+    Times and sizes are exclusive: those of nested entries are counted
+    against the nested entries, not against their parents."""
+    
+    """The stages of saving and loading that are measured"""
+    STAGE_SAVE = "save"
+    STAGE_WRITE = "write"
+    STAGE_READ = "read"
+    STAGE_LOAD = "load"
+    
+    def __init__(self, callback = None):
+        """Params: callback -- If not None, a function to be called as
+                               each entry is finished with, being given
+                               the stage, the entry's objType and loadFn,
+                               and the time and bytes spent on it."""
+        
+        self.callback = callback
+        self.reset()
+    
+    def reset(self):
+        """Discard all accumulated measurements."""
+        
+        self.byObjType = {}
+        self.byLoadFn = {}
+        # Each frame holds the stage, the entry, and the
+        # bytes and time counted against it so far
+        self.stack = []
+        self.lastTime = time.perf_counter()
+    
+    def enter(self, stage, entry):
+        """An internal method used to begin counting time and
+        bytes against an entry, pausing the count against the
+        entry being handled before it, if any.
+        
+        Params: stage -- The stage in which the entry is being handled
+                entry -- The GameSaveEntry being handled"""
+        
+        now = time.perf_counter()
+        if len(self.stack) > 0:
+            self.stack[-1][3] += now - self.lastTime
+        self.stack.append([stage, entry, 0, 0.0])
+        self.lastTime = now
+    
+    def leave(self):
+        """An internal method used to finish counting against the
+        current entry, and to resume counting against the entry
+        being handled before it, if any."""
+        
+        now = time.perf_counter()
+        stage, entry, numBytes, elapsed = self.stack.pop()
+        elapsed += now - self.lastTime
+        self.lastTime = now
+        objType = entry.objType
+        loadFn = entry.loadFn
+        for stats, key in ((self.byObjType, objType), (self.byLoadFn, loadFn)):
+            stageStats = stats.get(stage)
+            if stageStats is None:
+                stageStats = stats[stage] = {}
+            record = stageStats.get(key)
+            if record is None:
+                stageStats[key] = [1, elapsed, numBytes]
+            else:
+                record[0] += 1
+                record[1] += elapsed
+                record[2] += numBytes
+        if self.callback is not None:
+            self.callback(stage, objType, loadFn, elapsed, numBytes)
+    
+    def countBytes(self, numBytes):
+        """An internal method used to count bytes against the
+        current entry.
+        
+        Params: numBytes -- The number of bytes to count"""
+        
+        if len(self.stack) > 0:
+            self.stack[-1][2] += numBytes
+    
+    def countingWriter(self, write):
+        """An internal method used to wrap a file object's "write"
+        method such that the data written is counted.
+        
+        Params: write -- The method to wrap"""
+        
+        countBytes = self.countBytes
+        def countingWrite(data):
+            countBytes(len(data))
+            return write(data)
+        return countingWrite
+    
+    def countingReader(self, readline):
+        """An internal method used to wrap a file object's "readline"
+        method such that the data read is counted.
+        
+        Params: readline -- The method to wrap"""
+        
+        countBytes = self.countBytes
+        def countingReadline():
+            line = readline()
+            countBytes(len(line))
+            return line
+        return countingReadline
+    
+    def getStats(self, stage, byLoadFn = False):
+        """Retrieve the measurements for a stage.
+        
+        Params: stage -- One of the "STAGE_" constants
+                byLoadFn -- If True, the measurements are keyed by
+                            loadFn; otherwise they're keyed by objType.
+        
+        Returns: A dictionary mapping each objType or loadFn to a
+                 list of the number of entries, the time spent
+                 and the bytes written or read"""
+        
+        if byLoadFn:
+            return self.byLoadFn.get(stage, {})
+        return self.byObjType.get(stage, {})
+    
+    def getReport(self, byLoadFn = False, limit = None):
+        """Describe the measurements as a table, with each stage's
+        most-costly objTypes or loadFns listed first.
+        
+        Params: byLoadFn -- If True, the measurements are listed by
+                            loadFn; otherwise they're listed by objType.
+                limit -- If not None, the maximum number of rows
+                         to list per stage.
+        
+        Returns: The report, as a string"""
+        
+        if byLoadFn:
+            heading = "loadFn"
+        else:
+            heading = "objType"
+        lines = []
+        for stage in (self.STAGE_SAVE, self.STAGE_WRITE, self.STAGE_READ, self.STAGE_LOAD):
+            stats = self.getStats(stage, byLoadFn)
+            if len(stats) == 0:
+                continue
+            lines.append("{0}: {1:<30} {2:>10} {3:>12} {4:>12}".format(stage, heading, "count", "ms", "bytes"))
+            rows = sorted(stats.items(), key = lambda item: item[1][1], reverse = True)
+            if limit is not None:
+                rows = rows[:limit]
+            for key, (count, elapsed, numBytes) in rows:
+                lines.append("    {0:<30} {1:>10} {2:>12.3f} {3:>12}".format(repr(key), count,
+                                                                            elapsed * 1000, numBytes))
+        return "\n".join(lines)
+
 class SaveableObject(object):
     """The base class for objects that can be saved, aside
     from simple types (int, float, str, etc.) and types
@@ -37,9 +315,14 @@ class SaveableObject(object):
     Classes that should save non-trivial data should
     most likely inherit from this class"""
     
+    """The SaveFields declared by this class, to be
+    saved and restored automatically"""
+    saveFields = ()
+    
     def getSaveData(self, forLevelSave):
         """Retrieve a GameSaveEntry for the given object
-        that holds the data to be saved for that object.
+        that holds the data to be saved for that object,
+        including that of any fields declared via SaveFields.
         
         Params: forLevelSave -- Whether this save data
                                 is intended for a level file, as
@@ -48,8 +331,35 @@ class SaveableObject(object):
         result = GameSaveEntry()
         result.objType = self.__class__.__name__
         
+        schema = GameSaver.saveSchemaCache.get(self.__class__)
+        if schema is None:
+            schema = GameSaver.compileSaveSchema(self.__class__)
+        if len(schema) > 0:
+            GameSaver.addSchemaFields(self, result, schema)
+        
         return result
     
+    def getSaveDataStream(self, forLevelSave):
+        """Produce the data to be saved for the given object piece by
+        piece, for "saveGameStream". This may be overridden to produce
+        the data as it's saved, rather than holding it all at once, such
+        as by a generator over the object's data.
+        
+        Each item produced should be a tuple of a loadFn and an object,
+        as would be passed to "GameSaveEntry.addItem", or a GameSaveEntry
+        already filled in. Objects that are themselves SaveableObjects
+        overriding this method are saved piece by piece in turn, as are
+        generators, which are saved as lists.
+        
+        By default, the entries produced are those held by the
+        result of "getSaveData".
+        
+        Params: forLevelSave -- Whether this save data
+                                is intended for a level file, as
+                                opposed to a save of an active game."""
+        
+        return self.getSaveData(forLevelSave).peekDataList()
+    
     def loadFromSaveData(self, data, refObj):
         """Restore the object from the given data
         
@@ -60,113 +370,214 @@ class SaveableObject(object):
                         
         if data is None:
             return
-        for datum in data.dataList:
-            newVal = datum.dataList
-            newVal = self.reconstructObject(newVal, datum.objType)
-            if datum.loadFn.rstrip().endswith("="):
-                setattr(self, datum.loadFn.rstrip()[:-1].rstrip(), newVal)
-            else:
-                getattr(self, datum.loadFn)(newVal, refObj)
+        profiler = GameSaver.profiler
+        # How each loadFn applies to this class is worked out once,
+        # and then cached
+        GameSaver.getLoadDispatchCache()
+        plans = GameSaver.loadPlanCache.get(self.__class__)
+        if plans is None:
+            plans = GameSaver.loadPlanCache.setdefault(self.__class__, {})
+        loadByAssignment = GameSaver.LOAD_BY_ASSIGNMENT
+        # Objects shared between the data of this object and those
+        # loaded within it are restored once, and shared again
+        scope = None
+        if GameSaver.isReferenceScopeNeeded():
+            scope = GameSaver.enterReferenceScope(refObj = refObj, rootObj = self)
+        try:
+            for datum in data.peekDataList():
+                if profiler is not None:
+                    profiler.enter(profiler.STAGE_LOAD, datum)
+                plan = plans.get(datum.loadFn)
+                if plan is None:
+                    plan = GameSaver.compileLoadPlan(self.__class__, datum.loadFn)
+                    plans[datum.loadFn] = plan
+                newVal = datum._dataList
+                if newVal is None:
+                    newVal = datum.peekDataList()
+                # Fields declared with a simple type are
+                # restored directly, if they were saved as such
+                if plan[2] is not None and datum.objType == plan[2]:
+                    newVal = plan[3](newVal)
+                else:
+                    newVal = self.reconstructObject(newVal, datum.objType)
+                if plan[0] == loadByAssignment:
+                    setattr(self, plan[1], newVal)
+                else:
+                    result = getattr(self, plan[1])(newVal, refObj)
+                    # Functions written as generators, to be run a
+                    # step at a time by "loadFromSaveDataStream",
+                    # are run to completion
+                    if type(result) is types.GeneratorType:
+                        for step in result:
+                            pass
+                if profiler is not None:
+                    profiler.leave()
+        finally:
+            GameSaver.leaveReferenceScope(scope)
+    
+    def loadFromSaveDataStream(self, data, refObj):
+        """Restore the object from the given data a step at a time, for
+        "loadGameIncremental", as a generator that yields between steps.
+        This may be overridden alongside "loadFromSaveData" to do further
+        work before or after the data is restored, such as by a generator
+        that yields from this one.
+        
+        By default, a step is taken for each item of the data, as by
+        "loadFromSaveData". A function named by a loadFn may itself be a
+        generator, such as one that restores a list of objects and yields
+        after each; it's then run a step at a time too. (When restored by
+        "loadFromSaveData", such functions are run to completion at once.)
+        
+        The values yielded are the fraction of the object's data restored
+        so far, for reporting the progress of the load; None may be
+        yielded where the fraction isn't known.
+        
+        Params: data -- The save data for this object
+                refObj -- An object to be passed on to
+                          the object in the case of
+                          a callback having been specified"""
+        
+        if data is None:
+            return
+        profiler = GameSaver.profiler
+        GameSaver.getLoadDispatchCache()
+        plans = GameSaver.loadPlanCache.get(self.__class__)
+        if plans is None:
+            plans = GameSaver.loadPlanCache.setdefault(self.__class__, {})
+        items = data.peekDataList()
+        numItems = len(items)
+        for index, datum in enumerate(items):
+            # Objects shared between items are tracked by the job running
+            # the load, which resumes its ReferenceScope around each step;
+            # otherwise, those shared within an item are tracked
+            scope = None
+            if GameSaver.isReferenceScopeNeeded():
+                scope = GameSaver.enterReferenceScope(refObj = refObj, rootObj = self)
+            try:
+                if profiler is not None:
+                    profiler.enter(profiler.STAGE_LOAD, datum)
+                plan = plans.get(datum.loadFn)
+                if plan is None:
+                    plan = GameSaver.compileLoadPlan(self.__class__, datum.loadFn)
+                    plans[datum.loadFn] = plan
+                newVal = datum.peekDataList()
+                if plan[2] is not None and datum.objType == plan[2]:
+                    newVal = plan[3](newVal)
+                else:
+                    newVal = self.reconstructObject(newVal, datum.objType)
+                result = None
+                if plan[0] == GameSaver.LOAD_BY_ASSIGNMENT:
+                    setattr(self, plan[1], newVal)
+                else:
+                    result = getattr(self, plan[1])(newVal, refObj)
+                if profiler is not None:
+                    profiler.leave()
+            finally:
+                GameSaver.leaveReferenceScope(scope)
+            if type(result) is types.GeneratorType:
+                try:
+                    for step in result:
+                        yield index / numItems
+                finally:
+                    result.close()
+            yield (index + 1) / numItems
     
     def reconstructObject(self, newVal, objType):
         """An internal method used to actually construct the
         desired object.
         
+        Nested lists, tuples and dictionaries are rebuilt via an
+        explicit stack, rather than via recursion, so that deeply-nested
+        data can't exceed Python's recursion limit. (Saveable objects
+        held within the data are restored via their "loadFromSaveData"
+        methods, and so by recursion.)
+        
         Params: newVal -- Data describing the object
                 objType -- The class of the object"""
-                
-        notFoundInSpecialTypes = True
-        i = 0
-        keys = list(GameSaver.specialTypeDictionary.keys())
-        while i < len(keys) and notFoundInSpecialTypes:
-            if GameSaver.isSubclass(objType, keys[i]):
-                if len(newVal) == 1:
-                    newVal = newVal[0]
-                typeEntry = GameSaver.specialTypeDictionary[keys[i]]
-                newVal = typeEntry.restoreFn(newVal)
-                notFoundInSpecialTypes = False
-            i += 1
-        if notFoundInSpecialTypes:
-            if objType == list.__name__:
-                newVal = self.reconstructList(newVal)
-            elif objType == tuple.__name__:
-                newVal = self.reconstructTuple(newVal)
-            elif objType == dict.__name__:
-                newVal = self.reconstructDictionary(newVal)
-            else:
-                if len(newVal) == 1:
-                    newVal = newVal[0]
-                if objType == bool.__name__:
-                    if isinstance(newVal, str):
-                        newVal = newVal.lower()
-                        if newVal == "true" or newVal == "1":
-                            newVal = True
-                        else:
-                            newVal = False
-                    newVal = bool(newVal)
-                elif objType == type(None).__name__ or objType == "None":
-                    newVal = None
-                elif objType == GameSaveEntry.__name__:
-                    retVal = GameSaveEntry()
-                    retVal.objType = objType
-                    if isinstance(newVal, list):
-                        retVal.dataList = newVal
+        
+        cache = GameSaver.getLoadDispatchCache()
+        handler = cache.get(objType)
+        if handler is None:
+            handler = GameSaver.resolveLoadHandler(objType)
+        if handler[0] is None:
+            return handler[1](newVal)
+        
+        scope = None
+        if GameSaver.isReferenceScopeNeeded():
+            scope = GameSaver.enterReferenceScope()
+        try:
+            # Each frame holds the type of a container, an iterator over
+            # the descriptions of its elements, the elements rebuilt so
+            # far, and the dictionary to fill in, for dictionaries, or
+            # the number by which a tuple is referred to, for tuples
+            stack = []
+            newVal = GameSaver.beginReconstruction(handler, newVal, stack)
+            while len(stack) > 0:
+                frameType, elements, results, target = stack[-1]
+                for element in elements:
+                    handler = cache.get(element.objType)
+                    if handler is None:
+                        handler = GameSaver.resolveLoadHandler(element.objType)
+                    elementData = element._dataList
+                    if elementData is None:
+                        elementData = element.peekDataList()
+                    containerType = handler[0]
+                    if containerType is None:
+                        results.append(handler[1](elementData))
+                    elif containerType is list:
+                        stack.append((list, iter(elementData), [], None))
+                        break
+                    elif containerType is tuple:
+                        stack.append((tuple, iter(elementData), [], None))
+                        break
+                    elif containerType is dict:
+                        stack.append((dict, iter(elementData), [], {}))
+                        break
                     else:
-                        retVal.dataList = [newVal]
-                    newVal = retVal
-                elif objType == str.__name__:
-                    newVal = bytes(newVal, "utf-8").decode("utf-8")
-                elif objType == bytes.__name__:
-                    newVal = codecs.escape_decode(newVal)[0]
-                elif objType == int.__name__:
-                    newVal = int(newVal)
-                elif objType == float.__name__:
-                    newVal = float(newVal)
+                        depth = len(stack)
+                        elementVal = GameSaver.beginReconstruction(handler, elementData, stack)
+                        if len(stack) > depth:
+                            break
+                        results.append(elementVal)
                 else:
-                    if objType == types.FunctionType.__name__ or \
-                       objType == types.MethodType.__name__:
-                        raise IOError("Loading: GameSaver cannot save methods or functions; the method or function in question is:", newVal)
+                    stack.pop()
+                    if frameType is list:
+                        newVal = results
+                    elif frameType is tuple:
+                        newVal = tuple(results)
+                        if target is not None:
+                            GameSaver.getReferenceScope().loadedObjects[target] = newVal
                     else:
-                        raise IOError("Loading: Attempt to construct unrecognised class! Class-name:", objType)
-        return newVal
+                        newVal = target
+                        for pair in results:
+                            newVal[pair[0]] = pair[1]
+                    if len(stack) > 0:
+                        stack[-1][2].append(newVal)
+            return newVal
+        finally:
+            GameSaver.leaveReferenceScope(scope)
+    
     
     def reconstructList(self, listData):
         """An internal method used to reconstruct a list.
         
         Params: listData -- The data for the list"""
         
-        result = []
-        
-        for element in listData:
-            result.append(self.reconstructObject(element.dataList, element.objType))
-        
-        return result
+        return self.reconstructObject(listData, list.__name__)
     
     def reconstructTuple(self, listData):
         """An internal method used to reconstruct a tuple.
         
         Params: listData -- The data for the tuple"""
         
-        temp = []
-        
-        for element in listData:
-            temp.append(self.reconstructObject(element.dataList, element.objType))
-
-        result = tuple((val for val in temp))
-        return result
+        return self.reconstructObject(listData, tuple.__name__)
     
     def reconstructDictionary(self, listData):
         """An internal method used to reconstruct a dictionary.
         
         Params: listData -- The data for the dictionary"""
         
-        result = {}
-        
-        for element in listData:
-            tuple = self.reconstructObject(element.dataList, element.objType)
-            result[tuple[0]] = tuple[1]
-        
-        return result
+        return self.reconstructObject(listData, dict.__name__)
 
 class SaveableWrapper(SaveableObject):
     """ A convenience class used to save simple non-SaveableObject objects,
@@ -196,14 +607,61 @@ class SaveableWrapper(SaveableObject):
         return result
 
 class GameSaveEntry(object):
-    """A class that holds a description of a given object to be saved or restored."""
+    """A class that holds a description of a given object to be saved or restored.
+    
+    To keep large trees of entries compact, entries have no per-instance
+    dictionary, and an entry that holds a single simple value stores that
+    value directly, only making a list of it if "dataList" is accessed."""
+
+    __slots__ = ("objType", "loadFn", "_dataList", "_value")
 
     repr_counter = 0
     
     def __init__(self):
         self.objType = self.__class__.__name__
         self.loadFn = None
-        self.dataList = []
+        self._dataList = []
+        self._value = None
+    
+    def getDataList(self):
+        """Get the list of data held by this entry.
+        
+        Returns: The list of data"""
+        
+        if self._dataList is None:
+            self._dataList = [self._value]
+            self._value = None
+        return self._dataList
+    
+    def setDataList(self, dataList):
+        """Set the list of data held by this entry.
+        
+        Params: dataList -- The new list of data"""
+        
+        self._dataList = dataList
+        self._value = None
+    
+    dataList = property(getDataList, setDataList)
+    
+    def setValue(self, value):
+        """An internal method used to make this entry
+        hold just the given simple value.
+        
+        Params: value -- The value to hold"""
+        
+        self._dataList = None
+        self._value = value
+    
+    def peekDataList(self):
+        """An internal method used to get the data held by this
+        entry without making a list of a single simple value.
+        The result should not be modified.
+        
+        Returns: A list or tuple of the data"""
+        
+        if self._dataList is None:
+            return (self._value,)
+        return self._dataList
     
     def addItem(self, loadFn, obj, index = None):
         """Add a piece of data to the object's description.
@@ -212,54 +670,171 @@ class GameSaveEntry(object):
                           to its object. For simple types, an assignment
                           statement is allowed, excluding the "self" prefix.
                           Otherwise, give the name of a method to be called.
-                obj -- The data to be saved."""
+                obj -- The data to be saved.
+        
+        Note: If GameSaver.trackReferences is set to True, a list,
+              dictionary, array or SaveableObject reached more than once,
+              whether within this item or within others saved along with it
+              (by "saveGame" and its kin), is described only once, and
+              referred back to thereafter; cyclic data may thus be saved.
+              The references are then resolved in the order in which the
+              data was saved, and so the data should be restored as a
+              whole, and in that order."""
                 
+        profiler = GameSaver.profiler
+        scope = GameSaver.getReferenceScope()
+        ownScope = None
+        if scope is None and GameSaver.trackReferences:
+            ownScope = scope = GameSaver.enterReferenceScope()
         newEntry = GameSaveEntry()
-        newEntry.objType = obj.__class__.__name__
         newEntry.loadFn = loadFn
-        # These next two could probably be handled via map and a lambda,
-        # but that seems to me to be less readable than the for-loops below,
-        # and if not constructed carefully seems to potentially lead to
-        # infinite loops...
-        if isinstance(obj, dict):
-            for pair in list(obj.items()):
-                newEntry.addItem("", pair)
-        # I'm excluding "str" here because we write our data as strings,
-        # and a str is, naturally, already a string, making it seem wasteful
-        # to individually add each character; additionally, there is some
-        # logic that is specfic to str -- see the final "else" below.
-        elif isinstance(obj, collections.Iterable) and not isinstance(obj, str) and not isinstance(obj, bytes):
-            for item in obj:
-                newEntry.addItem("", item)
-        elif callable(obj):
-            newEntry.dataList.append(obj.__name__)
-        elif isinstance(obj, GameSaveEntry):
-            newEntry.dataList += obj.dataList
-            newEntry.objType = obj.objType
-        else:
-            if isinstance(obj, str):
-                #obj = obj.replace("\n", "\\n")
-                obj = obj.encode("unicode_escape")
-                newEntry.dataList.append(obj)
-            elif isinstance(obj, bytes):
-                convertedVal = codecs.escape_encode(obj)[0]
-                newEntry.dataList.append(convertedVal)
-            else:
-                notFoundSpecialType = True
-                i = 0
-                keys = list(GameSaver.specialTypeDictionary.keys())
-                while i < len(keys) and notFoundSpecialType:
-                    if isinstance(obj, keys[i]):
-                        notFoundSpecialType = False
-                        newEntry.addItem("", GameSaver.specialTypeDictionary[keys[i]].saveFn(obj))
-                    i += 1
-                if notFoundSpecialType:
-                    newEntry.dataList.append(str(obj))
+        try:
+            if profiler is not None:
+                profiler.enter(profiler.STAGE_SAVE, newEntry)
+            elements = newEntry.describeObject(obj, True, scope)
+            # The elements of nested data are described via an explicit
+            # stack of data-lists and iterators over their elements, rather
+            # than via recursion, so that deeply-nested data can't exceed
+            # Python's recursion limit. (The lists are held rather than
+            # their entries, as an entry may be marked as shared, moving
+            # its list into a new entry, while its elements are described.)
+            # Each frame also notes whether arrays may be packed and objects
+            # shared: the representations returned by special types'
+            # save-functions are left as they are, as their restore-functions
+            # expect to find one entry per element.
+            if elements is not None:
+                stack = [(newEntry._dataList, elements,
+                          GameSaver.saveDispatchCache[obj.__class__][0] != GameSaver.SAVE_AS_SPECIAL_TYPE)]
+                while len(stack) > 0:
+                    dataList, elements, packArrays = stack[-1]
+                    for element in elements:
+                        elementEntry = GameSaveEntry()
+                        elementEntry.loadFn = ""
+                        dataList.append(elementEntry)
+                        if profiler is not None:
+                            profiler.enter(profiler.STAGE_SAVE, elementEntry)
+                        subElements = elementEntry.describeObject(element, packArrays, scope)
+                        if subElements is not None:
+                            stack.append((elementEntry._dataList, subElements, packArrays and
+                                          GameSaver.saveDispatchCache[element.__class__][0] != GameSaver.SAVE_AS_SPECIAL_TYPE))
+                            break
+                        if profiler is not None:
+                            profiler.leave()
+                    else:
+                        stack.pop()
+                        if profiler is not None and len(stack) > 0:
+                            profiler.leave()
+            if profiler is not None:
+                profiler.leave()
+        finally:
+            GameSaver.leaveReferenceScope(ownScope)
         if index is None:
             self.dataList.append(newEntry)
         else:
             self.dataList.insert(index, newEntry)
     
+    def describeObject(self, obj, packArrays = True, scope = None):
+        """An internal method used to fill in this entry's description
+        of the given object.
+        
+        Params: obj -- The data to be described.
+                packArrays -- Whether numeric arrays may be described in
+                              packed form, and objects already described
+                              referred back to.
+                scope -- The ReferenceScope of the save, if any.
+        
+        Returns: An iterator over the elements of the object that
+                 should be described in entries of their own, or
+                 None if the object has no such elements."""
+        
+        self.objType = obj.__class__.__name__
+        handler = GameSaver.saveDispatchCache.get(obj.__class__)
+        if handler is None:
+            handler = GameSaver.resolveSaveHandler(obj)
+        kind = handler[0]
+        if handler[2] and scope is not None and packArrays and scope.savedObjects is not None:
+            record = scope.savedObjects.get(id(obj))
+            if record is not None:
+                if record[2] is None:
+                    record[2] = str(scope.nextReference)
+                    scope.nextReference += 1
+                    record[1].markShared(record[2])
+                self.objType = GameSaver.REFERENCE_TYPE
+                self._dataList = None
+                self._value = record[2]
+                return None
+            scope.savedObjects[id(obj)] = [obj, self, None]
+        if kind == GameSaver.SAVE_AS_TEXT:
+            self._dataList = None
+            self._value = str(obj)
+        elif kind == GameSaver.SAVE_AS_STRING:
+            #obj = obj.replace("\n", "\\n")
+            self._dataList = None
+            self._value = obj.encode("unicode_escape")
+        elif kind == GameSaver.SAVE_AS_ITERABLE:
+            return iter(obj)
+        elif kind == GameSaver.SAVE_AS_ARRAY:
+            # Long enough sequences of numbers of a single type are
+            # packed into a single entry, rather than given an entry
+            # per element; anything else is described as usual
+            if packArrays and ((obj.__class__ is not list and obj.__class__ is not tuple) or
+                               len(obj) >= GameSaver.packedArrayThreshold):
+                packedData = GameSaver.packArray(obj)
+                if packedData is not None:
+                    self.objType = GameSaver.PACKED_ARRAY_TYPE
+                    self._dataList = packedData
+                    return None
+            return iter(obj)
+        elif kind == GameSaver.SAVE_AS_DICT:
+            return iter(list(obj.items()))
+        elif kind == GameSaver.SAVE_AS_SPECIAL_TYPE:
+            return iter((handler[1].saveFn(obj),))
+        elif kind == GameSaver.SAVE_AS_BYTES:
+            self._dataList = None
+            self._value = codecs.escape_encode(obj)[0]
+        elif kind == GameSaver.SAVE_AS_ENTRY:
+            self._dataList = list(obj.peekDataList())
+            self.objType = obj.objType
+        elif kind == GameSaver.SAVE_AS_OBJECT:
+            # Unless shared objects are tracked, only instances of
+            # registered classes may be restored from their data,
+            # and so others are saved as text, as anything else is
+            if not GameSaver.trackReferences and obj.__class__.__name__ not in GameSaver.saveableClassDictionary:
+                self._dataList = None
+                self._value = str(obj)
+                return None
+            forLevelSave = False
+            if scope is not None:
+                forLevelSave = scope.forLevelSave
+            data = obj.getSaveData(forLevelSave)
+            # If the object's data refers back to the object,
+            # this entry will have been marked as shared by now
+            target = self
+            if self.objType == GameSaver.SHARED_TYPE:
+                target = self._dataList[1]
+            target.objType = data.objType
+            target._dataList = list(data.peekDataList())
+        else:
+            self._dataList = None
+            self._value = obj.__name__
+        return None
+    
+    def markShared(self, reference):
+        """An internal method used to mark this entry as describing
+        an object that's referred to elsewhere, moving its description
+        into a new entry held by this one.
+        
+        Params: reference -- The number by which the object is referred to"""
+        
+        description = GameSaveEntry()
+        description.objType = self.objType
+        description.loadFn = ""
+        description._dataList = self._dataList
+        description._value = self._value
+        self.objType = GameSaver.SHARED_TYPE
+        self._dataList = [reference, description]
+        self._value = None
+    
     def __repr__(self):
         """A convenience method allowing for formatted printing of GameSaveEntries"""
         
@@ -268,165 +843,4954 @@ class GameSaveEntry(object):
         for i in range(GameSaveEntry.repr_counter*2):
             result += " "
         result += "Game Save Entry: " + str(self.objType) + " " + str(self.loadFn) + "\n"
-        for datum in self.dataList:
+        for datum in self.peekDataList():
             for i in range(GameSaveEntry.repr_counter*2):
                 result += " "
             result += str(datum) + "\n"
         GameSaveEntry.repr_counter -= 1
         return result
 
-class GameSaver(object):
-    """The core class of the module.
-    GameSaver's methods are static; the class is not intended to be instantiated"""
+class LazyGameSaveEntry(GameSaveEntry):
+    """A GameSaveEntry, produced by loading a file lazily, whose
+    data is only read from the file's contents when first accessed.
+    
+    Until then, the entry holds only its type and loadFn, and the
+    position of its data within the file's contents."""
+    
+    __slots__ = ("_source", "_offset", "_numItems")
+    
+    def __init__(self, source, objType, loadFn, offset, numItems):
+        self.objType = objType
+        self.loadFn = loadFn
+        self._dataList = None
+        self._value = None
+        self._source = source
+        self._offset = offset
+        self._numItems = numItems
+    
+    def expand(self):
+        """An internal method used to read this entry's data, if
+        that hasn't already been done. Any entries held by this entry
+        are themselves lazy, and have yet to be read."""
+        
+        if self._source is not None:
+            self._dataList = self._source.readItems(self._offset, self._numItems)
+            self._source = None
+    
+    def getDataList(self):
+        self.expand()
+        return GameSaveEntry.getDataList(self)
+    
+    def setDataList(self, dataList):
+        self._source = None
+        GameSaveEntry.setDataList(self, dataList)
+    
+    dataList = property(getDataList, setDataList)
+    
+    def setValue(self, value):
+        self._source = None
+        GameSaveEntry.setValue(self, value)
+    
+    def peekDataList(self):
+        self.expand()
+        return GameSaveEntry.peekDataList(self)
+    
+    def __reduce__(self):
+        """Lazy entries are pickled (as by parallel saves) as ordinary
+        GameSaveEntries, as their file's contents can't be pickled"""
+        
+        self.expand()
+        return (GameSaver.restorePickledEntry, (self.objType, self.loadFn, self._dataList, self._value))
 
-    ENTRY_MARKER = "ENTRY"
+class CachedGameSaveEntry(GameSaveEntry):
+    """A GameSaveEntry, produced by "GameSaver.loadGameCached", that
+    presents an entry of a cached tree without copying the tree up front.
     
-    """Classes that are not simple types (int, float, str, etc.), but which
-    are also not descendants of SaveableObject, are stored in this dictionary;
-    they may be registered by calling "addSpecialType"."""
-    specialTypeDictionary = {}
+    The cached tree is never modified. Instead, the first time that the
+    data of a view is accessed, the view makes its own list of that data,
+    in which the entries held by the cached entry are presented by views
+    in turn; changes made to the view thus stay with the view. Only the
+    parts of the tree actually accessed are copied, a level at a time."""
     
-    """A function callback used to check the inheritance of a class;
-    the callback is used to allow for the checking of classes that
-    GameSaver doesn't know about, such as custom game classes."""
-    isSubclass = None
+    __slots__ = ("_shared",)
     
-    def __init__(self):
-        raise RuntimeError("GameSaver is a static class; it is not intended to be instantiated!")
+    def __init__(self, shared):
+        """Params: shared -- The cached GameSaveEntry to present"""
+        
+        self.objType = shared.objType
+        self.loadFn = shared.loadFn
+        self._dataList = None
+        self._value = None
+        self._shared = None
+        if shared._dataList is None:
+            self._value = shared._value
+        else:
+            self._shared = shared
     
-    @staticmethod
-    def addSpecialType(type, restoreFn, saveFn):
-        """Register a special type
+    def expand(self):
+        """An internal method used to make this view's own list
+        of data, if that hasn't already been done."""
         
-        Params: restoreFn -- The function to call to restore an object
-                saveFn -- The function to call to get a saveable
-                          representation of an object"""
-                        
-        GameSaver.specialTypeDictionary[type] = SpecialTypeEntry(restoreFn, saveFn)
+        shared = self._shared
+        if shared is not None:
+            dataList = []
+            for datum in shared._dataList:
+                if isinstance(datum, GameSaveEntry):
+                    datum = CachedGameSaveEntry(datum)
+                dataList.append(datum)
+            self._dataList = dataList
+            self._shared = None
     
-    @staticmethod
-    def writeLine(line, fileObj):
-        """Write a newline-terminated line of text to a file.
+    def getDataList(self):
+        self.expand()
+        return GameSaveEntry.getDataList(self)
+    
+    def setDataList(self, dataList):
+        self._shared = None
+        GameSaveEntry.setDataList(self, dataList)
+    
+    dataList = property(getDataList, setDataList)
+    
+    def setValue(self, value):
+        self._shared = None
+        GameSaveEntry.setValue(self, value)
+    
+    def peekDataList(self):
+        self.expand()
+        return GameSaveEntry.peekDataList(self)
+    
+    def __reduce__(self):
+        """Views are pickled (as by parallel saves) as ordinary
+        GameSaveEntries, as the cached tree isn't theirs to share"""
         
-        Params: line -- The text to write
-                fileObj -- The file object to write to"""
-                
-        if not isinstance(line, str):
-            if isinstance(line, bytes):
-                try:
-                    line = line.decode("utf-8")
-                except UnicodeDecodeError:
-                    line = str(line)
-            else:
-                line = str(line)
-        if not line.endswith("\n"):
-            line += "\n"
-        fileObj.write(line)
+        self.expand()
+        return (GameSaver.restorePickledEntry, (self.objType, self.loadFn, self._dataList, self._value))
+
+class BufferedLineReader(object):
+    """An internal class that reads a text-mode file in large blocks,
+    splitting each into lines in memory, so that reading the file
+    line-by-line doesn't call upon the file object for every line.
+    Like a file object, it provides "readline", which returns an
+    empty string once the file has been exhausted."""
     
-    @staticmethod
-    def readLine(fileObj):
-        """Read a newline-terminated line of text from a file.
+    def __init__(self, fileObj, blockSize = None):
+        """Params: fileObj -- The text-mode file object to read from
+                   blockSize -- The number of characters to read at a
+                                time; if None, GameSaver.READ_BLOCK_SIZE
+                                is used."""
         
-        Params: fileObj -- The file object to read from
+        if blockSize is None:
+            blockSize = GameSaver.READ_BLOCK_SIZE
+        self.fileObj = fileObj
+        self.blockSize = blockSize
+        # A generator's "__next__" is much quicker to call than
+        # a method that would have to track its place in a block
+        self.readline = self.iterLines().__next__
+    
+    def iterLines(self):
+        """An internal method used to produce the lines of the file,
+        newlines included, followed by empty strings once the file
+        has been exhausted."""
         
-        Returns: The line of text read, sans final newline, if any"""
+        read = self.fileObj.read
+        remainder = ""
+        while True:
+            block = read(self.blockSize)
+            if not block:
+                break
+            # A line left incomplete at the end of the
+            # block is carried over to the next block
+            end = block.rfind("\n") + 1
+            if end == 0:
+                remainder += block
+                continue
+            lines = io.StringIO(remainder + block[:end], newline = "\n")
+            remainder = block[end:]
+            yield from lines
+        if len(remainder) > 0:
+            yield remainder
+        while True:
+            yield ""
+
+class BufferedByteReader(object):
+    """An internal class that reads a binary-mode file in blocks,
+    holding only as much of the file as is needed to decode the
+    record at hand, so that a file of any size may be decoded
+    piece by piece."""
     
-        result = fileObj.readline()
-        if result.endswith("\n"):
-            result = result[0:len(result)-1]
-        return result
+    def __init__(self, fileObj, blockSize = None, canSeek = False):
+        """Params: fileObj -- The binary-mode file object to read from
+                   blockSize -- The number of bytes to read at a time;
+                                if None, GameSaver.READ_BLOCK_SIZE
+                                is used.
+                   canSeek -- Whether bytes may be skipped by seeking
+                              within the file, rather than by reading
+                              and discarding them."""
+        
+        if blockSize is None:
+            blockSize = GameSaver.READ_BLOCK_SIZE
+        self.fileObj = fileObj
+        self.blockSize = blockSize
+        self.canSeek = canSeek
+        self.data = b""
+        self.pos = 0
+        # The number of bytes read before "data" began
+        self.offset = 0
     
-    @staticmethod
-    def writeEntry(obj, fileObj):
-        """Write a GameSaveEntry to file.
+    def tell(self):
+        """Returns: The number of bytes read or skipped so far"""
         
-        Params: obj -- The GameSaveEntry to write.
-                fileObj -- The file object to write to."""
+        return self.offset + self.pos
     
-        GameSaver.writeLine(obj.objType, fileObj)
-        GameSaver.writeLine(obj.loadFn, fileObj)
-        GameSaver.writeLine(len(obj.dataList), fileObj)
-        for datum in obj.dataList:
-            if isinstance(datum, GameSaveEntry):
-                GameSaver.writeLine(GameSaver.ENTRY_MARKER, fileObj)
-                GameSaver.writeEntry(datum, fileObj)
-            else:
-                GameSaver.writeLine(datum, fileObj)
+    def fill(self, count):
+        """Read enough of the file to hold the given number of bytes
+        beyond the current position, or as many as remain in the file.
+        
+        Params: count -- The number of bytes wanted
+        
+        Returns: A tuple of the bytes held and the current position in them"""
+        
+        available = len(self.data) - self.pos
+        if available < count:
+            pieces = [self.data[self.pos:]]
+            wanted = max(count - available, self.blockSize)
+            while wanted > 0:
+                block = self.fileObj.read(wanted)
+                if not block:
+                    break
+                pieces.append(block)
+                wanted -= len(block)
+            self.offset += self.pos
+            self.data = b"".join(pieces)
+            self.pos = 0
+        return self.data, self.pos
     
-    @staticmethod
-    def readEntry(fileObj):
-        """Read a GameSaveEntry from file.
+    def decode(self, parseFn, *args):
+        """Decode a record from the file via one of GameSaver's "parse"
+        methods, reading more of the file until the record is held whole.
         
-        Note: This method is recursive; if a GameSaveEntry's
-              representation indicates that it contains
-              another GameSaveEntry, the method should call itself
-              for that new entry and include it within the return
-              value.
-            
-        Params: fileObj -- The file object to read from.
+        Params: parseFn -- A function taking the bytes, the position
+                           of the record and any further arguments given,
+                           and returning a tuple whose last element is the
+                           position just after the record
+                args -- Any further arguments for the function
         
-        Returns: A GameSaveEntry with whatever data was read."""
+        Returns: The tuple returned by the function, sans its last element"""
+        
+        count = 16
+        while True:
+            data, pos = self.fill(count)
+            try:
+                result = parseFn(data, pos, *args)
+                if result[-1] <= len(data):
+                    self.pos = result[-1]
+                    return result[:-1]
+            except (IndexError, struct.error):
+                pass
+            if len(data) - pos < count:
+                raise IOError("Loading: Malformed binary data; unexpected end of file at position", self.tell())
+            count *= 2
     
-        result = GameSaveEntry()
-        type = GameSaver.readLine(fileObj)
-        loadFn = GameSaver.readLine(fileObj)
-        result.objType = type
-        result.loadFn = loadFn
-        numItems = int(GameSaver.readLine(fileObj))
-        for i in range(numItems):
-            input = GameSaver.readLine(fileObj)
-            if input == GameSaver.ENTRY_MARKER:
-                input = GameSaver.readEntry(fileObj)
-            result.dataList.append(input)
-        return result
+    def skip(self, count):
+        """Skip over a number of bytes without decoding them.
+        
+        Params: count -- The number of bytes to skip"""
+        
+        available = len(self.data) - self.pos
+        if count <= available:
+            self.pos += count
+            return
+        count -= available
+        self.offset += len(self.data)
+        self.data = b""
+        self.pos = 0
+        if self.canSeek:
+            self.fileObj.seek(count, 1)
+            self.offset += count
+            return
+        while count > 0:
+            block = self.fileObj.read(min(count, self.blockSize))
+            if not block:
+                raise IOError("Loading: Malformed binary data; unexpected end of file at position", self.offset)
+            count -= len(block)
+            self.offset += len(block)
+
+class LazyLoadSource(object):
+    """An internal class that holds the contents of a file being loaded
+    lazily, and reads entries from those contents on demand. Entries that
+    are never accessed are skipped over without being read."""
     
-    @staticmethod
-    def saveGame(baseObjToSave, fileName, forLevelSave):
-        """Save an object to file.
+    def __init__(self, data, fileFormat, start = 0):
+        """Params: data -- The contents of the file: bytes, or an
+                           mmap object mapping the file
+                   fileFormat -- The format of the file; one of
+                                 GameSaver.FORMAT_TEXT and
+                                 GameSaver.FORMAT_BINARY
+                   start -- The position in the data just after
+                            the file's header, if any"""
         
-        Params: baseObjToSave -- The object to be saved.
-                fileName -- The name of the file to write to.
-                forLevelSave -- Whether this save data
-                                is intended for a level file, as
-                                opposed to a save of an active game."""
+        self.data = data
+        self.fileFormat = fileFormat
+        self.start = start
+        self.symbols = None
+        # In the text format, the position just after the data of each
+        # entry that has been skipped over, keyed by the position of its
+        # first item, so that no entry is scanned more than once
+        self.textEnds = {}
+        if fileFormat == GameSaver.FORMAT_BINARY:
+            self.symbols, self.start = GameSaver.parseBinarySymbols(data, start)
+        self.entryMarker = GameSaver.ENTRY_MARKER.encode("utf-8")
+        # Text files written on some systems end their lines with "\r\n"
+        self.entryMarkerLine = self.entryMarker + b"\n"
+        if fileFormat == GameSaver.FORMAT_TEXT:
+            end = data.find(b"\n", start)
+            if end > 0 and data[end - 1:end] == b"\r":
+                self.entryMarkerLine = self.entryMarker + b"\r\n"
+            # The file's metadata, if it has any, is skipped
+            metadataMarker = GameSaver.METADATA_MARKER.encode("utf-8")
+            if data[start:start + len(metadataMarker)] == metadataMarker:
+                line, pos = self.readTextLine(start)
+                objType, loadFn, numItems, pos = self.readTextHeader(pos)
+                self.start = self.skipTextItems(pos, numItems)
     
-        fileObj = None
-        objList = baseObjToSave.getSaveData(forLevelSave)
-        ## To do: This should probably just throw to exception and let it
-        ##        be caught or passed on by the calling method.
-        try:
-            fileObj = open(fileName, "w")
-            GameSaver.writeEntry(objList, fileObj)
-        except IOError:
-            print("Saving: IOError!  Failed to open file \"" + fileName + "\"!")
-            raise
+    def detach(self):
+        """Copy the contents of a mapped file into memory, and unmap
+        the file, so that the file may be safely overwritten."""
+        
+        if isinstance(self.data, mmap.mmap):
+            mappedData = self.data
+            self.data = mappedData[:]
+            mappedData.close()
+    
+    def readRoot(self):
+        """Read the header of the root entry of the file.
+        
+        Returns: A LazyGameSaveEntry for the root entry"""
+        
+        if self.fileFormat == GameSaver.FORMAT_BINARY:
+            objType, loadFn, numItems, pos, end = self.readBinaryHeader(self.start)
         else:
-            if fileObj is not None:
-                fileObj.close()
+            objType, loadFn, numItems, pos = self.readTextHeader(self.start)
+        return LazyGameSaveEntry(self, objType, loadFn, pos, numItems)
     
-    @staticmethod
-    def loadGame(fileName):
-        """Load an object from file.
+    def readItems(self, pos, numItems):
+        """Read the data held by an entry.
         
-        Params: fileName -- The name of the file to read from.
+        Params: pos -- The position of the entry's first item
+                numItems -- The number of items held by the entry
         
-        Returns: A GameSaveEntry describing the object represented
-                 by the file."""
+        Returns: A list of the data"""
+        
+        if self.fileFormat == GameSaver.FORMAT_BINARY:
+            return self.readBinaryItems(pos, numItems)
+        return self.readTextItems(pos, numItems)
     
-        result = None
-        fileObj = None
-        try:
-            fileObj = open(fileName, "r")
-            result = GameSaver.readEntry(fileObj)
-        except IOError:
-            print("Loading: IOError!  Failed to open file \"" + fileName + "\"!")
-            raise
-        else:
-            if fileObj is not None:
-                fileObj.close()
+    def readTextLine(self, pos):
+        """Read a line of the text format.
+        
+        Params: pos -- The position at which the line begins
+        
+        Returns: A tuple of the line, as bytes without its line-ending,
+                 and the position of the next line"""
+        
+        end = self.data.find(b"\n", pos)
+        if end < 0:
+            end = len(self.data)
+        line = self.data[pos:end]
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        return line, end + 1
+    
+    def readTextHeader(self, pos):
+        """Read the type, loadFn and item-count of an entry in the text format.
+        
+        Params: pos -- The position of the entry's type
+        
+        Returns: A tuple of the type, the loadFn, the number of
+                 items and the position of the entry's first item"""
+        
+        objType, pos = self.readTextLine(pos)
+        loadFn, pos = self.readTextLine(pos)
+        numItems, pos = self.readTextLine(pos)
+        return sys.intern(str(objType, "utf-8")), sys.intern(str(loadFn, "utf-8")), int(numItems), pos
+    
+    def skipTextItems(self, pos, numItems):
+        """Skip over the data held by an entry in the text format,
+        without reading it. The end of the entry's data, and of that of
+        each entry nested within it, is noted, so that those entries
+        needn't be scanned again when they're read or skipped later.
+        
+        Params: pos -- The position of the entry's first item
+                numItems -- The number of items held by the entry
+        
+        Returns: The position just after the entry's data"""
+        
+        textEnds = self.textEnds
+        start = pos
+        end = textEnds.get(start)
+        if end is not None:
+            return end
+        data = self.data
+        find = data.find
+        markerLine = self.entryMarkerLine
+        markerLength = len(markerLine)
+        # The nested entries being skipped, each noted by the position of
+        # its first item and the number of items left to its parent
+        stack = []
+        while True:
+            if numItems == 0:
+                if len(stack) == 0:
+                    break
+                childStart, numItems = stack.pop()
+                textEnds[childStart] = pos
+                continue
+            numItems -= 1
+            if data[pos:pos + markerLength] == markerLine:
+                # Skip the nested entry's type and loadFn,
+                # and then its items, unless its end is known
+                pos = find(b"\n", find(b"\n", pos + markerLength) + 1) + 1
+                lineEnd = find(b"\n", pos)
+                childItems = int(data[pos:lineEnd])
+                pos = lineEnd + 1
+                end = textEnds.get(pos)
+                if end is not None:
+                    pos = end
+                elif childItems > 0:
+                    stack.append((pos, numItems))
+                    numItems = childItems
+            else:
+                pos = find(b"\n", pos) + 1
+        textEnds[start] = pos
+        return pos
+    
+    def readTextItems(self, pos, numItems):
+        """Read the data held by an entry in the text format.
+        
+        Params: pos -- The position of the entry's first item
+                numItems -- The number of items held by the entry
+        
+        Returns: A list of the data"""
+        
+        result = []
+        marker = self.entryMarker
+        for i in range(numItems):
+            line, pos = self.readTextLine(pos)
+            if line == marker:
+                objType, loadFn, childItems, pos = self.readTextHeader(pos)
+                if childItems == 1:
+                    value, valueEnd = self.readTextLine(pos)
+                    if value != marker:
+                        child = GameSaveEntry()
+                        child.objType = objType
+                        child.loadFn = loadFn
+                        child.setValue(str(value, "utf-8"))
+                        result.append(child)
+                        pos = valueEnd
+                        continue
+                result.append(LazyGameSaveEntry(self, objType, loadFn, pos, childItems))
+                pos = self.skipTextItems(pos, childItems)
+            else:
+                result.append(str(line, "utf-8"))
+        return result
+    
+    def readBinaryHeader(self, pos):
+        """Read the type, loadFn and item-count of an entry in the binary format.
+        
+        Params: pos -- The position of the entry's tag
+        
+        Returns: A tuple of the type, the loadFn, the number of
+                 items, the position of the entry's first item
+                 and the position just after the entry"""
+        
+        data = self.data
+        if data[pos] != GameSaver.BINARY_TAG_ENTRY:
+            raise IOError("Loading: Malformed binary data; expected an entry at position", pos)
+        size, pos = GameSaver.decodeVarint(data, pos + 1)
+        end = pos + size
+        symbols = self.symbols
+        if symbols is None:
+            objType, pos = GameSaver.parseBinaryString(data, pos)
+            loadFn, pos = GameSaver.parseBinaryString(data, pos)
+            objType = sys.intern(objType)
+            loadFn = sys.intern(loadFn)
+        else:
+            symbol, pos = GameSaver.decodeVarint(data, pos)
+            objType = symbols[symbol]
+            symbol, pos = GameSaver.decodeVarint(data, pos)
+            loadFn = symbols[symbol]
+        numItems, pos = GameSaver.decodeVarint(data, pos)
+        return objType, loadFn, numItems, pos, end
+    
+    def readBinaryItems(self, pos, numItems):
+        """Read the data held by an entry in the binary format.
+        
+        Params: pos -- The position of the entry's first item
+                numItems -- The number of items held by the entry
+        
+        Returns: A list of the data"""
+        
+        data = self.data
+        tagEntry = GameSaver.BINARY_TAG_ENTRY
+        result = []
+        for i in range(numItems):
+            if data[pos] == tagEntry:
+                objType, loadFn, childItems, itemPos, pos = self.readBinaryHeader(pos)
+                if childItems == 1 and data[itemPos] != tagEntry:
+                    child = GameSaveEntry()
+                    child.objType = objType
+                    child.loadFn = loadFn
+                    child.setValue(GameSaver.parseBinaryValue(data, itemPos)[0])
+                else:
+                    # Entries are prefixed with their length, so we
+                    # can skip straight past this one's contents
+                    child = LazyGameSaveEntry(self, objType, loadFn, itemPos, childItems)
+                result.append(child)
+            else:
+                value, pos = GameSaver.parseBinaryValue(data, pos)
+                result.append(value)
+        return result
+
+class GameSaveJob(object):
+    """A save carried out a little at a time, such as over a number of
+    frames, so that saving a large world needn't stall the game. Jobs are
+    made by "GameSaver.saveGameIncremental", which runs them as a Panda3D
+    task under a budget of time per frame; "runSlice" may also be called
+    directly, such as from a task of the game's own.
+    
+    A job passes through three stages: capturing the object's save data
+    as GameSaveEntries; encoding those entries, a limited number of
+    entries and values per step (however deeply they're nested); and
+    writing the encoded data to file, a limited number of pieces per step.
+    The entries are copies of the object's state, made as they're
+    captured, so changes made to the object thereafter don't reach the
+    file. By default the save data is captured whole in the job's first
+    step, so that the file is a consistent snapshot of the object as it
+    was when the job began.
+    
+    If "sliceCapture" is given, the capture too is spread out, one item
+    produced by the object's "getSaveDataStream" method per step; each
+    item is then a snapshot of the moment at which it was captured.
+    Where the object's class overrides neither that method nor
+    "getSaveData", its declared SaveFields are captured one per step;
+    otherwise, the save data is captured whole unless
+    "getSaveDataStream" is overridden.
+    
+    The file written is the same as that written by "saveEntry", and
+    isn't touched until the writing stage begins."""
+    
+    """The stages through which a job passes"""
+    STAGE_CAPTURE = "capture"
+    STAGE_ENCODE = "encode"
+    STAGE_WRITE = "write"
+    STAGE_DONE = "done"
+    
+    def __init__(self, baseObjToSave, fileName, forLevelSave, fileFormat,
+                 compression, compressionLevel, metadata, sliceCapture, callback):
+        """Params: As described under "GameSaver.saveGameIncremental"."""
+        
+        if fileFormat not in (GameSaver.FORMAT_TEXT, GameSaver.FORMAT_BINARY):
+            raise ValueError("Saving: Unrecognised file-format: " + str(fileFormat))
+        if compression is not None and not GameSaver.isCompressionAvailable(compression):
+            raise ValueError("Saving: Unrecognised or unavailable compression-method: " + str(compression))
+        self.baseObjToSave = baseObjToSave
+        self.fileName = fileName
+        self.forLevelSave = forLevelSave
+        self.fileFormat = fileFormat
+        self.compression = compression
+        self.compressionLevel = compressionLevel
+        self.metadata = None
+        if metadata is not None:
+            self.metadata = GameSaver.describeMetadata(metadata)
+        self.sliceCapture = sliceCapture
+        self.callback = callback
+        self.stage = GameSaveJob.STAGE_CAPTURE
+        self.error = None
+        self.task = None
+        self.timeBudget = None
+        # The root entry, as captured so far, and, when the capture
+        # is spread out, the items yet to be captured and the
+        # ReferenceScope that tracks the objects reached by them
+        self.root = None
+        self.pendingItems = None
+        self.scope = None
+        # The steps of the encoding, which hold the stack of entries
+        # being encoded between steps; the pieces of encoded data; the
+        # number of the root entry's items encoded so far; the index
+        # of the next piece to be written; and, in the binary format,
+        # the table of type- and loadFn-strings
+        self.encodeSteps = None
+        self.encoded = []
+        self.numItems = 0
+        self.itemsEncoded = 0
+        self.nextPiece = 0
+        self.symbols = None
+        self.rawFileObj = None
+        self.fileObj = None
+    
+    def isDone(self):
+        """Returns: True if the job has finished, whether
+                 successfully or not, and False otherwise"""
+        
+        return self.stage == GameSaveJob.STAGE_DONE
+    
+    def getProgress(self):
+        """Get the fraction of the job that has been done, such as for
+        display on a saving screen. Encoding counts for the first half,
+        by the root entry's items encoded, and writing for the second,
+        by the pieces written. While the capture is spread out, the
+        number of items to be captured isn't known, and so the progress
+        remains at zero until the capture is done.
+        
+        Returns: A number between 0 and 1"""
+        
+        if self.stage == GameSaveJob.STAGE_DONE:
+            return 1.0
+        if self.stage == GameSaveJob.STAGE_CAPTURE:
+            return 0.0
+        if self.stage == GameSaveJob.STAGE_ENCODE:
+            if self.numItems == 0:
+                return 0.0
+            return 0.5*self.itemsEncoded/self.numItems
+        if len(self.encoded) == 0:
+            return 0.5
+        return 0.5 + 0.5*self.nextPiece/len(self.encoded)
+    
+    def start(self, timeBudget = None, taskName = None):
+        """Run the job as a Panda3D task, doing up to the given
+        amount of work in each frame until the job is done.
+        
+        Params: timeBudget -- The time, in seconds, to spend on the job
+                              in each frame; if None, the value of
+                              GameSaver.incrementalTimeBudget is used.
+                              At least one step is taken in each frame.
+                taskName -- The name to give the task; if None,
+                            one based on the file's name is used."""
+        
+        if timeBudget is None:
+            timeBudget = GameSaver.incrementalTimeBudget
+        if taskName is None:
+            taskName = "save " + self.fileName
+        # The global task-manager is made when first imported, and
+        # so it's imported here, rather than with the module, so that
+        # processes that never run a task (such as the workers of a
+        # parallel save) don't make one
+        from direct.task.TaskManagerGlobal import taskMgr
+        self.timeBudget = timeBudget
+        self.task = taskMgr.add(self.runTask, taskName)
+    
+    def runTask(self, task):
+        """An internal method used to run a slice of the job
+        from a Panda3D task."""
+        
+        if self.runSlice(self.timeBudget):
+            self.task = None
+            return Task.done
+        return Task.cont
+    
+    def runSlice(self, timeBudget):
+        """Do some of the job, taking steps until the given time has
+        been spent or the job is done. If the job fails, the exception
+        is recorded in its "error" attribute, and the job ends.
+        
+        Params: timeBudget -- The time, in seconds, to spend; at
+                              least one step is taken regardless.
+        
+        Returns: True if the job is done, and False otherwise"""
+        
+        if self.stage == GameSaveJob.STAGE_DONE:
+            return True
+        deadline = time.perf_counter() + timeBudget
+        try:
+            while self.stage != GameSaveJob.STAGE_DONE:
+                self.step()
+                if time.perf_counter() >= deadline:
+                    break
+        except Exception as e:
+            if isinstance(e, IOError):
+                print("Saving: IOError!  Failed to write file \"" + self.fileName + "\"!")
+            self.error = e
+            self.closeFile()
+            self.stage = GameSaveJob.STAGE_DONE
+        if self.stage != GameSaveJob.STAGE_DONE:
+            return False
+        # The data is let go once it's no longer needed
+        self.baseObjToSave = None
+        self.root = None
+        self.encodeSteps = None
+        self.encoded = []
+        if self.callback is not None:
+            callback = self.callback
+            self.callback = None
+            callback(self)
+        return True
+    
+    def finish(self):
+        """Do the remainder of the job at once, such as when the game
+        is about to exit. Any task running the job is removed.
+        
+        Returns: The exception that ended the job, if it failed,
+                 or None if it succeeded"""
+        
+        if self.task is not None:
+            self.task.remove()
+            self.task = None
+        while not self.runSlice(1.0):
+            pass
+        return self.error
+    
+    def step(self):
+        """An internal method used to take a single step of the job."""
+        
+        if self.stage == GameSaveJob.STAGE_CAPTURE:
+            self.captureStep()
+        elif self.stage == GameSaveJob.STAGE_ENCODE:
+            self.encodeStep()
+        elif self.stage == GameSaveJob.STAGE_WRITE:
+            self.writeStep()
+    
+    def captureStep(self):
+        """An internal method used to capture the object's save
+        data, or, when the capture is spread out, a single item
+        of it."""
+        
+        baseObjToSave = self.baseObjToSave
+        if self.root is None:
+            if self.sliceCapture and GameSaver.isStreamedObject(baseObjToSave):
+                pendingItems = baseObjToSave.getSaveDataStream(self.forLevelSave)
+            elif self.sliceCapture and baseObjToSave.__class__.getSaveData is SaveableObject.getSaveData:
+                pendingItems = self.schemaFieldSteps()
+            else:
+                self.root = GameSaver.retrieveSaveData(baseObjToSave, self.forLevelSave)
+                self.beginEncoding()
+                return
+            self.root = GameSaveEntry()
+            self.root.objType = baseObjToSave.__class__.__name__
+            self.pendingItems = iter(pendingItems)
+            self.scope = ReferenceScope(self.forLevelSave, rootObj = baseObjToSave)
+            return
+        # The objects reached by all of the items are tracked
+        # together, so that those shared between items are
+        # saved once, as with a save made at once
+        scope = GameSaver.resumeReferenceScope(self.scope)
+        try:
+            for item in self.pendingItems:
+                if isinstance(item, GameSaveEntry):
+                    self.root.dataList.append(item)
+                else:
+                    loadFn, value = item
+                    if isinstance(value, types.GeneratorType):
+                        value = list(value)
+                    self.root.addItem(loadFn, value)
+                return
+        finally:
+            GameSaver.leaveReferenceScope(scope)
+        self.pendingItems = None
+        self.scope = None
+        self.beginEncoding()
+    
+    def schemaFieldSteps(self):
+        """An internal method used to capture the object's declared
+        SaveFields one at a time, as "getSaveData" would have them,
+        when the object's class doesn't override that method.
+        
+        Returns: A generator of the entries of the object's fields"""
+        
+        schema = GameSaver.saveSchemaCache.get(self.baseObjToSave.__class__)
+        if schema is None:
+            schema = GameSaver.compileSaveSchema(self.baseObjToSave.__class__)
+        for field in schema:
+            fieldEntry = GameSaveEntry()
+            GameSaver.addSchemaFields(self.baseObjToSave, fieldEntry, (field,))
+            for item in fieldEntry.dataList:
+                yield item
+    
+    def beginEncoding(self):
+        """An internal method used to move on to the encoding
+        stage once the object's save data has been captured."""
+        
+        self.numItems = len(self.root.peekDataList())
+        self.itemsEncoded = 0
+        if self.fileFormat == GameSaver.FORMAT_BINARY:
+            self.symbols = {}
+            self.encodeSteps = self.encodeBinarySteps()
+        else:
+            self.encodeSteps = self.encodeTextSteps()
+        self.stage = GameSaveJob.STAGE_ENCODE
+    
+    def encodeStep(self):
+        """An internal method used to encode a limited number of
+        entries and values, resuming where the last step left off."""
+        
+        if next(self.encodeSteps, None) is None:
+            self.encodeSteps = None
+            self.nextPiece = 0
+            self.stage = GameSaveJob.STAGE_WRITE
+    
+    def encodeTextSteps(self):
+        """An internal method used to encode the root entry as
+        "writeEntry" would, as a generator that yields True after
+        every GameSaver.incrementalStepSize entries and values.
+        The stack of entries being encoded is kept between steps."""
+        
+        toText = GameSaver.toText
+        entryLine = GameSaver.ENTRY_MARKER + "\n"
+        stepSize = GameSaver.incrementalStepSize
+        pieces = self.encoded
+        root = self.root
+        dataList = root.peekDataList()
+        pieces.append(toText(root.objType) + "\n" + toText(root.loadFn) + "\n" + str(len(dataList)) + "\n")
+        stack = [iter(dataList)]
+        done = 0
+        while len(stack) > 0:
+            for datum in stack[-1]:
+                done += 1
+                if isinstance(datum, GameSaveEntry):
+                    dataList = datum.peekDataList()
+                    pieces.append(entryLine + toText(datum.objType) + "\n" + toText(datum.loadFn) + "\n" +
+                                  str(len(dataList)) + "\n")
+                    stack.append(iter(dataList))
+                    break
+                datum = toText(datum)
+                if not datum.endswith("\n"):
+                    datum += "\n"
+                pieces.append(datum)
+                if len(stack) == 1:
+                    self.itemsEncoded += 1
+                if done >= stepSize:
+                    done = 0
+                    yield True
+            else:
+                stack.pop()
+                if len(stack) == 1:
+                    self.itemsEncoded += 1
+            if done >= stepSize:
+                done = 0
+                yield True
+    
+    def encodeBinarySteps(self):
+        """An internal method used to encode the root entry as
+        "appendBinaryEntry" would, as a generator that yields True after
+        every GameSaver.incrementalStepSize entries and values. The
+        stack of entries being encoded, with the sizes of their bodies
+        so far, is kept between steps."""
+        
+        encodeBinarySymbol = GameSaver.encodeBinarySymbol
+        encodeBinaryValue = GameSaver.encodeBinaryValue
+        encodeVarint = GameSaver.encodeVarint
+        entryTag = bytes((GameSaver.BINARY_TAG_ENTRY,))
+        stepSize = GameSaver.incrementalStepSize
+        symbols = self.symbols
+        chunks = self.encoded
+        # Each frame holds an entry's type, an iterator over its items,
+        # the index in "chunks" of its length-prefix, and the size of
+        # its body so far, as in "appendBinaryEntry"
+        stack = []
+        entry = self.root
+        done = 0
+        while True:
+            if entry is not None:
+                dataList = entry.peekDataList()
+                header = encodeBinarySymbol(entry.objType, symbols) + \
+                         encodeBinarySymbol(entry.loadFn, symbols) + \
+                         encodeVarint(len(dataList))
+                stack.append([entry.objType, iter(dataList), len(chunks), len(header)])
+                chunks.append(None)
+                chunks.append(header)
+                entry = None
+            frame = stack[-1]
+            for datum in frame[1]:
+                done += 1
+                if isinstance(datum, GameSaveEntry):
+                    entry = datum
+                    break
+                record = encodeBinaryValue(datum, frame[0])
+                chunks.append(record)
+                frame[3] += len(record)
+                if len(stack) == 1:
+                    self.itemsEncoded += 1
+                if done >= stepSize:
+                    done = 0
+                    yield True
+            else:
+                stack.pop()
+                size = frame[3]
+                prefix = entryTag + encodeVarint(size)
+                chunks[frame[2]] = prefix
+                if len(stack) == 0:
+                    return
+                stack[-1][3] += size + len(prefix)
+                if len(stack) == 1:
+                    self.itemsEncoded += 1
+            if done >= stepSize:
+                done = 0
+                yield True
+    
+    def writeStep(self):
+        """An internal method used to open the file, to write a
+        limited number of the pieces of encoded data, or to close
+        the file once all are written."""
+        
+        if self.fileObj is None:
+            self.openFile()
+            return
+        if self.nextPiece < len(self.encoded):
+            end = self.nextPiece + GameSaver.WRITE_BUFFER_PIECES
+            pieces = self.encoded[self.nextPiece:end]
+            if self.fileFormat == GameSaver.FORMAT_BINARY:
+                self.fileObj.write(b"".join(pieces))
+            else:
+                self.fileObj.write("".join(pieces))
+            self.encoded[self.nextPiece:end] = [None]*len(pieces)
+            self.nextPiece += len(pieces)
+            return
+        self.closeFile()
+        self.stage = GameSaveJob.STAGE_DONE
+    
+    def openFile(self):
+        """An internal method used to open the file, as "saveEntry"
+        would, and to write its header, metadata and, in the binary
+        format, table of strings."""
+        
+        GameSaver.discardJournal(self.fileName)
+        GameSaver.releaseMappedFile(self.fileName)
+        GameSaver.forgetCachedFile(self.fileName)
+        binary = self.fileFormat == GameSaver.FORMAT_BINARY
+        if self.compression is None:
+            if binary:
+                self.fileObj = open(self.fileName, "wb")
+            else:
+                self.fileObj = open(self.fileName, "w")
+        else:
+            self.rawFileObj = open(self.fileName, "wb")
+            self.fileObj = GameSaver.openCompressedWriter(self.rawFileObj, self.compression, self.compressionLevel)
+            if not binary:
+                self.fileObj = io.TextIOWrapper(self.fileObj, encoding = "utf-8")
+        if binary:
+            self.fileObj.write(GameSaver.BINARY_MAGIC + bytes((GameSaver.BINARY_VERSION,)))
+        if self.metadata is not None:
+            self.fileObj.write(GameSaver.encodeMetadata(self.metadata, self.fileFormat))
+        if binary:
+            self.fileObj.write(GameSaver.encodeBinarySymbols(self.symbols))
+    
+    def closeFile(self):
+        """An internal method used to close the file, if it's open."""
+        
+        if self.fileObj is not None:
+            self.fileObj.close()
+        if self.rawFileObj is not None:
+            self.rawFileObj.close()
+        self.fileObj = None
+        self.rawFileObj = None
+
+class GameLoadJob(object):
+    """A load carried out a little at a time, such as over a number of
+    frames, so that loading a large world needn't stall the game, and so
+    that a loading screen may show its progress. Jobs are made by
+    "GameSaver.loadGameIncremental", which runs them as a Panda3D task
+    under a budget of time per frame; "runSlice" may also be called
+    directly, such as from a task of the game's own.
+    
+    A job passes through three stages: reading the file, a block per
+    step; parsing its contents into GameSaveEntries, an entry per step;
+    and, if an object to restore was given, restoring that object via its
+    "loadFromSaveDataStream" method, a step of that method per step.
+    The entries are as those returned by "GameSaver.loadGame", any changes
+    recorded in the file's journal included, and are held in the job's
+    "result" attribute once parsed.
+    
+    A job may be cancelled via "cancel". An object being restored is
+    then left as far restored as it got, and should be discarded or
+    reset by the caller."""
+    
+    """The stages through which a job passes"""
+    STAGE_READ = "read"
+    STAGE_PARSE = "parse"
+    STAGE_RESTORE = "restore"
+    STAGE_DONE = "done"
+    
+    def __init__(self, fileName, objToLoad, refObj, callback):
+        """Params: As described under "GameSaver.loadGameIncremental"."""
+        
+        self.fileName = fileName
+        self.objToLoad = objToLoad
+        self.refObj = refObj
+        self.callback = callback
+        self.stage = GameLoadJob.STAGE_READ
+        self.error = None
+        self.cancelled = False
+        self.result = None
+        self.fileFormat = None
+        self.task = None
+        self.timeBudget = None
+        # The file being read, the blocks read from it so far, and
+        # the size of the file and the number of bytes read from it,
+        # by which the progress of the reading is measured
+        self.rawFileObj = None
+        self.fileObj = None
+        self.header = None
+        self.blocks = []
+        self.fileSize = 0
+        self.bytesRead = 0
+        # The size of the file's contents, the entries yet to be parsed,
+        # in the order in which they appear in the file, and the position
+        # of the last entry parsed, by which the progress of the parsing
+        # is measured
+        self.dataSize = 0
+        self.pendingEntries = None
+        self.parsedPos = 0
+        # The steps of the object's restoration, the ReferenceScope that
+        # tracks the objects restored by them, and the fraction of the
+        # object last reported as restored
+        self.restoreSteps = None
+        self.scope = None
+        self.restoredFraction = 0.0
+    
+    def isDone(self):
+        """Returns: True if the job has finished, whether successfully,
+                 unsuccessfully or by being cancelled, and False otherwise"""
+        
+        return self.stage == GameLoadJob.STAGE_DONE
+    
+    def getProgress(self):
+        """Get the fraction of the job that has been done, such as
+        for display on a loading screen. Each stage counts for an
+        equal share of the job.
+        
+        Returns: A number between 0 and 1"""
+        
+        stage = self.stage
+        if stage == GameLoadJob.STAGE_DONE:
+            return 1.0
+        numStages = 3
+        if self.objToLoad is None:
+            numStages = 2
+        if stage == GameLoadJob.STAGE_READ:
+            done = 0
+            if self.fileSize > 0:
+                done = min(self.bytesRead / self.fileSize, 1.0)
+        elif stage == GameLoadJob.STAGE_PARSE:
+            done = 1
+            if self.dataSize > 0:
+                done += self.parsedPos / self.dataSize
+        else:
+            done = 2 + self.restoredFraction
+        return done / numStages
+    
+    def start(self, timeBudget = None, taskName = None):
+        """Run the job as a Panda3D task, doing up to the given
+        amount of work in each frame until the job is done.
+        
+        Params: timeBudget -- The time, in seconds, to spend on the job
+                              in each frame; if None, the value of
+                              GameSaver.incrementalTimeBudget is used.
+                              At least one step is taken in each frame.
+                taskName -- The name to give the task; if None,
+                            one based on the file's name is used."""
+        
+        if timeBudget is None:
+            timeBudget = GameSaver.incrementalTimeBudget
+        if taskName is None:
+            taskName = "load " + self.fileName
+        # As in "GameSaveJob.start", the task-manager is only imported once needed
+        from direct.task.TaskManagerGlobal import taskMgr
+        self.timeBudget = timeBudget
+        self.task = taskMgr.add(self.runTask, taskName)
+    
+    def runTask(self, task):
+        """An internal method used to run a slice of the job
+        from a Panda3D task."""
+        
+        if self.runSlice(self.timeBudget):
+            self.task = None
+            return Task.done
+        return Task.cont
+    
+    def runSlice(self, timeBudget):
+        """Do some of the job, taking steps until the given time has
+        been spent or the job is done. If the job fails, the exception
+        is recorded in its "error" attribute, and the job ends.
+        
+        Params: timeBudget -- The time, in seconds, to spend; at
+                              least one step is taken regardless.
+        
+        Returns: True if the job is done, and False otherwise"""
+        
+        if self.stage == GameLoadJob.STAGE_DONE:
+            return True
+        deadline = time.perf_counter() + timeBudget
+        try:
+            while self.stage != GameLoadJob.STAGE_DONE:
+                self.step()
+                if time.perf_counter() >= deadline:
+                    break
+        except Exception as e:
+            if isinstance(e, IOError):
+                print("Loading: IOError!  Failed to open file \"" + self.fileName + "\"!")
+            self.error = e
+            self.stage = GameLoadJob.STAGE_DONE
+        if self.stage != GameLoadJob.STAGE_DONE:
+            return False
+        self.end()
+        return True
+    
+    def finish(self):
+        """Do the remainder of the job at once. Any task
+        running the job is removed.
+        
+        Returns: The exception that ended the job, if it failed,
+                 or None if it succeeded or was cancelled"""
+        
+        if self.task is not None:
+            self.task.remove()
+            self.task = None
+        while not self.runSlice(1.0):
+            pass
+        return self.error
+    
+    def cancel(self):
+        """Stop the job, such as when the player backs out of a loading
+        screen. Any task running the job is removed, the file is closed,
+        and the restoration of the object, if under way, is stopped
+        between steps; the object is left as far restored as it got.
+        The job's callback is then called, with the job's "cancelled"
+        attribute set to True.
+        
+        Returns: True if the job was cancelled, or False
+                 if it had already finished"""
+        
+        if self.stage == GameLoadJob.STAGE_DONE:
+            return False
+        if self.task is not None:
+            self.task.remove()
+            self.task = None
+        if self.restoreSteps is not None:
+            # The steps are closed within their ReferenceScope, so
+            # that any clean-up that they do is tracked as usual
+            scope = GameSaver.resumeReferenceScope(self.scope)
+            try:
+                self.restoreSteps.close()
+            finally:
+                GameSaver.leaveReferenceScope(scope)
+        self.cancelled = True
+        self.result = None
+        self.stage = GameLoadJob.STAGE_DONE
+        self.end()
+        return True
+    
+    def end(self):
+        """An internal method used to let go of the data held by
+        the job once it's done, and to call its callback."""
+        
+        self.closeFile()
+        self.blocks = []
+        self.pendingEntries = None
+        self.restoreSteps = None
+        self.scope = None
+        if self.callback is not None:
+            callback = self.callback
+            self.callback = None
+            callback(self)
+    
+    def step(self):
+        """An internal method used to take a single step of the job."""
+        
+        if self.stage == GameLoadJob.STAGE_READ:
+            self.readStep()
+        elif self.stage == GameLoadJob.STAGE_PARSE:
+            self.parseStep()
+        elif self.stage == GameLoadJob.STAGE_RESTORE:
+            self.restoreStep()
+    
+    def readStep(self):
+        """An internal method used to open the file, to read a
+        single block of it, or, once it's all been read, to begin
+        parsing its contents."""
+        
+        if self.fileObj is None:
+            self.openFile()
+            return
+        block = self.fileObj.read(GameSaver.READ_BLOCK_SIZE)
+        if len(block) > 0:
+            self.blocks.append(block)
+            if self.rawFileObj is not None:
+                self.bytesRead = self.rawFileObj.tell()
+            else:
+                self.bytesRead += len(block)
+            return
+        self.closeFile()
+        header = self.header
+        data = header + b"".join(self.blocks)
+        self.blocks = []
+        # The file is read as by a lazy load, and then parsed in full
+        if header[:-1] == GameSaver.BINARY_MAGIC:
+            if header[-1] > GameSaver.BINARY_VERSION:
+                raise IOError("Loading: Unsupported binary version in file \"" + self.fileName + "\":", header[-1])
+            self.fileFormat = GameSaver.FORMAT_BINARY
+            source = LazyLoadSource(data, self.fileFormat, len(header))
+        else:
+            self.fileFormat = GameSaver.FORMAT_TEXT
+            source = LazyLoadSource(data, self.fileFormat)
+        self.dataSize = len(data)
+        self.result = source.readRoot()
+        self.pendingEntries = [self.result]
+        self.stage = GameLoadJob.STAGE_PARSE
+    
+    def openFile(self):
+        """An internal method used to open the file, as "loadGame"
+        would, decompressing it if it was compressed."""
+        
+        self.fileObj = open(self.fileName, "rb")
+        self.fileSize = getsize(self.fileName)
+        header = self.fileObj.read(len(GameSaver.BINARY_MAGIC) + 1)
+        compression = GameSaver.detectCompression(header)
+        if compression is not None:
+            # The file is reopened rather than rewound, as
+            # not all file objects support seeking
+            self.fileObj.close()
+            self.fileObj = None
+            self.rawFileObj = open(self.fileName, "rb")
+            self.fileObj = GameSaver.openDecompressedReader(self.rawFileObj, compression)
+            header = self.fileObj.read(len(GameSaver.BINARY_MAGIC) + 1)
+            self.bytesRead = self.rawFileObj.tell()
+        else:
+            self.bytesRead = len(header)
+        self.header = header
+    
+    def closeFile(self):
+        """An internal method used to close the file, if it's open."""
+        
+        if self.fileObj is not None:
+            self.fileObj.close()
+        if self.rawFileObj is not None:
+            self.rawFileObj.close()
+        self.fileObj = None
+        self.rawFileObj = None
+    
+    def parseStep(self):
+        """An internal method used to parse the data held by a single
+        entry, or, once all have been parsed, to apply the file's journal
+        and to begin restoring the object."""
+        
+        pending = self.pendingEntries
+        if len(pending) > 0:
+            entry = pending.pop()
+            self.parsedPos = entry._offset
+            dataList = entry.peekDataList()
+            if type(dataList) is list:
+                # The entries held by this one are parsed next, in
+                # reverse so that they're taken in file-order
+                for datum in reversed(dataList):
+                    if isinstance(datum, LazyGameSaveEntry):
+                        pending.append(datum)
+            return
+        changes = GameSaver.readJournal(self.fileName, self.fileFormat)
+        if len(changes) > 0:
+            GameSaver.applyJournal(self.result, changes)
+        self.pendingEntries = None
+        if self.objToLoad is None:
+            self.stage = GameLoadJob.STAGE_DONE
+            return
+        self.scope = ReferenceScope(refObj = self.refObj, rootObj = self.objToLoad)
+        self.stage = GameLoadJob.STAGE_RESTORE
+    
+    def restoreStep(self):
+        """An internal method used to take a single step
+        of the object's restoration."""
+        
+        # The objects restored by all of the steps are tracked
+        # together, so that those shared between them are
+        # restored once, as with a load made at once
+        scope = GameSaver.resumeReferenceScope(self.scope)
+        try:
+            if self.restoreSteps is None:
+                self.restoreSteps = iter(self.objToLoad.loadFromSaveDataStream(self.result, self.refObj))
+                return
+            fraction = next(self.restoreSteps, GameLoadJob.STAGE_DONE)
+        finally:
+            GameSaver.leaveReferenceScope(scope)
+        if fraction is GameLoadJob.STAGE_DONE:
+            self.stage = GameLoadJob.STAGE_DONE
+        elif fraction is not None:
+            self.restoredFraction = min(max(fraction, 0.0), 1.0)
+
+class GameSaver(object):
+    """The core class of the module.
+    GameSaver's methods are static; the class is not intended to be instantiated"""
+
+    ENTRY_MARKER = "ENTRY"
+    
+    """The number of characters read from a text-file at a time, and the
+    number of pieces of text gathered before they're written to file
+    together (amounting to some tens of kilobytes, typically)"""
+    READ_BLOCK_SIZE = 1 << 16
+    WRITE_BUFFER_PIECES = 4096
+    
+    """The formats in which a file may be saved: the original,
+    line-based text format, and a more compact binary format."""
+    FORMAT_TEXT = "text"
+    FORMAT_BINARY = "binary"
+    
+    """The header with which binary files begin; this allows
+    "loadGame" to detect the format of a file on its own. Files of
+    version 2 and later follow the header with a table of the type- and
+    loadFn-strings used in the file, which entries refer to by number."""
+    BINARY_MAGIC = b"\x89GSV\r\n\x1a\n"
+    BINARY_VERSION = 2
+    
+    """The tags that begin each record in the binary format"""
+    BINARY_TAG_ENTRY = 1
+    BINARY_TAG_STRING = 2
+    BINARY_TAG_INT = 3
+    BINARY_TAG_FLOAT = 4
+    BINARY_TAG_TRUE = 5
+    BINARY_TAG_FALSE = 6
+    BINARY_TAG_PATCH = 7
+    BINARY_TAG_INDEX = 8
+    BINARY_TAG_SYMBOLS = 9
+    BINARY_TAG_METADATA = 10
+    
+    """The encodings of small integers as varints, and of the prefixes of
+    entries with small bodies, made once rather than for every use"""
+    SMALL_VARINTS = tuple([bytes((value,)) for value in range(0x80)])
+    SMALL_ENTRY_PREFIXES = tuple(map(bytes((BINARY_TAG_ENTRY,)).__add__, SMALL_VARINTS))
+    
+    """The markers of the index that may be appended to a file, giving
+    the positions of the entries held by the file's root entry; the index
+    is located via a footer of fixed length at the very end of the file."""
+    INDEX_MARKER = "INDEX"
+    INDEX_FOOTER_MARKER = "INDEX_AT"
+    INDEX_FOOTER_LENGTH = len(INDEX_FOOTER_MARKER) + 22
+    BINARY_INDEX_MAGIC = b"GSIX"
+    BINARY_INDEX_FOOTER_LENGTH = 8 + len(BINARY_INDEX_MAGIC)
+    
+    """The width to which the number of items held by an entry
+    written by "saveGameStream" is padded (and, in the binary
+    format, its length), allowing it to be filled in afterwards"""
+    STREAMED_COUNT_WIDTH = 10
+    
+    """The marker that begins the metadata that may be written at the
+    start of a text file, ahead of its root entry; in the binary format,
+    the metadata follows the file's header, ahead of its table of strings.
+    (The marker can't be mistaken for the type of a root entry.)"""
+    METADATA_MARKER = "#METADATA"
+    
+    """The time, in seconds, spent in each frame on a job begun by
+    "saveGameIncremental" or "loadGameIncremental", unless another is given"""
+    incrementalTimeBudget = 0.002
+    
+    """The number of entries and values encoded in each step of a job
+    begun by "saveGameIncremental", however deeply they're nested"""
+    incrementalStepSize = 256
+    
+    """The greatest number of threads used by "readMetadataFiles"
+    to read the metadata of several files at once"""
+    metadataScanWorkers = 8
+    
+    """The methods by which a file may be compressed when saved; a
+    compressed file is detected and decompressed by "loadGame" on its
+    own. The "zlib" method uses the gzip container-format."""
+    COMPRESSION_ZLIB = "zlib"
+    COMPRESSION_LZMA = "lzma"
+    COMPRESSION_BZ2 = "bz2"
+    
+    """The headers with which files compressed by each method begin"""
+    COMPRESSION_HEADERS = ((COMPRESSION_ZLIB, b"\x1f\x8b"),
+                           (COMPRESSION_LZMA, b"\xfd7zXZ\x00"),
+                           (COMPRESSION_BZ2, b"BZh"))
+    
+    """The suffix given to the journal in which "saveGameToJournal"
+    records changes made since a file was last saved in full, and the
+    lines that begin and end each change in the text format"""
+    JOURNAL_SUFFIX = ".journal"
+    JOURNAL_PATCH_MARKER = "PATCH"
+    JOURNAL_END_MARKER = "END"
+    
+    """The size, in bytes, beyond which a journal is folded back into
+    a fresh full save by "saveGameToJournal"."""
+    journalCompactionThreshold = 1 << 20
+    
+    """The GameSaveEntry last saved to each journalled file, and the
+    format and compression with which it was saved, keyed by file-name;
+    changes are found by comparison against these. A file's entry is
+    dropped whenever the file is saved in full other than via the
+    journal, and all are dropped by "destroy"."""
+    journalBases = {}
+    
+    """The worker-thread used by "saveGameAsync" (created on first
+    use), the saves that it has yet to finish, keyed by file-name,
+    and a lock guarding both"""
+    asyncSaveExecutor = None
+    asyncSaves = {}
+    asyncSaveLock = threading.Lock()
+    
+    """The pool of worker-processes used by parallel saves (created on
+    first use, and replaced if a different number of workers is asked
+    for), the number of workers in it, and the number of batches into
+    which each worker's share of the entries to encode is divided"""
+    parallelSaveExecutor = None
+    parallelSaveWorkers = 0
+    PARALLEL_BATCHES_PER_WORKER = 4
+    
+    """The sources of lazily-loaded entries that read from memory-mapped
+    files, keyed by the files' absolute paths, and a lock guarding them;
+    their contents are copied into memory before their files are
+    overwritten, as changing a mapped file would change their data."""
+    mappedSources = {}
+    mappedSourceLock = threading.Lock()
+    
+    """The trees of entries parsed by "loadGameCached", kept so that files
+    loaded again and again, such as levels, needn't be re-read each time.
+    Each is keyed by its file's absolute path, and held along with the
+    modification-times and sizes of the file and its journal when it was
+    read, and an estimate of the memory that it uses; the least recently
+    used are dropped once the estimates exceed "loadCacheBudget", in bytes.
+    A lock guards the cache, and the total of its estimates."""
+    loadCache = collections.OrderedDict()
+    loadCacheSize = 0
+    loadCacheBudget = 64 << 20
+    loadCacheLock = threading.Lock()
+    
+    """Classes that are not simple types (int, float, str, etc.), but which
+    are also not descendants of SaveableObject, are stored in this dictionary;
+    they may be registered by calling "addSpecialType"."""
+    specialTypeDictionary = {}
+    
+    """Descendants of SaveableObject that may be restored when held within
+    the data of another object, keyed by class-name; they may be registered
+    by calling "addSaveableClass". Each is paired with a function that makes
+    a blank instance of the class, ready to be restored."""
+    saveableClassDictionary = {}
+    
+    """A function callback used to check the inheritance of a class;
+    the callback is used to allow for the checking of classes that
+    GameSaver doesn't know about, such as custom game classes."""
+    isSubclass = None
+    
+    """The ways in which "addItem" may describe an object; which applies
+    to a given class is resolved once and then cached."""
+    SAVE_AS_TEXT = 0
+    SAVE_AS_STRING = 1
+    SAVE_AS_BYTES = 2
+    SAVE_AS_ITERABLE = 3
+    SAVE_AS_DICT = 4
+    SAVE_AS_CALLABLE = 5
+    SAVE_AS_ENTRY = 6
+    SAVE_AS_SPECIAL_TYPE = 7
+    SAVE_AS_ARRAY = 8
+    SAVE_AS_OBJECT = 9
+    
+    """The type-names given to entries that describe an object referred
+    to elsewhere (holding the number by which it's referred to and its
+    description), and to entries that refer to such an object; the
+    number by which the object being saved or loaded as a whole is
+    referred to; whether shared objects are tracked when saving; and
+    the ReferenceScope of the save or load under way on each thread.
+    
+    Tracking is off by default: a reference can only be restored once
+    the object to which it refers has been, and so data saved with it
+    must be restored in the order in which it was saved, and as a whole,
+    rather than an entry at a time. Data saved with tracking on should
+    be loaded with it on too. While it's off, SaveableObjects passed to
+    "addItem" are saved as text, unless registered via "addSaveableClass"."""
+    SHARED_TYPE = "SharedObject"
+    REFERENCE_TYPE = "SharedReference"
+    ROOT_REFERENCE = "0"
+    trackReferences = False
+    referenceScopeState = threading.local()
+    
+    """The type-name given to entries that hold a packed numeric array,
+    and the minimum length at which lists and tuples are packed. (Instances
+    of "array.array" and NumPy's "ndarray" are packed regardless of length.)"""
+    PACKED_ARRAY_TYPE = "PackedArray"
+    packedArrayThreshold = 16
+    
+    """The "struct" format-codes used to pack the elements of instances of
+    "array.array", keyed by the arrays' type-codes and element-sizes"""
+    ARRAY_TYPECODE_FORMATS = dict([(typecode, {1 : "b", 2 : "h", 4 : "i", 8 : "q"}) for typecode in "bhilq"] +
+                                  [(typecode, {1 : "B", 2 : "H", 4 : "I", 8 : "Q"}) for typecode in "BHILQ"] +
+                                  [("f", {4 : "f"}), ("d", {8 : "d"})])
+    
+    """Caches of the handling resolved for each class when saving
+    (keyed by the class) and when loading (keyed by the class-name).
+    They're cleared whenever the special types change, and the
+    loading cache additionally whenever "isSubclass" is replaced."""
+    saveDispatchCache = {}
+    loadDispatchCache = {}
+    loadDispatchSubclassFn = None
+    
+    """The ways in which a restored value may be applied to an object:
+    by assignment to an attribute, or by a call to a method looked up on
+    the object (on each call, so that methods replaced on the object or
+    its class are honoured)"""
+    LOAD_BY_ASSIGNMENT = 0
+    LOAD_BY_METHOD = 1
+    
+    """A cache of the plans made by "compileLoadPlan", keyed by
+    class and then by loadFn; it's cleared along with the caches
+    above, and may be cleared by hand if classes are changed."""
+    loadPlanCache = {}
+    
+    """The simple types that SaveFields may declare for fast handling,
+    and a cache of the fields gathered by "compileSaveSchema", keyed by
+    class; it's cleared along with the caches above."""
+    SIMPLE_FIELD_TYPES = (int, float, bool, str, bytes)
+    saveSchemaCache = {}
+    
+    """A GameSaveProfiler to which the costs of saving and loading
+    are reported, or None (the default) to measure nothing"""
+    profiler = None
+    
+    def __init__(self):
+        raise RuntimeError("GameSaver is a static class; it is not intended to be instantiated!")
+    
+    @staticmethod
+    def addSpecialType(type, restoreFn, saveFn):
+        """Register a special type
+        
+        Params: restoreFn -- The function to call to restore an object
+                saveFn -- The function to call to get a saveable
+                          representation of an object"""
+                        
+        GameSaver.specialTypeDictionary[type] = SpecialTypeEntry(restoreFn, saveFn)
+        GameSaver.clearDispatchCaches()
+    
+    @staticmethod
+    def restorePickledEntry(objType, loadFn, dataList, value):
+        """An internal method used to restore a pickled LazyGameSaveEntry,
+        as an ordinary GameSaveEntry.
+        
+        Params: objType -- The entry's type.
+                loadFn -- The entry's loadFn.
+                dataList -- The entry's list of data, or None.
+                value -- The entry's single value, if it has no list.
+        
+        Returns: The GameSaveEntry"""
+        
+        result = GameSaveEntry()
+        result.objType = objType
+        result.loadFn = loadFn
+        result._dataList = dataList
+        result._value = value
+        return result
+    
+    @staticmethod
+    def addSaveableClass(saveableClass, makeFn = None):
+        """Register a descendant of SaveableObject, allowing instances of
+        it to be saved directly within the data of other objects (via
+        "addItem") and restored automatically, with each instance reached
+        more than once restored only once.
+        
+        Params: saveableClass -- The class to register
+                makeFn -- A function that takes no parameters and returns
+                          a blank instance of the class, to be restored
+                          via its "loadFromSaveData" method; if None, the
+                          instance is made without calling "__init__"."""
+        
+        if makeFn is None:
+            makeFn = GameSaver.makeBlankObjectFn(saveableClass)
+        GameSaver.saveableClassDictionary[saveableClass.__name__] = makeFn
+        GameSaver.clearDispatchCaches()
+    
+    @staticmethod
+    def makeBlankObjectFn(saveableClass):
+        """An internal method used to make a function that makes
+        an instance of a class without calling its "__init__".
+        
+        Params: saveableClass -- The class in question"""
+        
+        def makeBlankObject():
+            return saveableClass.__new__(saveableClass)
+        return makeBlankObject
+    
+    @staticmethod
+    def enterReferenceScope(forLevelSave = False, refObj = None, rootObj = None):
+        """An internal method used to begin tracking the objects saved or
+        loaded on this thread, if they aren't already being tracked.
+        
+        Params: forLevelSave -- Whether the save is intended for a level file.
+                refObj -- The object passed on to loaded objects.
+                rootObj -- The object being saved or loaded as a whole, if any.
+        
+        Returns: The new ReferenceScope, or None if one was already
+                 in place; this should be passed to "leaveReferenceScope"
+                 once the save or load is done."""
+        
+        state = GameSaver.referenceScopeState
+        if getattr(state, "scope", None) is not None:
+            return None
+        scope = ReferenceScope(forLevelSave, refObj, rootObj)
+        state.scope = scope
+        return scope
+    
+    @staticmethod
+    def resumeReferenceScope(scope):
+        """An internal method used to resume tracking the objects saved
+        on this thread via a ReferenceScope begun earlier, such as by a
+        job carried out over several steps, if they aren't already
+        being tracked.
+        
+        Params: scope -- The ReferenceScope to resume.
+        
+        Returns: The ReferenceScope, or None if one was already in
+                 place; this should be passed to "leaveReferenceScope"
+                 once the step is done."""
+        
+        state = GameSaver.referenceScopeState
+        if getattr(state, "scope", None) is not None:
+            return None
+        state.scope = scope
+        return scope
+    
+    @staticmethod
+    def leaveReferenceScope(scope):
+        """An internal method used to stop tracking the objects saved
+        or loaded on this thread.
+        
+        Params: scope -- The value returned by "enterReferenceScope"."""
+        
+        if scope is not None:
+            GameSaver.referenceScopeState.scope = None
+    
+    @staticmethod
+    def isReferenceScopeNeeded():
+        """An internal method used to determine whether the objects
+        loaded should be tracked: only shared objects and instances
+        of registered classes make use of a ReferenceScope when
+        loading, and so otherwise none is made.
+        
+        Returns: True if shared objects are tracked or any class
+                 is registered via "addSaveableClass", and False
+                 otherwise"""
+        
+        return GameSaver.trackReferences or len(GameSaver.saveableClassDictionary) > 0
+    
+    @staticmethod
+    def getReferenceScope():
+        """An internal method used to get the ReferenceScope of the
+        save or load under way on this thread.
+        
+        Returns: The ReferenceScope, or None if there is none"""
+        
+        return getattr(GameSaver.referenceScopeState, "scope", None)
+    
+    @staticmethod
+    def retrieveSaveData(baseObjToSave, forLevelSave):
+        """An internal method used to retrieve an object's save data,
+        tracking the objects reached throughout.
+        
+        Params: baseObjToSave -- The object to be saved.
+                forLevelSave -- Whether the save is intended for a level file.
+        
+        Returns: The object's GameSaveEntry"""
+        
+        scope = GameSaver.enterReferenceScope(forLevelSave, rootObj = baseObjToSave)
+        try:
+            return baseObjToSave.getSaveData(forLevelSave)
+        finally:
+            GameSaver.leaveReferenceScope(scope)
+    
+    @staticmethod
+    def beginReconstruction(handler, newVal, stack):
+        """An internal method used by "reconstructObject" to begin
+        the reconstruction of an object that's not simply restored
+        from its data: a container, a saveable object or a shared
+        object. Shared objects are noted, so that references to
+        them may be resolved.
+        
+        Params: handler -- The object's handler, as made by "resolveLoadHandler"
+                newVal -- Data describing the object
+                stack -- The stack of containers under reconstruction,
+                         to which a frame is added for a container
+        
+        Returns: The object, which may yet need its elements"""
+        
+        reference = None
+        if handler[0] == GameSaver.SHARED_TYPE:
+            reference = GameSaver.toText(newVal[0])
+            description = newVal[1]
+            # A description repeated for the sake of a section of an
+            # indexed file is passed over if the object has already been
+            # restored from an earlier one
+            scope = GameSaver.getReferenceScope()
+            if scope is None:
+                raise IOError("Loading: Shared object found while GameSaver.trackReferences is off; reference:",
+                              reference)
+            if reference in scope.loadedObjects:
+                return scope.loadedObjects[reference]
+            handler = GameSaver.getLoadDispatchCache().get(description.objType)
+            if handler is None:
+                handler = GameSaver.resolveLoadHandler(description.objType)
+            newVal = description.peekDataList()
+        containerType = handler[0]
+        scope = GameSaver.getReferenceScope()
+        if containerType is None:
+            result = handler[1](newVal)
+        elif containerType is SaveableObject:
+            result = handler[1][1]()
+            if reference is not None:
+                scope.loadedObjects[reference] = result
+            data = GameSaveEntry()
+            data.objType = handler[1][0]
+            data._dataList = list(newVal)
+            result.loadFromSaveData(data, scope.refObj)
+            return result
+        elif containerType is list:
+            result = []
+            stack.append((list, iter(newVal), result, None))
+        elif containerType is dict:
+            result = {}
+            stack.append((dict, iter(newVal), [], result))
+        elif containerType is tuple:
+            # Tuples can only be made once their elements are known
+            stack.append((tuple, iter(newVal), [], reference))
+            return None
+        else:
+            raise IOError("Loading: Shared object describes another shared object; reference:", reference)
+        if reference is not None:
+            scope.loadedObjects[reference] = result
+        return result
+    
+    @staticmethod
+    def clearDispatchCaches():
+        """An internal method used to discard the cached handling
+        of classes, so that it's resolved anew on next use."""
+        
+        GameSaver.saveDispatchCache.clear()
+        GameSaver.loadDispatchCache.clear()
+        GameSaver.loadDispatchSubclassFn = None
+        GameSaver.loadPlanCache.clear()
+        GameSaver.saveSchemaCache.clear()
+    
+    @staticmethod
+    def resolveSaveHandler(obj):
+        """An internal method used to determine how objects
+        of the given object's class should be described,
+        caching the result for that class.
+        
+        Params: obj -- An instance of the class in question
+        
+        Returns: A tuple of one of the "SAVE_AS_" constants, the relevant
+                 SpecialTypeEntry for special types, and whether objects
+                 of the class may be shared, and so should be tracked"""
+        
+        typeEntry = None
+        if obj.__class__ is list or obj.__class__ is tuple or isinstance(obj, array.array) or \
+           (numpy is not None and isinstance(obj, numpy.ndarray)):
+            kind = GameSaver.SAVE_AS_ARRAY
+        elif isinstance(obj, dict):
+            kind = GameSaver.SAVE_AS_DICT
+        # I'm excluding "str" here because we write our data as strings,
+        # and a str is, naturally, already a string, making it seem wasteful
+        # to individually add each character; additionally, there is some
+        # logic that is specfic to str.
+        elif isinstance(obj, collections.abc.Iterable) and not isinstance(obj, str) and not isinstance(obj, bytes):
+            kind = GameSaver.SAVE_AS_ITERABLE
+        elif callable(obj):
+            kind = GameSaver.SAVE_AS_CALLABLE
+        elif isinstance(obj, GameSaveEntry):
+            kind = GameSaver.SAVE_AS_ENTRY
+        elif isinstance(obj, str):
+            kind = GameSaver.SAVE_AS_STRING
+        elif isinstance(obj, bytes):
+            kind = GameSaver.SAVE_AS_BYTES
+        else:
+            typeEntry = GameSaver.findSpecialTypeForObject(obj)
+            if typeEntry is not None:
+                kind = GameSaver.SAVE_AS_SPECIAL_TYPE
+            elif isinstance(obj, SaveableObject):
+                kind = GameSaver.SAVE_AS_OBJECT
+            else:
+                kind = GameSaver.SAVE_AS_TEXT
+        # Tuples aren't tracked, as they can't be restored
+        # before their elements, and so can't hold themselves
+        trackable = kind == GameSaver.SAVE_AS_DICT or kind == GameSaver.SAVE_AS_OBJECT or \
+                    (kind == GameSaver.SAVE_AS_ARRAY and obj.__class__ is not tuple)
+        handler = (kind, typeEntry, trackable)
+        GameSaver.saveDispatchCache[obj.__class__] = handler
+        return handler
+    
+    @staticmethod
+    def compileLoadPlan(objClass, loadFn):
+        """An internal method used to work out how a value restored
+        for a given loadFn should be applied to objects of a given
+        class, as "SaveableObject.loadFromSaveData" does.
+        
+        A loadFn ending in "=" assigns to the named attribute. Otherwise,
+        the method is looked up on the object on each call, so that
+        methods set on the object, or replaced on its class, are
+        honoured.
+        
+        Where the loadFn is that of a field declared with a simple type,
+        the field's restore-function is noted, so that the field's value
+        may be restored without its type being looked up.
+        
+        Params: objClass -- The class of the objects in question
+                loadFn -- The loadFn
+        
+        Returns: A tuple of one of the "LOAD_BY_" constants, the
+                 attribute- or method-name to use, and the type-name
+                 and restore-function of the field's simple type
+                 (or None and None, if there is no such field)"""
+        
+        typeName = None
+        restoreFn = None
+        schema = GameSaver.saveSchemaCache.get(objClass)
+        if schema is None:
+            schema = GameSaver.compileSaveSchema(objClass)
+        for field in schema:
+            if field[2] == loadFn and field[3] is not None:
+                typeName = field[3]
+                handler = GameSaver.getLoadDispatchCache().get(typeName)
+                if handler is None:
+                    handler = GameSaver.resolveLoadHandler(typeName)
+                if handler[0] is None:
+                    restoreFn = handler[1]
+                else:
+                    typeName = None
+                break
+        
+        stripped = loadFn.rstrip()
+        if stripped.endswith("="):
+            return (GameSaver.LOAD_BY_ASSIGNMENT, stripped[:-1].rstrip(), typeName, restoreFn)
+        return (GameSaver.LOAD_BY_METHOD, loadFn, typeName, restoreFn)
+    
+    @staticmethod
+    def compileSaveSchema(objClass):
+        """An internal method used to gather the SaveFields declared
+        by a class and its ancestors, caching the result.
+        
+        Params: objClass -- The class in question
+        
+        Returns: A list of tuples, one per field, each holding the
+                 name of the attribute or method from which to get
+                 the field's value, whether that's a method, the
+                 loadFn under which to save the value, the name of
+                 the field's simple type (or None, if it has none),
+                 the type itself, and a function that converts a value
+                 of that type to the text by which it's saved"""
+        
+        fields = []
+        names = {}
+        # Ancestors' fields come first
+        for cls in reversed(objClass.__mro__):
+            for field in cls.__dict__.get("saveFields", ()):
+                if field.name in names:
+                    fields[names[field.name]] = field
+                else:
+                    names[field.name] = len(fields)
+                    fields.append(field)
+        
+        schema = []
+        for field in fields:
+            if field.loadFn is not None:
+                loadFn = field.loadFn
+            else:
+                loadFn = field.name + " = "
+            typeName = None
+            encodeFn = None
+            if field.fieldType in GameSaver.SIMPLE_FIELD_TYPES:
+                # The field's type is handled as addItem would handle it,
+                # unless it's been claimed by a special type
+                kind = GameSaver.resolveSaveHandler(field.fieldType())[0]
+                if kind == GameSaver.SAVE_AS_TEXT:
+                    encodeFn = str
+                elif kind == GameSaver.SAVE_AS_STRING:
+                    encodeFn = GameSaver.encodeStringField
+                elif kind == GameSaver.SAVE_AS_BYTES:
+                    encodeFn = GameSaver.encodeBytesField
+                if encodeFn is not None:
+                    typeName = field.fieldType.__name__
+            if field.saveFn is not None:
+                schema.append((field.saveFn, True, loadFn, typeName, field.fieldType, encodeFn))
+            else:
+                schema.append((field.name, False, loadFn, typeName, field.fieldType, encodeFn))
+        GameSaver.saveSchemaCache[objClass] = schema
+        return schema
+    
+    @staticmethod
+    def encodeStringField(value):
+        """An internal method used to convert a str to the
+        text by which it's saved, as "addItem" would.
+        
+        Params: value -- The str to convert"""
+        
+        return value.encode("unicode_escape")
+    
+    @staticmethod
+    def encodeBytesField(value):
+        """An internal method used to convert a bytes-object
+        to the text by which it's saved, as "addItem" would.
+        
+        Params: value -- The bytes-object to convert"""
+        
+        return codecs.escape_encode(value)[0]
+    
+    @staticmethod
+    def addSchemaFields(obj, entry, schema):
+        """An internal method used to add the values of an
+        object's declared fields to its GameSaveEntry.
+        
+        Params: obj -- The object being saved.
+                entry -- The object's GameSaveEntry.
+                schema -- The object's fields, as returned
+                          by "compileSaveSchema"."""
+        
+        dataList = entry.dataList
+        # When profiling, every value is added via "addItem", so
+        # that its costs are reported as usual
+        profiling = GameSaver.profiler is not None
+        for name, isMethod, loadFn, typeName, fieldType, encodeFn in schema:
+            value = getattr(obj, name)
+            if isMethod:
+                value = value()
+            # A value of the declared type is described directly;
+            # anything else, such as None, is described as usual
+            if encodeFn is not None and value.__class__ is fieldType and not profiling:
+                fieldEntry = GameSaveEntry()
+                fieldEntry.objType = typeName
+                fieldEntry.loadFn = loadFn
+                fieldEntry._dataList = None
+                fieldEntry._value = encodeFn(value)
+                dataList.append(fieldEntry)
+            else:
+                entry.addItem(loadFn, value)
+    
+    @staticmethod
+    def getLoadDispatchCache():
+        """An internal method used to get the cache of the handling
+        resolved for each class-name when loading, first clearing it
+        (and the cache of load plans, which draw upon it) if
+        "isSubclass" has been replaced since it was filled.
+        
+        Returns: A dictionary of the handlers made by "resolveLoadHandler"."""
+        
+        if GameSaver.isSubclass is not GameSaver.loadDispatchSubclassFn:
+            GameSaver.loadDispatchCache.clear()
+            GameSaver.loadPlanCache.clear()
+            GameSaver.loadDispatchSubclassFn = GameSaver.isSubclass
+        return GameSaver.loadDispatchCache
+    
+    @staticmethod
+    def resolveLoadHandler(objType):
+        """An internal method used to determine how objects of the
+        named class should be reconstructed, caching the result
+        for that class-name.
+        
+        Params: objType -- The name of the class in question
+        
+        Returns: A tuple of the container-type (list, tuple or dict)
+                 for classes rebuilt from their elements, SaveableObject
+                 for saveable classes, GameSaver.SHARED_TYPE for shared
+                 objects, or None otherwise; and a function that takes the
+                 object's data and returns the reconstructed object (for
+                 saveable classes, a tuple of the class-name and a function
+                 that makes a blank instance)"""
+        
+        containerType = None
+        restoreFn = None
+        typeEntry = None
+        if len(GameSaver.specialTypeDictionary) > 0:
+            typeEntry = GameSaver.findSpecialTypeByName(objType)
+        if typeEntry is not None:
+            restoreFn = GameSaver.makeSpecialTypeRestorer(typeEntry)
+        elif objType in GameSaver.saveableClassDictionary:
+            containerType = SaveableObject
+            restoreFn = (objType, GameSaver.saveableClassDictionary[objType])
+        elif objType == GameSaver.SHARED_TYPE:
+            containerType = GameSaver.SHARED_TYPE
+        elif objType == GameSaver.REFERENCE_TYPE:
+            restoreFn = GameSaver.restoreReference
+        elif objType == list.__name__:
+            containerType = list
+        elif objType == tuple.__name__:
+            containerType = tuple
+        elif objType == dict.__name__:
+            containerType = dict
+        elif objType == bool.__name__:
+            restoreFn = GameSaver.restoreBool
+        elif objType == type(None).__name__ or objType == "None":
+            restoreFn = GameSaver.restoreNone
+        elif objType == GameSaveEntry.__name__:
+            restoreFn = GameSaver.restoreGameSaveEntry
+        elif objType == GameSaver.PACKED_ARRAY_TYPE:
+            restoreFn = GameSaver.unpackArray
+        elif objType == str.__name__:
+            restoreFn = GameSaver.restoreStr
+        elif objType == bytes.__name__:
+            restoreFn = GameSaver.restoreBytes
+        elif objType == int.__name__:
+            restoreFn = GameSaver.restoreInt
+        elif objType == float.__name__:
+            restoreFn = GameSaver.restoreFloat
+        elif objType == types.FunctionType.__name__ or \
+             objType == types.MethodType.__name__:
+            restoreFn = GameSaver.restoreFunction
+        else:
+            restoreFn = GameSaver.makeUnrecognisedRestorer(objType)
+        handler = (containerType, restoreFn)
+        GameSaver.getLoadDispatchCache()[objType] = handler
+        return handler
+    
+    @staticmethod
+    def makeSpecialTypeRestorer(typeEntry):
+        """An internal method used to make a function that
+        reconstructs an object of a special type.
+        
+        Params: typeEntry -- The SpecialTypeEntry for the type"""
+        
+        def restoreSpecialType(newVal):
+            if len(newVal) == 1:
+                newVal = newVal[0]
+            return typeEntry.restoreFn(newVal)
+        return restoreSpecialType
+    
+    @staticmethod
+    def makeUnrecognisedRestorer(objType):
+        """An internal method used to make a function that
+        reports an attempt to reconstruct an unrecognised class.
+        
+        Params: objType -- The name of the class"""
+        
+        def restoreUnrecognised(newVal):
+            raise IOError("Loading: Attempt to construct unrecognised class! Class-name:", objType)
+        return restoreUnrecognised
+    
+    @staticmethod
+    def restoreBool(newVal):
+        """An internal method used to reconstruct a bool.
+        
+        Params: newVal -- Data describing the object"""
+        
+        if len(newVal) == 1:
+            newVal = newVal[0]
+        if isinstance(newVal, str):
+            newVal = newVal.lower()
+            return newVal == "true" or newVal == "1"
+        return bool(newVal)
+    
+    @staticmethod
+    def restoreNone(newVal):
+        """An internal method used to reconstruct None.
+        
+        Params: newVal -- Data describing the object"""
+        
+        return None
+    
+    @staticmethod
+    def restoreGameSaveEntry(newVal):
+        """An internal method used to reconstruct a GameSaveEntry.
+        
+        Params: newVal -- Data describing the object"""
+        
+        if len(newVal) == 1:
+            newVal = newVal[0]
+        retVal = GameSaveEntry()
+        retVal.objType = GameSaveEntry.__name__
+        if isinstance(newVal, list):
+            retVal.dataList = newVal
+        else:
+            retVal.dataList = [newVal]
+        return retVal
+    
+    @staticmethod
+    def restoreReference(newVal):
+        """An internal method used to restore a reference
+        to an object restored earlier.
+        
+        Params: newVal -- Data describing the reference"""
+        
+        if len(newVal) == 1:
+            newVal = newVal[0]
+        scope = GameSaver.getReferenceScope()
+        if scope is not None:
+            result = scope.loadedObjects.get(GameSaver.toText(newVal), scope)
+            if result is not scope:
+                return result
+        raise IOError("Loading: Reference to an object that hasn't been restored; reference:", newVal)
+    
+    @staticmethod
+    def restoreStr(newVal):
+        """An internal method used to reconstruct a str.
+        
+        Params: newVal -- Data describing the object"""
+        
+        if len(newVal) == 1:
+            newVal = newVal[0]
+        return bytes(newVal, "utf-8").decode("utf-8")
+    
+    @staticmethod
+    def restoreBytes(newVal):
+        """An internal method used to reconstruct a bytes-object.
+        
+        Params: newVal -- Data describing the object"""
+        
+        if len(newVal) == 1:
+            newVal = newVal[0]
+        return codecs.escape_decode(newVal)[0]
+    
+    @staticmethod
+    def restoreInt(newVal):
+        """An internal method used to reconstruct an int.
+        
+        Params: newVal -- Data describing the object"""
+        
+        if len(newVal) == 1:
+            newVal = newVal[0]
+        return int(newVal)
+    
+    @staticmethod
+    def restoreFloat(newVal):
+        """An internal method used to reconstruct a float.
+        
+        Params: newVal -- Data describing the object"""
+        
+        if len(newVal) == 1:
+            newVal = newVal[0]
+        return float(newVal)
+    
+    @staticmethod
+    def restoreFunction(newVal):
+        """An internal method used to report an attempt to
+        reconstruct a method or function.
+        
+        Params: newVal -- Data describing the object"""
+        
+        if len(newVal) == 1:
+            newVal = newVal[0]
+        raise IOError("Loading: GameSaver cannot save methods or functions; the method or function in question is:", newVal)
+    
+    @staticmethod
+    def packArray(obj):
+        """An internal method used to pack a numeric array into a
+        compact representation: the name of the array's class, the
+        format of its elements, its shape, and its elements' data,
+        little-endian and base64-encoded. For lists and tuples the
+        format is a "struct" format-string; for instances of
+        "array.array" it's the array's type-code followed by such a
+        format-string; for NumPy arrays it's the array's dtype-string.
+        
+        Params: obj -- A list, tuple, "array.array" or NumPy array
+        
+        Returns: A list of the strings described above, or None if
+                 the array holds something other than numbers all
+                 of a single type that can be packed"""
+        
+        if obj.__class__ is list or obj.__class__ is tuple:
+            elementTypes = set(map(type, obj))
+            if elementTypes == {int}:
+                code = "q"
+            elif elementTypes == {float}:
+                code = "d"
+            else:
+                return None
+            try:
+                values = array.array(code, obj)
+            except OverflowError:
+                return None
+            containerName = obj.__class__.__name__
+            elementFormat = "<" + code
+            shape = str(len(obj))
+        elif isinstance(obj, array.array):
+            if obj.typecode in GameSaver.ARRAY_TYPECODE_FORMATS:
+                code = GameSaver.ARRAY_TYPECODE_FORMATS[obj.typecode][obj.itemsize]
+            else:
+                return None
+            values = obj
+            containerName = "array"
+            elementFormat = obj.typecode + "<" + code
+            shape = str(len(obj))
+        else:
+            if obj.dtype.kind not in "biuf":
+                return None
+            values = numpy.ascontiguousarray(obj, dtype = obj.dtype.newbyteorder("<"))
+            containerName = "ndarray"
+            elementFormat = values.dtype.str
+            shape = ",".join([str(length) for length in obj.shape])
+        if sys.byteorder == "big" and containerName != "ndarray":
+            values = array.array(values.typecode, values)
+            values.byteswap()
+        return [containerName, elementFormat, shape, base64.b64encode(values.tobytes()).decode("ascii")]
+    
+    @staticmethod
+    def unpackArray(newVal):
+        """An internal method used to reconstruct an array
+        packed by "packArray".
+        
+        Params: newVal -- Data describing the array"""
+        
+        containerName, elementFormat, shape, data = newVal
+        data = base64.b64decode(data)
+        if containerName == "ndarray":
+            if numpy is None:
+                raise IOError("Loading: NumPy is required to load an array saved by it; the array's format is:", elementFormat)
+            shape = tuple([int(length) for length in shape.split(",") if length != ""])
+            return numpy.frombuffer(data, dtype = numpy.dtype(elementFormat)).reshape(shape).copy()
+        if containerName == "array":
+            values = array.array(elementFormat[0])
+            elementFormat = elementFormat[1:]
+        else:
+            values = array.array(elementFormat[1:])
+        if values.itemsize == struct.calcsize(elementFormat):
+            values.frombytes(data)
+            if sys.byteorder == "big":
+                values.byteswap()
+        else:
+            # The array's type has a different size on this system than
+            # on that which saved it, so its elements are converted singly
+            values.extend(struct.unpack(elementFormat[0] + shape + elementFormat[1:], data))
+        if containerName == "list":
+            return values.tolist()
+        elif containerName == "tuple":
+            return tuple(values.tolist())
+        return values
+    
+    @staticmethod
+    def findSpecialTypeByName(objType):
+        """An internal method used to find the special type, if any,
+        from which the named class descends.
+        
+        Params: objType -- The name of the class to check
+        
+        Returns: The SpecialTypeEntry for the special type,
+                 or None if there is no such special type"""
+        
+        for key in GameSaver.specialTypeDictionary:
+            if GameSaver.isSubclass(objType, key):
+                return GameSaver.specialTypeDictionary[key]
+        return None
+    
+    @staticmethod
+    def findSpecialTypeForObject(obj):
+        """An internal method used to find the special type, if any,
+        of which the given object is an instance.
+        
+        Params: obj -- The object to check
+        
+        Returns: The SpecialTypeEntry for the special type,
+                 or None if there is no such special type"""
+        
+        for key in GameSaver.specialTypeDictionary:
+            if isinstance(obj, key):
+                return GameSaver.specialTypeDictionary[key]
+        return None
+    
+    @staticmethod
+    def toText(value):
+        """An internal method used to convert a value to the text
+        by which it's represented in a file.
+        
+        Params: value -- The value to convert
+        
+        Returns: The text representing the value"""
+        
+        if not isinstance(value, str):
+            if isinstance(value, bytes):
+                try:
+                    value = value.decode("utf-8")
+                except UnicodeDecodeError:
+                    value = str(value)
+            else:
+                value = str(value)
+        return value
+    
+    @staticmethod
+    def writeLine(line, fileObj):
+        """Write a newline-terminated line of text to a file.
+        
+        Params: line -- The text to write
+                fileObj -- The file object to write to"""
+                
+        line = GameSaver.toText(line)
+        if not line.endswith("\n"):
+            line += "\n"
+        fileObj.write(line)
+    
+    @staticmethod
+    def readLine(fileObj):
+        """Read a newline-terminated line of text from a file.
+        
+        Params: fileObj -- The file object to read from
+        
+        Returns: The line of text read, sans final newline, if any"""
+    
+        result = fileObj.readline()
+        if result.endswith("\n"):
+            result = result[0:len(result)-1]
+        return result
+    
+    @staticmethod
+    def writeEntry(obj, fileObj):
+        """Write a GameSaveEntry to file.
+        
+        Note: Nested GameSaveEntries are written via an explicit
+              stack, rather than via recursion, so that deeply-nested
+              data can't exceed Python's recursion limit. The text is
+              written in large chunks, rather than line-by-line.
+        
+        Params: obj -- The GameSaveEntry to write.
+                fileObj -- The file object to write to."""
+    
+        profiler = GameSaver.profiler
+        # Text is gathered in pieces, and written in bulk
+        pieces = []
+        write = pieces.append
+        bufferPieces = GameSaver.WRITE_BUFFER_PIECES
+        if profiler is not None:
+            write = profiler.countingWriter(write)
+            profiler.enter(profiler.STAGE_WRITE, obj)
+        toText = GameSaver.toText
+        entryLine = GameSaver.ENTRY_MARKER + "\n"
+        dataList = obj.peekDataList()
+        write(toText(obj.objType) + "\n" + toText(obj.loadFn) + "\n" + str(len(dataList)) + "\n")
+        stack = [iter(dataList)]
+        while len(stack) > 0:
+            for datum in stack[-1]:
+                if isinstance(datum, GameSaveEntry):
+                    if profiler is not None:
+                        profiler.enter(profiler.STAGE_WRITE, datum)
+                    if len(pieces) >= bufferPieces:
+                        fileObj.write("".join(pieces))
+                        pieces.clear()
+                    dataList = datum._dataList
+                    if dataList is None:
+                        dataList = datum.peekDataList()
+                    write(entryLine + toText(datum.objType) + "\n" + toText(datum.loadFn) + "\n" + str(len(dataList)) + "\n")
+                    stack.append(iter(dataList))
+                    break
+                if datum.__class__ is not str:
+                    datum = toText(datum)
+                if not datum.endswith("\n"):
+                    datum += "\n"
+                write(datum)
+                # Wide entries of simple values are flushed as they go,
+                # too, rather than only between nested entries
+                if len(pieces) >= bufferPieces:
+                    fileObj.write("".join(pieces))
+                    pieces.clear()
+            else:
+                stack.pop()
+                if profiler is not None:
+                    profiler.leave()
+        fileObj.write("".join(pieces))
+    
+    @staticmethod
+    def readEntry(fileObj):
+        """Read a GameSaveEntry from file.
+        
+        Note: If a GameSaveEntry's representation indicates that
+              it contains another GameSaveEntry, that new entry is
+              read and included within the return value. This is
+              done via an explicit stack, rather than via recursion,
+              so that deeply-nested data can't exceed Python's
+              recursion limit.
+              
+              Lines are read via the file object's "readline" method;
+              wrapping the file object in a BufferedLineReader first
+              makes reading a large file much quicker.
+            
+        Params: fileObj -- The file object to read from.
+        
+        Returns: A GameSaveEntry with whatever data was read."""
+    
+        profiler = GameSaver.profiler
+        readline = fileObj.readline
+        intern = sys.intern
+        marker = GameSaver.ENTRY_MARKER + "\n"
+        result = GameSaveEntry()
+        if profiler is not None:
+            readline = profiler.countingReader(readline)
+            profiler.enter(profiler.STAGE_READ, result)
+        result.objType = intern(readline()[:-1])
+        result.loadFn = intern(readline()[:-1])
+        numItems = int(readline())
+        # Each frame holds an entry and the number of its items
+        # that have yet to be read
+        stack = [(result, numItems)]
+        # Whether an entry-marker has already been read
+        # for the next item, but not yet acted upon
+        markerRead = False
+        while len(stack) > 0:
+            entry, numItems = stack.pop()
+            dataList = entry._dataList
+            while numItems > 0:
+                numItems -= 1
+                if markerRead:
+                    input = marker
+                    markerRead = False
+                else:
+                    input = readline()
+                if input == marker:
+                    input = GameSaveEntry()
+                    if profiler is not None:
+                        profiler.enter(profiler.STAGE_READ, input)
+                    input.objType = intern(readline()[:-1])
+                    input.loadFn = intern(readline()[:-1])
+                    dataList.append(input)
+                    childItems = int(readline())
+                    if childItems == 1:
+                        # An entry that holds a single simple value
+                        # stores it directly, without a list
+                        value = readline()
+                        if value != marker:
+                            if value.endswith("\n"):
+                                value = value[:-1]
+                            input._dataList = None
+                            input._value = value
+                            if profiler is not None:
+                                profiler.leave()
+                            continue
+                        markerRead = True
+                    stack.append((entry, numItems))
+                    entry = input
+                    dataList = input._dataList
+                    numItems = childItems
+                else:
+                    if input.endswith("\n"):
+                        input = input[:-1]
+                    dataList.append(input)
+            if profiler is not None:
+                profiler.leave()
+        return result
+    
+    @staticmethod
+    def encodeVarint(value):
+        """An internal method used to encode a non-negative integer
+        as a variable-length sequence of bytes, seven bits to a byte.
+        
+        Params: value -- The integer to encode
+        
+        Returns: The encoded bytes"""
+        
+        if value < 0x80:
+            return GameSaver.SMALL_VARINTS[value]
+        result = bytearray()
+        while value >= 0x80:
+            result.append((value & 0x7f) | 0x80)
+            value >>= 7
+        result.append(value)
+        return bytes(result)
+    
+    @staticmethod
+    def encodePaddedVarint(value, length):
+        """An internal method used to encode a non-negative integer
+        as does "encodeVarint", but padded to a fixed number of bytes,
+        so that it may be filled in later without moving what follows.
+        
+        Params: value -- The integer to encode
+                length -- The number of bytes to encode it in
+        
+        Returns: The encoded bytes"""
+        
+        result = bytearray()
+        for i in range(length - 1):
+            result.append((value & 0x7f) | 0x80)
+            value >>= 7
+        if value >= 0x80:
+            raise ValueError("Saving: Value too large to encode in the space given:", value)
+        result.append(value)
+        return bytes(result)
+    
+    @staticmethod
+    def decodeVarint(data, pos):
+        """An internal method used to decode an integer encoded
+        by "encodeVarint".
+        
+        Params: data -- The bytes from which to decode the integer
+                pos -- The position at which the integer begins
+        
+        Returns: A tuple of the integer and the position just after it"""
+        
+        byte = data[pos]
+        pos += 1
+        if byte < 0x80:
+            return byte, pos
+        result = byte & 0x7f
+        shift = 7
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result, pos
+            shift += 7
+    
+    @staticmethod
+    def encodeBinaryString(value):
+        """An internal method used to encode a value as a
+        length-prefixed string in the binary format.
+        
+        Params: value -- The value to encode
+        
+        Returns: The encoded bytes"""
+        
+        data = GameSaver.toText(value).encode("utf-8")
+        return GameSaver.encodeVarint(len(data)) + data
+    
+    @staticmethod
+    def encodeBinarySymbol(value, symbols):
+        """An internal method used to encode a type- or loadFn-string
+        in the binary format: as a reference to the file's table
+        of such strings, if it has one, or as a string otherwise.
+        
+        Params: value -- The value to encode
+                symbols -- A dictionary mapping the strings in the table
+                           to their numbers, to which the value is added
+                           if it's not already present; or None if the
+                           value is to be encoded as a string
+        
+        Returns: The encoded bytes"""
+        
+        if symbols is None:
+            return GameSaver.encodeBinaryString(value)
+        text = GameSaver.toText(value)
+        symbol = symbols.get(text)
+        if symbol is None:
+            symbol = len(symbols)
+            symbols[text] = symbol
+        return GameSaver.encodeVarint(symbol)
+    
+    @staticmethod
+    def encodeBinarySymbols(symbols):
+        """An internal method used to encode a file's table of
+        type- and loadFn-strings in the binary format.
+        
+        Params: symbols -- A dictionary mapping the strings in the
+                           table to their numbers, as filled in by
+                           "encodeBinarySymbol"
+        
+        Returns: The encoded bytes"""
+        
+        body = [GameSaver.encodeVarint(len(symbols))]
+        # Symbols are numbered in the order in which they're added
+        for text in symbols:
+            body.append(GameSaver.encodeBinaryString(text))
+        body = b"".join(body)
+        return bytes((GameSaver.BINARY_TAG_SYMBOLS,)) + GameSaver.encodeVarint(len(body)) + body
+    
+    @staticmethod
+    def encodeBinaryValue(value, objType):
+        """An internal method used to encode a simple value held
+        by a GameSaveEntry as a record in the binary format.
+        Integers, floats and booleans are stored natively
+        where doing so loses nothing of their text-representation;
+        everything else is stored as a string.
+        
+        Params: value -- The value to encode
+                objType -- The type-name of the entry holding the value
+        
+        Returns: The encoded bytes"""
+        
+        text = value
+        if text.__class__ is not str:
+            text = GameSaver.toText(value)
+        try:
+            if objType == "int":
+                number = int(text)
+                if str(number) == text:
+                    if number < 0:
+                        number = -number*2 - 1
+                    else:
+                        number *= 2
+                    return bytes((GameSaver.BINARY_TAG_INT,)) + GameSaver.encodeVarint(number)
+            elif objType == "float":
+                number = float(text)
+                if repr(number) == text:
+                    return bytes((GameSaver.BINARY_TAG_FLOAT,)) + struct.pack("<d", number)
+            elif objType == "bool":
+                if text == "True":
+                    return bytes((GameSaver.BINARY_TAG_TRUE,))
+                elif text == "False":
+                    return bytes((GameSaver.BINARY_TAG_FALSE,))
+        except ValueError:
+            pass
+        return bytes((GameSaver.BINARY_TAG_STRING,)) + GameSaver.encodeBinaryString(text)
+    
+    @staticmethod
+    def appendBinaryEntry(obj, chunks, symbols = None):
+        """An internal method used to encode a GameSaveEntry in the
+        binary format, appending the encoded pieces to a list.
+        
+        Each entry is prefixed by the length of its body, allowing
+        a reader to skip over it without parsing its contents.
+        Nested GameSaveEntries are encoded via an explicit stack,
+        rather than via recursion, so that deeply-nested data can't
+        exceed Python's recursion limit. The encoded headers of entries,
+        and entries holding a single value, are reused wherever the
+        same ones recur.
+        
+        Params: obj -- The GameSaveEntry to encode.
+                chunks -- The list to which to append the encoded bytes.
+                symbols -- The dictionary of type- and loadFn-strings
+                           to which the entries refer, as taken by
+                           "encodeBinarySymbol"; if None, the strings
+                           are stored in each entry.
+        
+        Returns: The number of bytes appended"""
+        
+        profiler = GameSaver.profiler
+        encodeBinaryValue = GameSaver.encodeBinaryValue
+        encodeBinarySymbol = GameSaver.encodeBinarySymbol
+        encodeVarint = GameSaver.encodeVarint
+        smallVarints = GameSaver.SMALL_VARINTS
+        smallPrefixes = GameSaver.SMALL_ENTRY_PREFIXES
+        entryTag = bytes((GameSaver.BINARY_TAG_ENTRY,))
+        # The encoded type- and loadFn-strings of each pair of them met
+        # so far, and, keyed by type, the records encoding string-values
+        # met so far, as many entries share their strings and values
+        headers = {}
+        records = {}
+        # The encodings of whole entries holding a single string-value
+        # (as most do), keyed by their type, loadFn and value
+        leaves = {}
+        countOne = smallVarints[1]
+        if profiler is not None:
+            # The index in "chunks" up to which the bytes
+            # appended have been counted
+            counted = len(chunks)
+            profiler.enter(profiler.STAGE_WRITE, obj)
+        # Each frame holds an iterator over an entry's items, the records
+        # encoding the entry's string-values, the index in "chunks" of its
+        # length-prefix, and the size of its body so far. The length of an
+        # entry isn't known until its contents have been encoded, so we
+        # leave a space for it to be filled in.
+        stack = []
+        entry = obj
+        while True:
+            if entry is not None:
+                dataList = entry._dataList
+                if dataList is None:
+                    dataList = entry.peekDataList()
+                objType = entry.objType
+                key = (objType, entry.loadFn)
+                names = headers.get(key)
+                if names is None:
+                    names = encodeBinarySymbol(objType, symbols) + encodeBinarySymbol(entry.loadFn, symbols)
+                    headers[key] = names
+                count = len(dataList)
+                if count < 0x80:
+                    count = smallVarints[count]
+                else:
+                    count = encodeVarint(count)
+                typeRecords = records.get(objType)
+                if typeRecords is None:
+                    typeRecords = records[objType] = {}
+                stack.append([iter(dataList), (objType, typeRecords), len(chunks), len(names) + len(count)])
+                chunks.append(None)
+                chunks.append(names)
+                chunks.append(count)
+                entry = None
+            frame = stack[-1]
+            objType, typeRecords = frame[1]
+            size = frame[3]
+            for datum in frame[0]:
+                if isinstance(datum, GameSaveEntry):
+                    # Entries holding a single value are encoded
+                    # at once, without a frame of their own
+                    if datum.__class__ is GameSaveEntry and datum._dataList is None and profiler is None:
+                        value = datum._value
+                        leafKey = None
+                        if value.__class__ is str:
+                            leafKey = (datum.objType, datum.loadFn, value)
+                            leaf = leaves.get(leafKey)
+                            if leaf is not None:
+                                chunks.append(leaf)
+                                size += len(leaf)
+                                continue
+                        key = (datum.objType, datum.loadFn)
+                        names = headers.get(key)
+                        if names is None:
+                            names = encodeBinarySymbol(datum.objType, symbols) + encodeBinarySymbol(datum.loadFn, symbols)
+                            headers[key] = names
+                        body = names + countOne + encodeBinaryValue(value, datum.objType)
+                        if len(body) < 0x80:
+                            leaf = smallPrefixes[len(body)] + body
+                        else:
+                            leaf = entryTag + encodeVarint(len(body)) + body
+                        if leafKey is not None:
+                            leaves[leafKey] = leaf
+                        chunks.append(leaf)
+                        size += len(leaf)
+                        continue
+                    frame[3] = size
+                    if profiler is not None:
+                        profiler.countBytes(sum(len(chunk) for chunk in chunks[counted:] if chunk is not None))
+                        counted = len(chunks)
+                        profiler.enter(profiler.STAGE_WRITE, datum)
+                    entry = datum
+                    break
+                if datum.__class__ is str:
+                    record = typeRecords.get(datum)
+                    if record is None:
+                        record = typeRecords[datum] = encodeBinaryValue(datum, objType)
+                else:
+                    record = encodeBinaryValue(datum, objType)
+                chunks.append(record)
+                size += len(record)
+            else:
+                stack.pop()
+                if size < 0x80:
+                    prefix = smallPrefixes[size]
+                else:
+                    prefix = entryTag + encodeVarint(size)
+                if profiler is not None:
+                    profiler.countBytes(sum(len(chunk) for chunk in chunks[counted:] if chunk is not None) +
+                                        len(prefix))
+                    counted = len(chunks)
+                    profiler.leave()
+                chunks[frame[2]] = prefix
+                size += len(prefix)
+                if len(stack) == 0:
+                    return size
+                stack[-1][3] += size
+    
+    @staticmethod
+    def writeBinaryEntry(obj, fileObj):
+        """Write a GameSaveEntry to file in the binary format,
+        preceded by the table of type- and loadFn-strings to
+        which it refers.
+        
+        Params: obj -- The GameSaveEntry to write.
+                fileObj -- The binary-mode file object to write to."""
+        
+        chunks = []
+        symbols = {}
+        GameSaver.appendBinaryEntry(obj, chunks, symbols)
+        fileObj.write(GameSaver.encodeBinarySymbols(symbols))
+        fileObj.write(b"".join(chunks))
+    
+    @staticmethod
+    def collectBinarySymbols(obj, symbols):
+        """An internal method used to number the type- and loadFn-strings
+        of a GameSaveEntry and those within it, in the order in which
+        "appendBinaryEntry" would number them.
+        
+        Params: obj -- The GameSaveEntry.
+                symbols -- The dictionary of strings to fill in, as
+                           taken by "encodeBinarySymbol"."""
+        
+        encodeBinarySymbol = GameSaver.encodeBinarySymbol
+        stack = [iter((obj,))]
+        while len(stack) > 0:
+            for datum in stack[-1]:
+                if isinstance(datum, GameSaveEntry):
+                    encodeBinarySymbol(datum.objType, symbols)
+                    encodeBinarySymbol(datum.loadFn, symbols)
+                    stack.append(iter(datum.peekDataList()))
+                    break
+            else:
+                stack.pop()
+    
+    @staticmethod
+    def encodeEntries(entries, fileFormat, symbols):
+        """An internal method used by parallel saves, in their worker-
+        processes, to encode a batch of GameSaveEntries.
+        
+        Params: entries -- The GameSaveEntries to encode.
+                fileFormat -- The format in which to encode them.
+                symbols -- For the binary format, the dictionary of type-
+                           and loadFn-strings of the file, already holding
+                           all of those used by the entries.
+        
+        Returns: A list of the encoded entries: for the text format, as
+                 strings beginning with the entry-marker, and for the
+                 binary format, as bytes"""
+        
+        result = []
+        for entry in entries:
+            if fileFormat == GameSaver.FORMAT_BINARY:
+                chunks = []
+                GameSaver.appendBinaryEntry(entry, chunks, symbols)
+                result.append(b"".join(chunks))
+            else:
+                text = io.StringIO()
+                text.write(GameSaver.ENTRY_MARKER + "\n")
+                GameSaver.writeEntry(entry, text)
+                result.append(text.getvalue())
+        return result
+    
+    @staticmethod
+    def getParallelSaveExecutor(workers):
+        """An internal method used to get the pool of worker-processes
+        used by parallel saves, creating it if need be.
+        
+        Params: workers -- The number of worker-processes wanted.
+        
+        Returns: A concurrent.futures.ProcessPoolExecutor"""
+        
+        with GameSaver.asyncSaveLock:
+            if GameSaver.parallelSaveExecutor is not None and GameSaver.parallelSaveWorkers != workers:
+                GameSaver.parallelSaveExecutor.shutdown()
+                GameSaver.parallelSaveExecutor = None
+            if GameSaver.parallelSaveExecutor is None:
+                GameSaver.parallelSaveExecutor = concurrent.futures.ProcessPoolExecutor(max_workers = workers)
+                GameSaver.parallelSaveWorkers = workers
+            return GameSaver.parallelSaveExecutor
+    
+    @staticmethod
+    def writeParallelEntry(obj, fileObj, fileFormat, workers):
+        """An internal method used to write a GameSaveEntry to file,
+        with the entries that it holds encoded in parallel by a pool of
+        worker-processes. The result is the same as that written by
+        "writeEntry" or "writeBinaryEntry" (along with the file's table
+        of strings, for the binary format).
+        
+        Params: obj -- The GameSaveEntry to write.
+                fileObj -- The file object to write to; in text-mode
+                           for the text format.
+                fileFormat -- The format in which to write the entry.
+                workers -- The number of worker-processes to use."""
+        
+        dataList = obj.peekDataList()
+        children = [datum for datum in dataList if isinstance(datum, GameSaveEntry)]
+        symbols = None
+        if fileFormat == GameSaver.FORMAT_BINARY:
+            # The strings are numbered up front, so that every
+            # worker numbers them just as a serial save would
+            symbols = {}
+            GameSaver.collectBinarySymbols(obj, symbols)
+        
+        executor = GameSaver.getParallelSaveExecutor(workers)
+        numBatches = min(len(children), workers*GameSaver.PARALLEL_BATCHES_PER_WORKER)
+        batches = []
+        start = 0
+        for i in range(numBatches):
+            end = start + (len(children) - start)//(numBatches - i)
+            batches.append(children[start:end])
+            start = end
+        futures = [executor.submit(GameSaver.encodeEntries, batch, fileFormat, symbols) for batch in batches]
+        encoded = []
+        fellBack = False
+        for batch, future in zip(batches, futures):
+            try:
+                encoded.extend(future.result())
+            except (pickle.PicklingError, RecursionError, concurrent.futures.process.BrokenProcessPool) as e:
+                # Entries that can't be sent to a worker (such as those
+                # nested too deeply to be pickled), or whose worker died,
+                # are encoded here instead; any other fault is raised
+                if not fellBack:
+                    print("Saving: Failed to encode entries in parallel (" + repr(e) + "); encoding them serially instead")
+                    fellBack = True
+                if isinstance(e, concurrent.futures.process.BrokenProcessPool):
+                    # A broken pool can't be used again
+                    with GameSaver.asyncSaveLock:
+                        if GameSaver.parallelSaveExecutor is executor:
+                            GameSaver.parallelSaveExecutor = None
+                encoded.extend(GameSaver.encodeEntries(batch, fileFormat, symbols))
+        encoded.reverse()
+        
+        if fileFormat == GameSaver.FORMAT_BINARY:
+            items = []
+            for datum in dataList:
+                if isinstance(datum, GameSaveEntry):
+                    items.append(encoded.pop())
+                else:
+                    items.append(GameSaver.encodeBinaryValue(datum, obj.objType))
+            header = GameSaver.encodeBinarySymbol(obj.objType, symbols) + \
+                     GameSaver.encodeBinarySymbol(obj.loadFn, symbols) + \
+                     GameSaver.encodeVarint(len(dataList))
+            fileObj.write(GameSaver.encodeBinarySymbols(symbols))
+            fileObj.write(bytes((GameSaver.BINARY_TAG_ENTRY,)) +
+                          GameSaver.encodeVarint(len(header) + sum([len(item) for item in items])) + header)
+            fileObj.write(b"".join(items))
+        else:
+            toText = GameSaver.toText
+            pieces = [toText(obj.objType) + "\n" + toText(obj.loadFn) + "\n" + str(len(dataList)) + "\n"]
+            for datum in dataList:
+                if isinstance(datum, GameSaveEntry):
+                    pieces.append(encoded.pop())
+                else:
+                    datum = toText(datum)
+                    if not datum.endswith("\n"):
+                        datum += "\n"
+                    pieces.append(datum)
+            fileObj.write("".join(pieces))
+    
+    @staticmethod
+    def writeIndexedEntry(obj, fileObj, fileFormat):
+        """An internal method used to write a GameSaveEntry to file,
+        followed by an index of the positions of the entries that it
+        holds, and a footer giving the position of the index.
+        
+        The entry itself is written just as "writeEntry" or
+        "writeBinaryEntry" would write it, so files with an index
+        may be read as any other--save that each entry listed in the
+        index repeats the descriptions of any shared objects that it
+        refers to, but which were first described by an earlier entry,
+        so that each may be loaded alone by "loadSection".
+        
+        Params: obj -- The GameSaveEntry to write.
+                fileObj -- The binary-mode file object to write to.
+                fileFormat -- The format in which to write the entry."""
+        
+        toText = GameSaver.toText
+        dataList = GameSaver.inlineSharedDescriptions(obj.peekDataList())
+        pos = fileObj.tell()
+        # Each item of the index holds the position of an entry in the
+        # root entry's data, its type, its loadFn, and the position
+        # and length of its contents in the file
+        index = []
+        if fileFormat == GameSaver.FORMAT_BINARY:
+            symbols = {}
+            header = GameSaver.encodeBinarySymbol(obj.objType, symbols) + \
+                     GameSaver.encodeBinarySymbol(obj.loadFn, symbols) + \
+                     GameSaver.encodeVarint(len(dataList))
+            items = []
+            for itemIndex, datum in enumerate(dataList):
+                if isinstance(datum, GameSaveEntry):
+                    chunks = []
+                    GameSaver.appendBinaryEntry(datum, chunks, symbols)
+                    items.append(b"".join(chunks))
+                else:
+                    items.append(GameSaver.encodeBinaryValue(datum, obj.objType))
+            header = GameSaver.encodeBinarySymbols(symbols) + bytes((GameSaver.BINARY_TAG_ENTRY,)) + \
+                     GameSaver.encodeVarint(len(header) + sum([len(item) for item in items])) + header
+            fileObj.write(header)
+            pos += len(header)
+            for itemIndex, datum in enumerate(dataList):
+                if isinstance(datum, GameSaveEntry):
+                    index.append((itemIndex, datum.objType, datum.loadFn, pos, len(items[itemIndex])))
+                pos += len(items[itemIndex])
+            fileObj.write(b"".join(items))
+            indexData = [bytes((GameSaver.BINARY_TAG_INDEX,)), GameSaver.encodeVarint(len(index))]
+            for itemIndex, objType, loadFn, itemPos, length in index:
+                indexData.append(GameSaver.encodeVarint(itemIndex) + GameSaver.encodeBinaryString(objType) +
+                                 GameSaver.encodeBinaryString(loadFn) + GameSaver.encodeVarint(itemPos) +
+                                 GameSaver.encodeVarint(length))
+            indexData.append(struct.pack("<Q", pos) + GameSaver.BINARY_INDEX_MAGIC)
+            fileObj.write(b"".join(indexData))
+        else:
+            header = (toText(obj.objType) + "\n" + toText(obj.loadFn) + "\n" + str(len(dataList)) + "\n").encode("utf-8")
+            fileObj.write(header)
+            pos += len(header)
+            markerLine = (GameSaver.ENTRY_MARKER + "\n").encode("utf-8")
+            for itemIndex, datum in enumerate(dataList):
+                if isinstance(datum, GameSaveEntry):
+                    fileObj.write(markerLine)
+                    pos += len(markerLine)
+                    text = io.StringIO()
+                    GameSaver.writeEntry(datum, text)
+                    data = text.getvalue().encode("utf-8")
+                    index.append((itemIndex, datum.objType, datum.loadFn, pos, len(data)))
+                else:
+                    datum = toText(datum)
+                    if not datum.endswith("\n"):
+                        datum += "\n"
+                    data = datum.encode("utf-8")
+                fileObj.write(data)
+                pos += len(data)
+            lines = [GameSaver.INDEX_MARKER, str(len(index))]
+            for item in index:
+                lines.extend([toText(value) for value in item])
+            lines.append("{0} {1:020d}".format(GameSaver.INDEX_FOOTER_MARKER, pos))
+            fileObj.write(("\n".join(lines) + "\n").encode("utf-8"))
+    
+    @staticmethod
+    def inlineSharedDescriptions(dataList):
+        """An internal method used to make each of the entries held by a
+        root entry self-contained, for "writeIndexedEntry": where an entry
+        refers to a shared object first described by an earlier entry, the
+        first such reference in the entry is replaced by the object's
+        description. (References to the root object are left as they are.)
+        When the file is loaded as a whole, such repeated descriptions
+        are passed over, the object having already been restored.
+        
+        Params: dataList -- The data held by the root entry
+        
+        Returns: The data, with those entries that needed
+                 changes replaced by changed copies"""
+        
+        sharedType = GameSaver.SHARED_TYPE
+        referenceType = GameSaver.REFERENCE_TYPE
+        toText = GameSaver.toText
+        # The descriptions of shared objects, keyed by reference
+        descriptions = {}
+        stack = [datum for datum in dataList if isinstance(datum, GameSaveEntry)]
+        while len(stack) > 0:
+            entry = stack.pop()
+            if entry._dataList is None:
+                continue
+            if entry.objType == sharedType:
+                descriptions.setdefault(toText(entry._dataList[0]), entry)
+            for datum in entry._dataList:
+                if isinstance(datum, GameSaveEntry):
+                    stack.append(datum)
+        if len(descriptions) == 0:
+            return dataList
+        
+        result = []
+        for datum in dataList:
+            if not isinstance(datum, GameSaveEntry):
+                result.append(datum)
+                continue
+            # Each entry is walked in the order in which it's written,
+            # copying the entries that hold lists as it goes, so that
+            # the entries saved are left untouched; the references
+            # described so far within the entry are noted. The entry
+            # is held in a list of its own, so that it may itself be
+            # replaced, should it be a reference.
+            described = set()
+            holder = [datum]
+            stack = [(holder, enumerate(holder))]
+            while len(stack) > 0:
+                copiedList, elements = stack[-1]
+                for index, element in elements:
+                    if not isinstance(element, GameSaveEntry):
+                        continue
+                    if element.objType == referenceType:
+                        reference = toText(element.peekDataList()[0])
+                        shared = descriptions.get(reference)
+                        if reference in described or shared is None:
+                            continue
+                        copy = GameSaveEntry()
+                        copy.objType = sharedType
+                        copy.loadFn = element.loadFn
+                        copy._dataList = list(shared._dataList)
+                    elif element._dataList is None:
+                        continue
+                    else:
+                        copy = GameSaveEntry()
+                        copy.objType = element.objType
+                        copy.loadFn = element.loadFn
+                        copy._dataList = list(element._dataList)
+                    if copy.objType == sharedType:
+                        described.add(toText(copy._dataList[0]))
+                    copiedList[index] = copy
+                    stack.append((copy._dataList, enumerate(copy._dataList)))
+                    break
+                else:
+                    stack.pop()
+            result.append(holder[0])
+        return result
+    
+    @staticmethod
+    def isStreamedObject(obj):
+        """An internal method used to determine whether an object
+        produces its save data piece by piece.
+        
+        Params: obj -- The SaveableObject in question
+        
+        Returns: True if the object's class overrides
+                 "getSaveDataStream", and False otherwise"""
+        
+        return obj.__class__.getSaveDataStream is not SaveableObject.getSaveDataStream
+    
+    @staticmethod
+    def writeStreamedEntry(baseObjToSave, forLevelSave, fileObj, fileFormat):
+        """An internal method used to write an object's save data to
+        file as it's produced by the object's "getSaveDataStream"
+        method, so that the whole of it is never held at once.
+        
+        Each item produced is described and written before the next is
+        produced. The number of items held by a streamed entry (and, in
+        the binary format, its length) isn't known until the last has
+        been written, so space is left for it, padded to a fixed width,
+        and filled in once the entry is finished.
+        
+        Nested streams are written via an explicit stack, rather
+        than via recursion, so that deeply-nested data can't exceed
+        Python's recursion limit.
+        
+        Params: baseObjToSave -- The object to be saved.
+                forLevelSave -- Whether the save is intended for a level file.
+                fileObj -- The seekable binary-mode file object to write to.
+                fileFormat -- The format in which to write the data."""
+        
+        binary = fileFormat == GameSaver.FORMAT_BINARY
+        markerLine = (GameSaver.ENTRY_MARKER + "\n").encode("utf-8")
+        if GameSaver.isStreamedObject(baseObjToSave):
+            objType = baseObjToSave.__class__.__name__
+            items = baseObjToSave.getSaveDataStream(forLevelSave)
+        else:
+            data = GameSaver.retrieveSaveData(baseObjToSave, forLevelSave)
+            objType = data.objType
+            items = data.peekDataList()
+        stack = [GameSaver.startStreamedEntry(objType, None, items, False, fileObj, binary)]
+        while len(stack) > 0:
+            frame = stack[-1]
+            for item in frame[0]:
+                frame[2] += 1
+                if frame[1]:
+                    loadFn = ""
+                    value = item
+                elif isinstance(item, GameSaveEntry):
+                    GameSaver.writeStreamedItem(item, fileObj, binary, markerLine)
+                    continue
+                else:
+                    loadFn, value = item
+                if isinstance(value, SaveableObject) and GameSaver.isStreamedObject(value):
+                    if not binary:
+                        fileObj.write(markerLine)
+                    stack.append(GameSaver.startStreamedEntry(value.__class__.__name__, loadFn,
+                                                              value.getSaveDataStream(forLevelSave),
+                                                              False, fileObj, binary))
+                    break
+                if isinstance(value, types.GeneratorType):
+                    if not binary:
+                        fileObj.write(markerLine)
+                    stack.append(GameSaver.startStreamedEntry(list.__name__, loadFn, value, True, fileObj, binary))
+                    break
+                # Objects shared within a single item are
+                # saved once, but not those shared between items
+                holder = GameSaveEntry()
+                scope = GameSaver.enterReferenceScope(forLevelSave, rootObj = baseObjToSave)
+                try:
+                    holder.addItem(loadFn, value)
+                finally:
+                    GameSaver.leaveReferenceScope(scope)
+                GameSaver.writeStreamedItem(holder.peekDataList()[0], fileObj, binary, markerLine)
+            else:
+                stack.pop()
+                GameSaver.finishStreamedEntry(frame, fileObj, binary)
+    
+    @staticmethod
+    def startStreamedEntry(objType, loadFn, items, isList, fileObj, binary):
+        """An internal method used to write the header of an entry
+        whose items are to be streamed, leaving space for its length
+        and number of items.
+        
+        Params: objType -- The type of the entry.
+                loadFn -- The loadFn of the entry.
+                items -- An iterable over the items to be streamed.
+                isList -- Whether the items are the elements of a list,
+                          rather than those produced by "getSaveDataStream".
+                fileObj -- The binary-mode file object to write to.
+                binary -- Whether to write in the binary format.
+        
+        Returns: A list holding an iterator over the items, whether they're
+                 the elements of a list, the number of items written so far,
+                 and the positions of the spaces left for the entry's number
+                 of items and, in the binary format, its length"""
+        
+        width = GameSaver.STREAMED_COUNT_WIDTH
+        sizePos = None
+        if binary:
+            fileObj.write(bytes((GameSaver.BINARY_TAG_ENTRY,)))
+            sizePos = fileObj.tell()
+            fileObj.write(GameSaver.encodePaddedVarint(0, width) +
+                          GameSaver.encodeBinaryString(objType) + GameSaver.encodeBinaryString(loadFn))
+            countPos = fileObj.tell()
+            fileObj.write(GameSaver.encodePaddedVarint(0, width))
+        else:
+            toText = GameSaver.toText
+            fileObj.write((toText(objType) + "\n" + toText(loadFn) + "\n").encode("utf-8"))
+            countPos = fileObj.tell()
+            fileObj.write(("0" * width + "\n").encode("utf-8"))
+        return [iter(items), isList, 0, countPos, sizePos]
+    
+    @staticmethod
+    def finishStreamedEntry(frame, fileObj, binary):
+        """An internal method used to fill in the number of items
+        and, in the binary format, the length of a streamed entry
+        once its last item has been written.
+        
+        Params: frame -- The list returned by "startStreamedEntry".
+                fileObj -- The binary-mode file object written to.
+                binary -- Whether the entry is in the binary format."""
+        
+        width = GameSaver.STREAMED_COUNT_WIDTH
+        end = fileObj.tell()
+        if binary:
+            fileObj.seek(frame[4])
+            fileObj.write(GameSaver.encodePaddedVarint(end - frame[4] - width, width))
+            fileObj.seek(frame[3])
+            fileObj.write(GameSaver.encodePaddedVarint(frame[2], width))
+        else:
+            fileObj.seek(frame[3])
+            fileObj.write("{0:0{1}d}".format(frame[2], width).encode("utf-8"))
+        fileObj.seek(end)
+    
+    @staticmethod
+    def writeStreamedItem(entry, fileObj, binary, markerLine):
+        """An internal method used to write a single entry
+        held by a streamed entry.
+        
+        Params: entry -- The GameSaveEntry to write.
+                fileObj -- The binary-mode file object to write to.
+                binary -- Whether to write in the binary format.
+                markerLine -- The encoded line that begins
+                              each entry in the text format."""
+        
+        if binary:
+            chunks = []
+            GameSaver.appendBinaryEntry(entry, chunks)
+            fileObj.write(b"".join(chunks))
+        else:
+            text = io.StringIO()
+            GameSaver.writeEntry(entry, text)
+            fileObj.write(markerLine + text.getvalue().encode("utf-8"))
+    
+    @staticmethod
+    def parseBinaryString(data, pos):
+        """An internal method used to decode a string encoded
+        by "encodeBinaryString".
+        
+        Params: data -- The bytes from which to decode the string
+                pos -- The position at which the string begins
+        
+        Returns: A tuple of the string and the position just after it"""
+        
+        length, pos = GameSaver.decodeVarint(data, pos)
+        end = pos + length
+        return str(data[pos:end], "utf-8"), end
+    
+    @staticmethod
+    def parseBinarySymbols(data, pos):
+        """An internal method used to decode the table of type- and
+        loadFn-strings with which a binary file may begin, skipping
+        the file's metadata, if it has any.
+        
+        Params: data -- The bytes from which to decode the table
+                pos -- The position just after the file's header
+        
+        Returns: A tuple of a list of the strings in the table, interned,
+                 and the position just after the table; or of None and
+                 the position of the file's root entry, if the file
+                 has no table"""
+        
+        # The file's metadata, if it has any, comes first, and is skipped
+        if pos < len(data) and data[pos] == GameSaver.BINARY_TAG_METADATA:
+            size, pos = GameSaver.decodeVarint(data, pos + 1)
+            pos += size
+        if pos >= len(data) or data[pos] != GameSaver.BINARY_TAG_SYMBOLS:
+            return None, pos
+        size, pos = GameSaver.decodeVarint(data, pos + 1)
+        end = pos + size
+        numSymbols, pos = GameSaver.decodeVarint(data, pos)
+        symbols = []
+        for i in range(numSymbols):
+            text, pos = GameSaver.parseBinaryString(data, pos)
+            symbols.append(sys.intern(text))
+        return symbols, end
+    
+    @staticmethod
+    def parseBinaryEntry(data, pos, symbols = None):
+        """An internal method used to decode a GameSaveEntry
+        from data in the binary format.
+        
+        Nested GameSaveEntries are decoded via an explicit stack,
+        rather than via recursion, so that deeply-nested data can't
+        exceed Python's recursion limit.
+        
+        Params: data -- The bytes from which to decode the entry
+                pos -- The position of the entry's tag
+                symbols -- The list of type- and loadFn-strings to which
+                           the entry refers, as returned by
+                           "parseBinarySymbols"; if None, the strings
+                           are stored in each entry.
+        
+        Returns: A tuple of the GameSaveEntry and the position just after it"""
+        
+        profiler = GameSaver.profiler
+        parseBinaryEntryHeader = GameSaver.parseBinaryEntryHeader
+        parseBinaryValue = GameSaver.parseBinaryValue
+        tagEntry = GameSaver.BINARY_TAG_ENTRY
+        # The position up to which the bytes read have been counted
+        counted = pos
+        result, numItems, pos = parseBinaryEntryHeader(data, pos, symbols)
+        if profiler is not None:
+            profiler.enter(profiler.STAGE_READ, result)
+        # Each frame holds an entry and the number of its items
+        # that have yet to be decoded
+        stack = [(result, numItems)]
+        while len(stack) > 0:
+            entry, numItems = stack.pop()
+            dataList = entry._dataList
+            while numItems > 0:
+                numItems -= 1
+                if data[pos] == tagEntry:
+                    if profiler is not None:
+                        profiler.countBytes(pos - counted)
+                        counted = pos
+                    datum, childItems, pos = parseBinaryEntryHeader(data, pos, symbols)
+                    dataList.append(datum)
+                    if profiler is not None:
+                        profiler.enter(profiler.STAGE_READ, datum)
+                    if childItems == 1 and data[pos] != tagEntry:
+                        # An entry that holds a single simple value
+                        # stores it directly, without a list
+                        datum._dataList = None
+                        datum._value, pos = parseBinaryValue(data, pos)
+                        if profiler is not None:
+                            profiler.countBytes(pos - counted)
+                            counted = pos
+                            profiler.leave()
+                        continue
+                    stack.append((entry, numItems))
+                    entry = datum
+                    dataList = datum._dataList
+                    numItems = childItems
+                else:
+                    datum, pos = parseBinaryValue(data, pos)
+                    dataList.append(datum)
+            if profiler is not None:
+                profiler.countBytes(pos - counted)
+                counted = pos
+                profiler.leave()
+        return result, pos
+    
+    @staticmethod
+    def parseBinaryEntryHeader(data, pos, symbols = None):
+        """An internal method used to decode the beginning of a
+        GameSaveEntry in the binary format, up to its first item.
+        
+        Params: data -- The bytes from which to decode the entry
+                pos -- The position of the entry's tag
+                symbols -- The list of type- and loadFn-strings to
+                           which the entry refers, or None.
+        
+        Returns: A tuple of a GameSaveEntry (as yet holding no items),
+                 the number of items that it should hold, and the
+                 position of its first item"""
+        
+        if data[pos] != GameSaver.BINARY_TAG_ENTRY:
+            raise IOError("Loading: Malformed binary data; expected an entry at position", pos)
+        size, pos = GameSaver.decodeVarint(data, pos + 1)
+        result = GameSaveEntry()
+        if symbols is None:
+            objType, pos = GameSaver.parseBinaryString(data, pos)
+            loadFn, pos = GameSaver.parseBinaryString(data, pos)
+            result.objType = sys.intern(objType)
+            result.loadFn = sys.intern(loadFn)
+        else:
+            # The table's strings are already interned
+            symbol, pos = GameSaver.decodeVarint(data, pos)
+            result.objType = symbols[symbol]
+            symbol, pos = GameSaver.decodeVarint(data, pos)
+            result.loadFn = symbols[symbol]
+        numItems, pos = GameSaver.decodeVarint(data, pos)
+        return result, numItems, pos
+    
+    @staticmethod
+    def parseBinaryRecordLength(data, pos):
+        """An internal method used to decode the length of a record in
+        the binary format that's prefixed by the length of its body,
+        such as an entry, without moving past the record.
+        
+        Params: data -- The bytes from which to decode the length
+                pos -- The position of the record's tag
+        
+        Returns: A tuple of the length of the record as a whole,
+                 and the given position"""
+        
+        size, end = GameSaver.decodeVarint(data, pos + 1)
+        return end - pos + size, pos
+    
+    @staticmethod
+    def parseBinaryValue(data, pos):
+        """An internal method used to decode a simple value
+        encoded by "encodeBinaryValue".
+        
+        Params: data -- The bytes from which to decode the value
+                pos -- The position of the value's tag
+        
+        Returns: A tuple of the value's text and the position just after it"""
+        
+        tag = data[pos]
+        if tag == GameSaver.BINARY_TAG_STRING:
+            return GameSaver.parseBinaryString(data, pos + 1)
+        elif tag == GameSaver.BINARY_TAG_INT:
+            number, pos = GameSaver.decodeVarint(data, pos + 1)
+            if number & 1:
+                number = -((number + 1) >> 1)
+            else:
+                number >>= 1
+            return str(number), pos
+        elif tag == GameSaver.BINARY_TAG_FLOAT:
+            return repr(struct.unpack_from("<d", data, pos + 1)[0]), pos + 9
+        elif tag == GameSaver.BINARY_TAG_TRUE:
+            return "True", pos + 1
+        elif tag == GameSaver.BINARY_TAG_FALSE:
+            return "False", pos + 1
+        raise IOError("Loading: Malformed binary data; unrecognised tag", tag)
+    
+    @staticmethod
+    def readBinarySymbols(fileObj):
+        """An internal method used to read the table of type- and
+        loadFn-strings with which a binary file may begin, without
+        reading the remainder of the file.
+        
+        Params: fileObj -- The binary-mode file object to read from,
+                           positioned just after the file's header.
+        
+        Returns: A list of the strings in the table, or None if
+                 the file has no table"""
+        
+        start = fileObj.tell()
+        # Enough for the table's tag and the longest length-prefix
+        # that we might expect
+        prefix = fileObj.read(11)
+        if len(prefix) > 0 and prefix[0] == GameSaver.BINARY_TAG_METADATA:
+            size, pos = GameSaver.decodeVarint(prefix, 1)
+            start += pos + size
+            fileObj.seek(start)
+            prefix = fileObj.read(11)
+        if len(prefix) == 0 or prefix[0] != GameSaver.BINARY_TAG_SYMBOLS:
+            return None
+        size, pos = GameSaver.decodeVarint(prefix, 1)
+        fileObj.seek(start)
+        return GameSaver.parseBinarySymbols(fileObj.read(pos + size), 0)[0]
+    
+    @staticmethod
+    def readBinaryEntry(fileObj):
+        """Read a GameSaveEntry from file in the binary format.
+        
+        Params: fileObj -- The binary-mode file object to read from,
+                           positioned just after the file's header.
+        
+        Returns: A GameSaveEntry with whatever data was read."""
+        
+        data = fileObj.read()
+        symbols, pos = GameSaver.parseBinarySymbols(data, 0)
+        return GameSaver.parseBinaryEntry(data, pos, symbols)[0]
+    
+    @staticmethod
+    def describeMetadata(metadata):
+        """An internal method used to describe a dictionary of
+        metadata, to be written at the start of a file.
+        
+        Params: metadata -- The dictionary, with string keys
+        
+        Returns: A GameSaveEntry holding one entry per key, with
+                 the key as its loadFn"""
+        
+        result = GameSaveEntry()
+        for key, value in metadata.items():
+            if not isinstance(key, str) or "\n" in key or "\r" in key:
+                raise ValueError("Saving: Metadata keys must be strings of a single line:", key)
+            result.addItem(key, value)
+        return result
+    
+    @staticmethod
+    def restoreMetadata(entry):
+        """An internal method used to rebuild a dictionary of
+        metadata from its description.
+        
+        Params: entry -- The GameSaveEntry describing the metadata
+        
+        Returns: The dictionary"""
+        
+        result = {}
+        restorer = SaveableObject()
+        for datum in entry.peekDataList():
+            result[datum.loadFn] = restorer.reconstructObject(datum.peekDataList(), datum.objType)
+        return result
+    
+    @staticmethod
+    def encodeMetadata(entry, fileFormat):
+        """An internal method used to encode the metadata
+        written at the start of a file.
+        
+        Params: entry -- The GameSaveEntry describing the metadata
+                fileFormat -- The format in which to encode it
+        
+        Returns: The encoded metadata: bytes in the binary
+                 format, and a string in the text format"""
+        
+        if fileFormat == GameSaver.FORMAT_BINARY:
+            chunks = []
+            GameSaver.appendBinaryEntry(entry, chunks)
+            body = b"".join(chunks)
+            return bytes((GameSaver.BINARY_TAG_METADATA,)) + GameSaver.encodeVarint(len(body)) + body
+        text = io.StringIO()
+        text.write(GameSaver.METADATA_MARKER + "\n")
+        GameSaver.writeEntry(entry, text)
+        return text.getvalue()
+    
+    @staticmethod
+    def readTextMetadata(fileObj):
+        """An internal method used to read the metadata with
+        which a text file may begin.
+        
+        Params: fileObj -- The file object to read from, positioned
+                           at the start of the file
+        
+        Returns: A GameSaveEntry describing the metadata"""
+        
+        GameSaver.readLine(fileObj)
+        return GameSaver.readEntry(fileObj)
+    
+    @staticmethod
+    def saveGame(baseObjToSave, fileName, forLevelSave, fileFormat = FORMAT_TEXT,
+                 compression = None, compressionLevel = None, writeIndex = False, workers = None,
+                 metadata = None):
+        """Save an object to file.
+        
+        Params: baseObjToSave -- The object to be saved.
+                fileName -- The name of the file to write to.
+                forLevelSave -- Whether this save data
+                                is intended for a level file, as
+                                opposed to a save of an active game.
+                fileFormat -- The format in which to write the file;
+                              one of GameSaver.FORMAT_TEXT and
+                              GameSaver.FORMAT_BINARY.
+                compression -- The method by which to compress the
+                               file, as it's written; one of the
+                               "COMPRESSION_" constants, or None
+                               to leave the file uncompressed.
+                compressionLevel -- The level of compression to use,
+                                    trading time for size; if None,
+                                    the method's default is used.
+                writeIndex -- If True, an index of the entries held by
+                              the object's save data is appended to the
+                              file, allowing "loadSection" to read any one
+                              of them without reading the rest. An index
+                              can't be written to a compressed file.
+                workers -- If greater than 1, the entries held by the
+                           object's save data are encoded in parallel by
+                           this many worker-processes, as described under
+                           "saveEntry".
+                metadata -- If not None, a small dictionary describing the
+                            save, such as the player's level and the time of
+                            saving, to be written at the start of the file,
+                            as described under "saveEntry"."""
+    
+        objList = GameSaver.retrieveSaveData(baseObjToSave, forLevelSave)
+        GameSaver.saveEntry(objList, fileName, fileFormat, compression, compressionLevel, writeIndex, workers,
+                            metadata)
+    
+    @staticmethod
+    def saveEntry(obj, fileName, fileFormat = FORMAT_TEXT, compression = None, compressionLevel = None,
+                  writeIndex = False, workers = None, metadata = None):
+        """Save a GameSaveEntry, such as that returned by
+        "getSaveData", to file. Any journal of changes made
+        to the file is discarded.
+        
+        Params: obj -- The GameSaveEntry to be saved.
+                fileName -- The name of the file to write to.
+                fileFormat -- The format in which to write the file;
+                              one of GameSaver.FORMAT_TEXT and
+                              GameSaver.FORMAT_BINARY.
+                compression -- The method by which to compress the
+                               file, as it's written; one of the
+                               "COMPRESSION_" constants, or None
+                               to leave the file uncompressed.
+                compressionLevel -- The level of compression to use,
+                                    trading time for size; if None,
+                                    the method's default is used.
+                writeIndex -- If True, an index of the entries held by
+                              the GameSaveEntry is appended to the file,
+                              allowing "loadSection" to read any one of
+                              them without reading the rest. An index
+                              can't be written to a compressed file.
+                workers -- If greater than 1, the entries held by the
+                           GameSaveEntry are sent to a pool of this many
+                           worker-processes to be encoded in parallel, and
+                           the results written in order; the file is the
+                           same as that written otherwise. This may speed
+                           the saving of large files with many top-level
+                           entries, but costs time in copying the entries
+                           to the workers. An index can't be written by
+                           a parallel save.
+                metadata -- If not None, a small dictionary describing the
+                            save, with string keys and values of any type
+                            that may be saved. It's written at the start of
+                            the file, ahead of the GameSaveEntry, so that
+                            "readMetadata" may read it, such as to list a
+                            game's save-slots, without reading the rest
+                            of the file."""
+        
+        if fileFormat not in (GameSaver.FORMAT_TEXT, GameSaver.FORMAT_BINARY):
+            raise ValueError("Saving: Unrecognised file-format: " + str(fileFormat))
+        if compression is not None and not GameSaver.isCompressionAvailable(compression):
+            raise ValueError("Saving: Unrecognised or unavailable compression-method: " + str(compression))
+        if compression is not None and writeIndex:
+            raise ValueError("Saving: An index can't be written to a compressed file")
+        if workers is not None and workers > 1 and writeIndex:
+            raise ValueError("Saving: An index can't be written by a parallel save")
+        if metadata is not None and not isinstance(metadata, GameSaveEntry):
+            metadata = GameSaver.describeMetadata(metadata)
+        rawFileObj = None
+        fileObj = None
+        ## To do: This should probably just throw to exception and let it
+        ##        be caught or passed on by the calling method.
+        try:
+            # The journal is discarded first, so that an interrupted save
+            # can't leave a journal to be applied to the wrong file
+            GameSaver.discardJournal(fileName)
+            GameSaver.releaseMappedFile(fileName)
+            GameSaver.forgetCachedFile(fileName)
+            if writeIndex:
+                # The index records positions in bytes, so text is
+                # written in binary mode, and encoded by GameSaver
+                fileObj = open(fileName, "wb")
+                if fileFormat == GameSaver.FORMAT_BINARY:
+                    fileObj.write(GameSaver.BINARY_MAGIC + bytes((GameSaver.BINARY_VERSION,)))
+                if metadata is not None:
+                    header = GameSaver.encodeMetadata(metadata, fileFormat)
+                    if fileFormat == GameSaver.FORMAT_TEXT:
+                        header = header.encode("utf-8")
+                    fileObj.write(header)
+                GameSaver.writeIndexedEntry(obj, fileObj, fileFormat)
+            else:
+                if compression is None:
+                    if fileFormat == GameSaver.FORMAT_BINARY:
+                        fileObj = open(fileName, "wb")
+                    else:
+                        fileObj = open(fileName, "w")
+                else:
+                    rawFileObj = open(fileName, "wb")
+                    fileObj = GameSaver.openCompressedWriter(rawFileObj, compression, compressionLevel)
+                    if fileFormat == GameSaver.FORMAT_TEXT:
+                        fileObj = io.TextIOWrapper(fileObj, encoding = "utf-8")
+                if fileFormat == GameSaver.FORMAT_BINARY:
+                    fileObj.write(GameSaver.BINARY_MAGIC + bytes((GameSaver.BINARY_VERSION,)))
+                if metadata is not None:
+                    fileObj.write(GameSaver.encodeMetadata(metadata, fileFormat))
+                if workers is not None and workers > 1:
+                    GameSaver.writeParallelEntry(obj, fileObj, fileFormat, workers)
+                elif fileFormat == GameSaver.FORMAT_BINARY:
+                    GameSaver.writeBinaryEntry(obj, fileObj)
+                else:
+                    GameSaver.writeEntry(obj, fileObj)
+        except IOError:
+            print("Saving: IOError!  Failed to open file \"" + fileName + "\"!")
+            raise
+        else:
+            if fileObj is not None:
+                fileObj.close()
+            if rawFileObj is not None:
+                rawFileObj.close()
+    
+    @staticmethod
+    def saveGameIncremental(baseObjToSave, fileName, forLevelSave, fileFormat = FORMAT_TEXT,
+                            compression = None, compressionLevel = None, metadata = None,
+                            timeBudget = None, sliceCapture = False, callback = None):
+        """Save an object to file a little at a time, via a GameSaveJob
+        run as a Panda3D task, doing a limited amount of work in each
+        frame. The job's progress may be checked via its "getProgress"
+        method, and its completion via its "isDone" method or the
+        callback given.
+        
+        Params: baseObjToSave -- The object to be saved.
+                fileName -- The name of the file to write to.
+                forLevelSave -- Whether this save data
+                                is intended for a level file, as
+                                opposed to a save of an active game.
+                fileFormat -- The format in which to write the file;
+                              one of GameSaver.FORMAT_TEXT and
+                              GameSaver.FORMAT_BINARY.
+                compression -- The method by which to compress the file,
+                               or None to leave it uncompressed.
+                compressionLevel -- The level of compression to use, or
+                                    None for the method's default.
+                metadata -- If not None, a small dictionary describing
+                            the save, as described under "saveEntry".
+                timeBudget -- The time, in seconds, to spend on the job
+                              in each frame; if None, the value of
+                              GameSaver.incrementalTimeBudget is used.
+                sliceCapture -- If True, the capture of the object's save
+                                data is spread out too, one item (or one
+                                declared field) per step, as described
+                                under GameSaveJob; otherwise,
+                                it's captured whole in the first step.
+                callback -- If not None, a function to be called with
+                            the job once it's done; if the job failed,
+                            its "error" attribute holds the exception.
+        
+        Returns: The GameSaveJob"""
+        
+        job = GameSaveJob(baseObjToSave, fileName, forLevelSave, fileFormat,
+                          compression, compressionLevel, metadata, sliceCapture, callback)
+        job.start(timeBudget)
+        return job
+    
+    @staticmethod
+    def saveGameStream(baseObjToSave, fileName, forLevelSave, fileFormat = FORMAT_TEXT, metadata = None):
+        """Save an object to file, writing its save data as it's produced
+        by the object's "getSaveDataStream" method, rather than first
+        gathering the whole of it; the memory used is thus bounded by the
+        size of the largest single item produced, rather than by that of
+        the object's data as a whole. The file is read as any other.
+        
+        Objects shared between items are saved once for each item that
+        reaches them, as though GameSaver.trackReferences were False.
+        The strings naming types and loadFns aren't known until they're
+        written, and so binary files are written without a table of them,
+        each being written in full wherever it appears. Nor may streamed
+        files be compressed: the count (and, in the binary format, the
+        length) of each streamed entry is filled in by seeking back within
+        the file once the entry is finished. Where a compressed file is
+        wanted, "saveGame" should be used.
+        
+        Params: baseObjToSave -- The object to be saved.
+                fileName -- The name of the file to write to.
+                forLevelSave -- Whether this save data
+                                is intended for a level file, as
+                                opposed to a save of an active game.
+                fileFormat -- The format in which to write the file;
+                              one of GameSaver.FORMAT_TEXT and
+                              GameSaver.FORMAT_BINARY.
+                metadata -- If not None, a small dictionary describing
+                            the save, as described under "saveEntry"."""
+        
+        if fileFormat not in (GameSaver.FORMAT_TEXT, GameSaver.FORMAT_BINARY):
+            raise ValueError("Saving: Unrecognised file-format: " + str(fileFormat))
+        if metadata is not None:
+            metadata = GameSaver.describeMetadata(metadata)
+        fileObj = None
+        try:
+            GameSaver.discardJournal(fileName)
+            GameSaver.releaseMappedFile(fileName)
+            GameSaver.forgetCachedFile(fileName)
+            # The stream is written straight to the file, which must be
+            # seekable, so that the spaces left for entries' lengths
+            # may be filled in
+            fileObj = open(fileName, "wb")
+            if fileFormat == GameSaver.FORMAT_BINARY:
+                fileObj.write(GameSaver.BINARY_MAGIC + bytes((GameSaver.BINARY_VERSION,)))
+            if metadata is not None:
+                header = GameSaver.encodeMetadata(metadata, fileFormat)
+                if fileFormat == GameSaver.FORMAT_TEXT:
+                    header = header.encode("utf-8")
+                fileObj.write(header)
+            GameSaver.writeStreamedEntry(baseObjToSave, forLevelSave, fileObj, fileFormat)
+        except IOError:
+            print("Saving: IOError!  Failed to open file \"" + fileName + "\"!")
+            raise
+        finally:
+            if fileObj is not None:
+                fileObj.close()
+    
+    @staticmethod
+    def isCompressionAvailable(compression):
+        """Determine whether a compression-method is recognised,
+        and supported by this build of Python.
+        
+        Params: compression -- One of the "COMPRESSION_" constants.
+        
+        Returns: True if the method may be used, and False otherwise"""
+        
+        if compression == GameSaver.COMPRESSION_ZLIB:
+            return True
+        elif compression == GameSaver.COMPRESSION_LZMA:
+            return lzma is not None
+        elif compression == GameSaver.COMPRESSION_BZ2:
+            return bz2 is not None
+        return False
+    
+    @staticmethod
+    def openCompressedWriter(fileObj, compression, compressionLevel = None):
+        """An internal method used to wrap a binary-mode file object
+        in another that compresses data as it's written.
+        
+        Params: fileObj -- The file object to be written to.
+                compression -- The method by which to compress the data.
+                compressionLevel -- The level of compression to use,
+                                    or None for the method's default.
+        
+        Returns: A binary-mode file object; closing it doesn't
+                 close the underlying file object"""
+        
+        if compression == GameSaver.COMPRESSION_ZLIB:
+            if compressionLevel is None:
+                compressionLevel = -1
+            # The file's name and modification-time are left out of
+            # the header, so that identical data compresses identically
+            return gzip.GzipFile(filename = "", mode = "wb", fileobj = fileObj,
+                                 compresslevel = compressionLevel, mtime = 0)
+        elif compression == GameSaver.COMPRESSION_LZMA and lzma is not None:
+            return lzma.LZMAFile(fileObj, "wb", preset = compressionLevel)
+        elif compression == GameSaver.COMPRESSION_BZ2 and bz2 is not None:
+            if compressionLevel is None:
+                compressionLevel = 9
+            return bz2.BZ2File(fileObj, "wb", compresslevel = compressionLevel)
+        raise ValueError("Unrecognised or unavailable compression-method: " + str(compression))
+    
+    @staticmethod
+    def openDecompressedReader(fileObj, compression):
+        """An internal method used to wrap a binary-mode file object
+        in another that decompresses data as it's read.
+        
+        Params: fileObj -- The file object to be read from.
+                compression -- The method by which the data was compressed,
+                               or None if it wasn't compressed, in which case
+                               the file object is returned unchanged.
+        
+        Returns: A binary-mode file object; closing it doesn't
+                 close the underlying file object"""
+        
+        if compression is None:
+            return fileObj
+        elif compression == GameSaver.COMPRESSION_ZLIB:
+            return gzip.GzipFile(mode = "rb", fileobj = fileObj)
+        elif compression == GameSaver.COMPRESSION_LZMA and lzma is not None:
+            return lzma.LZMAFile(fileObj, "rb")
+        elif compression == GameSaver.COMPRESSION_BZ2 and bz2 is not None:
+            return bz2.BZ2File(fileObj, "rb")
+        raise IOError("Loading: Unrecognised or unavailable compression-method: " + str(compression))
+    
+    @staticmethod
+    def detectCompression(header):
+        """An internal method used to determine the method by which
+        a file was compressed, from the first bytes of the file.
+        
+        Params: header -- The first bytes of the file; at
+                          least nine bytes, if the file is that long
+        
+        Returns: One of the "COMPRESSION_" constants, or None
+                 if the file isn't compressed"""
+        
+        for compression, compressionHeader in GameSaver.COMPRESSION_HEADERS:
+            if header.startswith(compressionHeader):
+                # Text that happens to begin with "BZh" isn't bz2-data
+                # unless it's followed by a level and the bz2 block-header
+                if compression == GameSaver.COMPRESSION_BZ2 and header[4:9] != b"1AY&S":
+                    continue
+                return compression
+        return None
+    
+    @staticmethod
+    def saveGameAsync(baseObjToSave, fileName, forLevelSave, fileFormat = FORMAT_TEXT,
+                      compression = None, compressionLevel = None, callback = None, metadata = None):
+        """Save an object to file in the background. The object's save
+        data is retrieved immediately, on the calling thread; encoding it
+        and writing it to file are then done on a worker thread, so that
+        the game needn't wait for them.
+        
+        Saves to the same file are carried out one at a time, in the
+        order in which they were requested.
+        
+        Params: baseObjToSave -- The object to be saved.
+                fileName -- The name of the file to write to.
+                forLevelSave -- Whether this save data
+                                is intended for a level file, as
+                                opposed to a save of an active game.
+                fileFormat -- The format in which to write the file;
+                              one of GameSaver.FORMAT_TEXT and
+                              GameSaver.FORMAT_BINARY.
+                compression -- The method by which to compress the file,
+                               or None to leave it uncompressed.
+                compressionLevel -- The level of compression to use, or
+                                    None for the method's default.
+                callback -- If not None, a function to be called with the
+                            returned Future once the save has finished;
+                            note that it's called on the worker thread.
+                metadata -- If not None, a small dictionary describing
+                            the save, as described under "saveEntry".
+        
+        Returns: A concurrent.futures.Future that completes when the
+                 save has finished, and that holds any exception
+                 raised in the attempt"""
+        
+        objList = GameSaver.retrieveSaveData(baseObjToSave, forLevelSave)
+        return GameSaver.saveEntryAsync(objList, fileName, fileFormat, compression, compressionLevel, callback,
+                                        metadata)
+    
+    @staticmethod
+    def saveEntryAsync(obj, fileName, fileFormat = FORMAT_TEXT,
+                       compression = None, compressionLevel = None, callback = None, metadata = None):
+        """Save a GameSaveEntry to file in the background, as
+        described under "saveGameAsync". The entry shouldn't be
+        modified until the save has finished.
+        
+        Params: obj -- The GameSaveEntry to be saved.
+                fileName -- The name of the file to write to.
+                fileFormat -- The format in which to write the file.
+                compression -- The method by which to compress the file,
+                               or None to leave it uncompressed.
+                compressionLevel -- The level of compression to use, or
+                                    None for the method's default.
+                callback -- If not None, a function to be called with the
+                            returned Future once the save has finished.
+                metadata -- If not None, a small dictionary describing
+                            the save, as described under "saveEntry".
+        
+        Returns: A concurrent.futures.Future for the save"""
+        
+        # The metadata is described immediately, as with the entry,
+        # so that it may be changed while the save is under way
+        if metadata is not None:
+            metadata = GameSaver.describeMetadata(metadata)
+        # A journalled save made in the meantime shouldn't find its
+        # changes against the entry that this save will replace
+        GameSaver.journalBases.pop(fileName, None)
+        with GameSaver.asyncSaveLock:
+            if GameSaver.asyncSaveExecutor is None:
+                GameSaver.asyncSaveExecutor = concurrent.futures.ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "GameSaver")
+            previous = GameSaver.asyncSaves.get(fileName)
+            future = GameSaver.asyncSaveExecutor.submit(GameSaver.runAsyncSave, obj, fileName, fileFormat,
+                                                        compression, compressionLevel, previous, metadata)
+            GameSaver.asyncSaves[fileName] = future
+        future.add_done_callback(lambda finished: GameSaver.forgetAsyncSave(fileName, finished))
+        if callback is not None:
+            future.add_done_callback(callback)
+        return future
+    
+    @staticmethod
+    def runAsyncSave(obj, fileName, fileFormat, compression, compressionLevel, previous, metadata = None):
+        """An internal method used to carry out a background save,
+        once any earlier save to the same file has finished.
+        
+        Params: obj -- The GameSaveEntry to be saved.
+                fileName -- The name of the file to write to.
+                fileFormat -- The format in which to write the file.
+                compression -- The method by which to compress the file.
+                compressionLevel -- The level of compression to use.
+                previous -- The Future for the previous save to
+                            the same file, or None if there is none.
+                metadata -- The GameSaveEntry describing the
+                            save's metadata, or None."""
+        
+        if previous is not None:
+            concurrent.futures.wait((previous,))
+        GameSaver.saveEntry(obj, fileName, fileFormat, compression, compressionLevel, metadata = metadata)
+    
+    @staticmethod
+    def forgetAsyncSave(fileName, future):
+        """An internal method used to stop tracking a finished
+        background save.
+        
+        Params: fileName -- The name of the file saved to.
+                future -- The Future for the save."""
+        
+        with GameSaver.asyncSaveLock:
+            if GameSaver.asyncSaves.get(fileName) is future:
+                del GameSaver.asyncSaves[fileName]
+    
+    @staticmethod
+    def waitForAsyncSaves(fileName = None, timeout = None):
+        """Wait for background saves to finish.
+        
+        Params: fileName -- If not None, only saves to this file
+                            are waited for.
+                timeout -- The maximum number of seconds to wait,
+                           or None to wait for as long as it takes.
+        
+        Returns: True if the saves finished, False if the
+                 timeout expired first"""
+        
+        with GameSaver.asyncSaveLock:
+            if fileName is None:
+                futures = list(GameSaver.asyncSaves.values())
+            elif fileName in GameSaver.asyncSaves:
+                futures = [GameSaver.asyncSaves[fileName]]
+            else:
+                futures = []
+        notDone = concurrent.futures.wait(futures, timeout)[1]
+        return len(notDone) == 0
+    
+    @staticmethod
+    def saveGameToJournal(baseObjToSave, fileName, forLevelSave, fileFormat = FORMAT_TEXT,
+                          compression = None, compressionLevel = None, compactionThreshold = None,
+                          writeIndex = False, metadata = None):
+        """Save an object to file, appending to the file's journal only
+        those parts of the object's save data that have changed since it
+        was last saved in this way. The file is saved in full the first
+        time, and whenever the journal grows too large. "loadGame"
+        applies the journal automatically.
+        
+        Params: baseObjToSave -- The object to be saved.
+                fileName -- The name of the file to write to.
+                forLevelSave -- Whether this save data
+                                is intended for a level file, as
+                                opposed to a save of an active game.
+                fileFormat -- The format in which to write the file;
+                              one of GameSaver.FORMAT_TEXT and
+                              GameSaver.FORMAT_BINARY.
+                compression -- The method by which to compress full
+                               saves of the file, or None to leave them
+                               uncompressed; the journal itself is never
+                               compressed, so that it may be appended to.
+                compressionLevel -- The level of compression to use, or
+                                    None for the method's default.
+                compactionThreshold -- The size, in bytes, beyond which
+                                       the journal is folded back into a
+                                       full save; if None, the value of
+                                       GameSaver.journalCompactionThreshold
+                                       is used.
+                writeIndex -- If True, full saves of the file are followed
+                              by an index of the entries held by its root
+                              entry, as with "saveGame".
+                metadata -- If not None, a small dictionary describing the
+                            save, written at the start of the file by full
+                            saves of it, as with "saveGame". Saves that only
+                            append to the journal leave in place the metadata
+                            of the last full save."""
+        
+        if compactionThreshold is None:
+            compactionThreshold = GameSaver.journalCompactionThreshold
+        objList = GameSaver.retrieveSaveData(baseObjToSave, forLevelSave)
+        base = GameSaver.journalBases.get(fileName)
+        changes = None
+        if base is not None and base[1] == fileFormat and base[2] == compression:
+            changes = GameSaver.findChangedEntries(base[0], objList)
+        if changes is None:
+            GameSaver.saveEntry(objList, fileName, fileFormat, compression, compressionLevel, writeIndex,
+                                metadata = metadata)
+        elif len(changes) > 0:
+            GameSaver.appendToJournal(changes, fileName, fileFormat)
+            journalName = fileName + GameSaver.JOURNAL_SUFFIX
+            if getsize(journalName) > compactionThreshold:
+                # Failing new metadata, that of the last full save is kept
+                if metadata is None:
+                    metadata = GameSaver.readMetadata(fileName)
+                GameSaver.saveEntry(objList, fileName, fileFormat, compression, compressionLevel, writeIndex,
+                                    metadata = metadata)
+        GameSaver.journalBases[fileName] = (objList, fileFormat, compression)
+    
+    @staticmethod
+    def compactJournal(fileName, fileFormat = None):
+        """Fold a file's journal back into a fresh, full save of the file.
+        The file keeps the compression with which it was last saved,
+        and its index and metadata, if it has them.
+        
+        Params: fileName -- The name of the file.
+                fileFormat -- The format in which to write the file;
+                              if None, the format in which it was
+                              last saved is used."""
+        
+        base = GameSaver.journalBases.get(fileName)
+        if base is not None:
+            objList = base[0]
+            if fileFormat is None:
+                fileFormat = base[1]
+            compression = base[2]
+        else:
+            objList = GameSaver.loadGame(fileName)
+            if fileFormat is None:
+                fileFormat = GameSaver.detectFileFormat(fileName)
+            compression = GameSaver.detectFileCompression(fileName)
+        writeIndex = compression is None and GameSaver.readIndex(fileName) is not None
+        metadata = GameSaver.readMetadata(fileName)
+        GameSaver.saveEntry(objList, fileName, fileFormat, compression, writeIndex = writeIndex, metadata = metadata)
+        GameSaver.journalBases[fileName] = (objList, fileFormat, compression)
+    
+    @staticmethod
+    def discardJournal(fileName):
+        """An internal method used to empty a file's journal, if it
+        has one, before the file is saved in full, and to forget the
+        entry against which changes to the file were last found, as
+        it no longer matches the file.
+        
+        Params: fileName -- The name of the file."""
+        
+        GameSaver.journalBases.pop(fileName, None)
+        journalName = fileName + GameSaver.JOURNAL_SUFFIX
+        if exists(journalName) and getsize(journalName) > 0:
+            open(journalName, "wb").close()
+    
+    @staticmethod
+    def findChangedEntries(oldEntry, newEntry):
+        """An internal method used to find the smallest parts of one
+        GameSaveEntry that differ from another.
+        
+        Params: oldEntry -- The GameSaveEntry to compare against.
+                newEntry -- The GameSaveEntry that may have changed.
+        
+        Returns: A list of changes, each a tuple of a path and the entry
+                 from "newEntry" to be found at that path; a path is a
+                 tuple of (index, loadFn) pairs leading from the root
+                 to the changed entry, the loadFns being those of
+                 "oldEntry". If the roots themselves differ, None."""
+        
+        changes = []
+        stack = [(oldEntry, newEntry, ())]
+        while len(stack) > 0:
+            old, new, path = stack.pop()
+            oldItems = old.peekDataList()
+            newItems = new.peekDataList()
+            if old.objType != new.objType or old.loadFn != new.loadFn or len(oldItems) != len(newItems):
+                if len(path) == 0:
+                    return None
+                changes.append((path, new))
+                continue
+            children = []
+            for index in range(len(newItems)):
+                oldItem = oldItems[index]
+                newItem = newItems[index]
+                isEntry = isinstance(oldItem, GameSaveEntry)
+                if isEntry != isinstance(newItem, GameSaveEntry) or \
+                   (not isEntry and oldItem != newItem):
+                    # The entry's own values have changed, so
+                    # it's recorded as a whole
+                    if len(path) == 0:
+                        return None
+                    changes.append((path, new))
+                    children = None
+                    break
+                if isEntry:
+                    children.append((oldItem, newItem, path + ((index, oldItem.loadFn),)))
+            if children is not None:
+                stack.extend(reversed(children))
+        return changes
+    
+    @staticmethod
+    def appendToJournal(changes, fileName, fileFormat):
+        """An internal method used to append changes to a file's journal.
+        
+        Params: changes -- The changes, as returned by "findChangedEntries"
+                fileName -- The name of the file.
+                fileFormat -- The format in which the file was saved."""
+        
+        GameSaver.forgetCachedFile(fileName)
+        journalName = fileName + GameSaver.JOURNAL_SUFFIX
+        fileObj = None
+        try:
+            if fileFormat == GameSaver.FORMAT_BINARY:
+                chunks = []
+                for path, entry in changes:
+                    chunks.append(bytes((GameSaver.BINARY_TAG_PATCH,)))
+                    chunks.append(GameSaver.encodeVarint(len(path)))
+                    for index, loadFn in path:
+                        chunks.append(GameSaver.encodeVarint(index))
+                        chunks.append(GameSaver.encodeBinaryString(loadFn))
+                    GameSaver.appendBinaryEntry(entry, chunks)
+                fileObj = open(journalName, "ab")
+                fileObj.write(b"".join(chunks))
+            else:
+                fileObj = open(journalName, "a")
+                for path, entry in changes:
+                    GameSaver.writeLine(GameSaver.JOURNAL_PATCH_MARKER, fileObj)
+                    GameSaver.writeLine(len(path), fileObj)
+                    for index, loadFn in path:
+                        GameSaver.writeLine(index, fileObj)
+                        GameSaver.writeLine(loadFn, fileObj)
+                    GameSaver.writeEntry(entry, fileObj)
+                    GameSaver.writeLine(GameSaver.JOURNAL_END_MARKER, fileObj)
+        except IOError:
+            print("Saving: IOError!  Failed to write journal \"" + journalName + "\"!")
+            raise
+        else:
+            if fileObj is not None:
+                fileObj.close()
+    
+    @staticmethod
+    def readJournal(fileName, fileFormat):
+        """An internal method used to read the changes recorded in a
+        file's journal. A change left incomplete, as by an interrupted
+        save, ends the journal.
+        
+        Params: fileName -- The name of the file.
+                fileFormat -- The format in which the file was saved.
+        
+        Returns: A list of changes, in the form returned
+                 by "findChangedEntries"."""
+        
+        journalName = fileName + GameSaver.JOURNAL_SUFFIX
+        changes = []
+        if not exists(journalName):
+            return changes
+        if fileFormat == GameSaver.FORMAT_BINARY:
+            fileObj = open(journalName, "rb")
+            data = fileObj.read()
+            fileObj.close()
+            pos = 0
+            try:
+                while pos < len(data) and data[pos] == GameSaver.BINARY_TAG_PATCH:
+                    pathLength, pos = GameSaver.decodeVarint(data, pos + 1)
+                    path = []
+                    for i in range(pathLength):
+                        index, pos = GameSaver.decodeVarint(data, pos)
+                        loadFn, pos = GameSaver.parseBinaryString(data, pos)
+                        path.append((index, loadFn))
+                    size, bodyPos = GameSaver.decodeVarint(data, pos + 1)
+                    if bodyPos + size > len(data):
+                        break
+                    entry, pos = GameSaver.parseBinaryEntry(data, pos)
+                    changes.append((tuple(path), entry))
+            except (IndexError, ValueError, IOError, struct.error):
+                pass
+        else:
+            fileObj = open(journalName, "r")
+            reader = BufferedLineReader(fileObj)
+            try:
+                while reader.readline() == GameSaver.JOURNAL_PATCH_MARKER + "\n":
+                    path = []
+                    for i in range(int(reader.readline())):
+                        index = int(reader.readline())
+                        path.append((index, GameSaver.readLine(reader)))
+                    entry = GameSaver.readEntry(reader)
+                    if reader.readline() != GameSaver.JOURNAL_END_MARKER + "\n":
+                        break
+                    changes.append((tuple(path), entry))
+            except (IndexError, ValueError, IOError):
+                pass
+            fileObj.close()
+        return changes
+    
+    @staticmethod
+    def applyJournal(obj, changes):
+        """An internal method used to apply changes read from
+        a journal to a GameSaveEntry.
+        
+        Params: obj -- The GameSaveEntry to change.
+                changes -- The changes, in the form returned
+                           by "readJournal"."""
+        
+        for path, entry in changes:
+            parent = None
+            target = obj
+            for index, loadFn in path:
+                parent = target
+                items = parent.peekDataList()
+                if index >= len(items) or not isinstance(items[index], GameSaveEntry) or \
+                   GameSaver.toText(items[index].loadFn) != GameSaver.toText(loadFn):
+                    raise IOError("Loading: Journal does not match the file to which it belongs; path:", path)
+                target = items[index]
+            parent.dataList[path[-1][0]] = entry
+    
+    @staticmethod
+    def mapFileData(fileName):
+        """An internal method used to memory-map a file for reading.
+        
+        Params: fileName -- The name of the file.
+        
+        Returns: An mmap object, or None if the file couldn't be
+                 mapped, as when it isn't a file on disk"""
+        
+        if not os.path.isfile(fileName):
+            return None
+        try:
+            fileObj = builtins.open(fileName, "rb")
+        except OSError:
+            return None
+        try:
+            # Empty files can't be mapped
+            if os.fstat(fileObj.fileno()).st_size == 0:
+                return None
+            # The mapping remains valid once the file is closed
+            return mmap.mmap(fileObj.fileno(), 0, access = mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        finally:
+            fileObj.close()
+    
+    @staticmethod
+    def loadMappedFile(fileName, lazy):
+        """An internal method used to load a file by memory-mapping it.
+        
+        Params: fileName -- The name of the file.
+                lazy -- Whether to load the file lazily.
+        
+        Returns: A tuple of a GameSaveEntry describing the object
+                 represented by the file, sans any changes recorded
+                 in the file's journal, and the format of the file;
+                 or None if the file can't be loaded in this way"""
+        
+        mappedData = GameSaver.mapFileData(fileName)
+        if mappedData is None:
+            return None
+        header = mappedData[:len(GameSaver.BINARY_MAGIC) + 1]
+        if header[:-1] == GameSaver.BINARY_MAGIC:
+            if header[-1] > GameSaver.BINARY_VERSION:
+                mappedData.close()
+                raise IOError("Loading: Unsupported binary version in file \"" + fileName + "\":", header[-1])
+            fileFormat = GameSaver.FORMAT_BINARY
+            start = len(header)
+        elif lazy and GameSaver.detectCompression(header) is None:
+            fileFormat = GameSaver.FORMAT_TEXT
+            start = 0
+        else:
+            if GameSaver.detectCompression(header) is None:
+                print("Loading: Text file \"" + fileName + "\" is only memory-mapped when loaded lazily; reading it instead")
+            mappedData.close()
+            return None
+        if not lazy:
+            try:
+                # Decoding from a memoryview reads from the mapping
+                # directly, without copying each slice first
+                with memoryview(mappedData) as view:
+                    symbols, start = GameSaver.parseBinarySymbols(view, start)
+                    result = GameSaver.parseBinaryEntry(view, start, symbols)[0]
+            finally:
+                mappedData.close()
+            return result, fileFormat
+        source = LazyLoadSource(mappedData, fileFormat, start)
+        # The mapping is noted, so that it may be released
+        # before the file is overwritten
+        with GameSaver.mappedSourceLock:
+            sources = GameSaver.mappedSources.setdefault(os.path.abspath(fileName), weakref.WeakSet())
+            sources.add(source)
+        return source.readRoot(), fileFormat
+    
+    @staticmethod
+    def releaseMappedFile(fileName):
+        """An internal method used to copy into memory the contents
+        of a file that's been memory-mapped by lazy loads, and to
+        unmap the file, so that it may be safely overwritten.
+        
+        Params: fileName -- The name of the file."""
+        
+        with GameSaver.mappedSourceLock:
+            sources = GameSaver.mappedSources.pop(os.path.abspath(fileName), None)
+        if sources is not None:
+            for source in list(sources):
+                source.detach()
+    
+    @staticmethod
+    def detectFileFormat(fileName):
+        """Determine the format in which a file was saved.
+        
+        Params: fileName -- The name of the file.
+        
+        Returns: One of GameSaver.FORMAT_TEXT and GameSaver.FORMAT_BINARY"""
+        
+        rawFileObj = open(fileName, "rb")
+        compression = GameSaver.detectCompression(rawFileObj.read(len(GameSaver.BINARY_MAGIC) + 1))
+        rawFileObj.close()
+        rawFileObj = open(fileName, "rb")
+        fileObj = GameSaver.openDecompressedReader(rawFileObj, compression)
+        header = fileObj.read(len(GameSaver.BINARY_MAGIC))
+        if fileObj is not rawFileObj:
+            fileObj.close()
+        rawFileObj.close()
+        if header == GameSaver.BINARY_MAGIC:
+            return GameSaver.FORMAT_BINARY
+        return GameSaver.FORMAT_TEXT
+    
+    @staticmethod
+    def detectFileCompression(fileName):
+        """Determine the method by which a file was compressed.
+        
+        Params: fileName -- The name of the file.
+        
+        Returns: One of the "COMPRESSION_" constants, or None
+                 if the file isn't compressed"""
+        
+        fileObj = open(fileName, "rb")
+        header = fileObj.read(len(GameSaver.BINARY_MAGIC) + 1)
+        fileObj.close()
+        return GameSaver.detectCompression(header)
+    
+    @staticmethod
+    def loadGame(fileName, lazy = False, mapFile = False):
+        """Load an object from file. The format of the file, and
+        the method by which it was compressed, if it was, are
+        detected automatically.
+        
+        Params: fileName -- The name of the file to read from.
+                lazy -- If True, the entries describing the object are
+                        only read from the file's contents when their
+                        data is first accessed, and any that are never
+                        accessed are skipped without being read. (In the
+                        text format skipped entries must still be scanned
+                        for their ends; the binary format records the
+                        length of each entry, allowing it to be skipped
+                        outright. A compressed file is decompressed in
+                        full before any entries are read.)
+                mapFile -- If True, the file is memory-mapped, rather than
+                           read, where that's possible: that is, where it's
+                           an uncompressed file on disk (rather than in a
+                           multifile or other virtual file), and either in
+                           the binary format or loaded lazily. Entries are
+                           then read from the mapping directly, rather than
+                           from a copy of the file, and the mapping shared
+                           with other processes that map the same file.
+                           Only when loading lazily is just the data accessed
+                           brought into memory, and made into Python objects;
+                           otherwise, the whole of the file is parsed into
+                           entries as usual, sparing only the copy. A text
+                           file that isn't loaded lazily is read as usual,
+                           and a message printed to say so.
+        
+        Returns: A GameSaveEntry describing the object represented
+                 by the file, including any changes recorded in
+                 the file's journal."""
+    
+        result = None
+        rawFileObj = None
+        fileObj = None
+        try:
+            loaded = None
+            if mapFile:
+                loaded = GameSaver.loadMappedFile(fileName, lazy)
+            if loaded is not None:
+                result, fileFormat = loaded
+            else:
+                fileObj = open(fileName, "rb")
+                header = fileObj.read(len(GameSaver.BINARY_MAGIC) + 1)
+                compression = GameSaver.detectCompression(header)
+                if compression is not None:
+                    # The file is reopened rather than rewound, as
+                    # not all file objects support seeking
+                    fileObj.close()
+                    rawFileObj = open(fileName, "rb")
+                    fileObj = GameSaver.openDecompressedReader(rawFileObj, compression)
+                    header = fileObj.read(len(GameSaver.BINARY_MAGIC) + 1)
+                if header[:-1] == GameSaver.BINARY_MAGIC:
+                    if header[-1] > GameSaver.BINARY_VERSION:
+                        raise IOError("Loading: Unsupported binary version in file \"" + fileName + "\":", header[-1])
+                    fileFormat = GameSaver.FORMAT_BINARY
+                    if lazy:
+                        result = LazyLoadSource(fileObj.read(), fileFormat).readRoot()
+                    else:
+                        result = GameSaver.readBinaryEntry(fileObj)
+                else:
+                    fileFormat = GameSaver.FORMAT_TEXT
+                    if lazy:
+                        result = LazyLoadSource(header + fileObj.read(), fileFormat).readRoot()
+                    else:
+                        fileObj.close()
+                        if compression is None:
+                            fileObj = open(fileName, "r")
+                        else:
+                            rawFileObj.close()
+                            rawFileObj = open(fileName, "rb")
+                            fileObj = io.TextIOWrapper(GameSaver.openDecompressedReader(rawFileObj, compression),
+                                                       encoding = "utf-8")
+                        reader = BufferedLineReader(fileObj)
+                        if header.startswith(GameSaver.METADATA_MARKER.encode("utf-8")):
+                            GameSaver.readTextMetadata(reader)
+                        result = GameSaver.readEntry(reader)
+            changes = GameSaver.readJournal(fileName, fileFormat)
+            if len(changes) > 0:
+                GameSaver.applyJournal(result, changes)
+        except IOError:
+            print("Loading: IOError!  Failed to open file \"" + fileName + "\"!")
+            raise
+        else:
+            if fileObj is not None:
+                fileObj.close()
+            if rawFileObj is not None:
+                rawFileObj.close()
+        
+        return result
+    
+    @staticmethod
+    def loadGameCached(fileName):
+        """Load an object from file, as "loadGame" does, keeping the
+        entries parsed from the file in a cache shared by the whole
+        process, so that loading the file again, such as when a level
+        is restarted, needn't read and parse it again. The cached entries
+        are used for as long as the file and its journal keep the same
+        modification-times and sizes, and the file isn't saved anew by
+        GameSaver; the least recently used are dropped once the cache
+        grows beyond GameSaver.loadCacheBudget bytes.
+        
+        The entries returned are CachedGameSaveEntries presenting the
+        cached ones, and may be changed without affecting the cache.
+        
+        Params: fileName -- The name of the file to read from.
+        
+        Returns: A GameSaveEntry describing the object represented
+                 by the file, including any changes recorded in
+                 the file's journal."""
+        
+        # A missing file is left to "loadGame" to report
+        if not exists(fileName):
+            return GameSaver.loadGame(fileName)
+        path = os.path.abspath(fileName)
+        stamp = GameSaver.getFileStamp(fileName)
+        with GameSaver.loadCacheLock:
+            cached = GameSaver.loadCache.get(path)
+            if cached is not None:
+                if cached[0] == stamp:
+                    GameSaver.loadCache.move_to_end(path)
+                    return CachedGameSaveEntry(cached[1])
+                del GameSaver.loadCache[path]
+                GameSaver.loadCacheSize -= cached[2]
+        result = GameSaver.loadGame(fileName)
+        # If the file changed while it was being read, the
+        # entries read are returned, but not cached
+        if GameSaver.getFileStamp(fileName) != stamp:
+            return result
+        size = GameSaver.estimateEntrySize(result)
+        with GameSaver.loadCacheLock:
+            if size > GameSaver.loadCacheBudget:
+                return result
+            cached = GameSaver.loadCache.pop(path, None)
+            if cached is not None:
+                GameSaver.loadCacheSize -= cached[2]
+            GameSaver.loadCache[path] = (stamp, result, size)
+            GameSaver.loadCacheSize += size
+            while GameSaver.loadCacheSize > GameSaver.loadCacheBudget:
+                cached = GameSaver.loadCache.popitem(last = False)[1]
+                GameSaver.loadCacheSize -= cached[2]
+        return CachedGameSaveEntry(result)
+    
+    @staticmethod
+    def forgetCachedFile(fileName = None):
+        """Drop the entries kept by "loadGameCached" for a file, such as
+        when it's about to be overwritten, or for all files.
+        
+        Params: fileName -- The name of the file, or None for all files."""
+        
+        with GameSaver.loadCacheLock:
+            if fileName is None:
+                GameSaver.loadCache.clear()
+                GameSaver.loadCacheSize = 0
+                return
+            cached = GameSaver.loadCache.pop(os.path.abspath(fileName), None)
+            if cached is not None:
+                GameSaver.loadCacheSize -= cached[2]
+    
+    @staticmethod
+    def getFileStamp(fileName):
+        """An internal method used to describe the state of a file and
+        its journal, by which changes to them are detected.
+        
+        Params: fileName -- The name of the file.
+        
+        Returns: A tuple of the modification-times and sizes of the
+                 file and its journal (those of the latter being None
+                 if there's no journal)"""
+        
+        journalName = fileName + GameSaver.JOURNAL_SUFFIX
+        journalStamp = (None, None)
+        if exists(journalName):
+            journalStamp = (getmtime(journalName), getsize(journalName))
+        return (getmtime(fileName), getsize(fileName)) + journalStamp
+    
+    @staticmethod
+    def estimateEntrySize(entry):
+        """An internal method used to estimate the memory used
+        by a tree of GameSaveEntries.
+        
+        Params: entry -- The root entry of the tree.
+        
+        Returns: The estimate, in bytes"""
+        
+        getsizeof = sys.getsizeof
+        total = 0
+        stack = [entry]
+        while len(stack) > 0:
+            entry = stack.pop()
+            total += getsizeof(entry)
+            dataList = entry._dataList
+            if dataList is None:
+                total += getsizeof(entry._value)
+                continue
+            total += getsizeof(dataList)
+            for datum in dataList:
+                if isinstance(datum, GameSaveEntry):
+                    stack.append(datum)
+                else:
+                    total += getsizeof(datum)
+        return total
+    
+    @staticmethod
+    def loadGameIncremental(fileName, objToLoad = None, refObj = None,
+                            timeBudget = None, callback = None):
+        """Load an object from file a little at a time, via a GameLoadJob
+        run as a Panda3D task, doing a limited amount of work in each
+        frame. The file is read and parsed, and the given object then
+        restored from it via its "loadFromSaveDataStream" method. The
+        job's progress may be checked via its "getProgress" method, and
+        its completion via its "isDone" method or the callback given;
+        it may be stopped via its "cancel" method.
+        
+        Params: fileName -- The name of the file to read from.
+                objToLoad -- The object to restore from the file, or
+                             None to only read the file, the entries
+                             describing it being left in the job's
+                             "result" attribute.
+                refObj -- An object to be passed on to the object
+                          being restored, as by "loadFromSaveData".
+                timeBudget -- The time, in seconds, to spend on the job
+                              in each frame; if None, the value of
+                              GameSaver.incrementalTimeBudget is used.
+                callback -- If not None, a function to be called with
+                            the job once it's done; if the job failed,
+                            its "error" attribute holds the exception,
+                            and if it was cancelled, its "cancelled"
+                            attribute is True.
+        
+        Returns: The GameLoadJob"""
+        
+        job = GameLoadJob(fileName, objToLoad, refObj, callback)
+        job.start(timeBudget)
+        return job
+    
+    @staticmethod
+    def readIndex(fileName):
+        """Read the index written to a file by "saveGame" or "saveEntry".
+        
+        Params: fileName -- The name of the file.
+        
+        Returns: A tuple of the format of the file and a list of the
+                 entries held by the file's root entry, each a tuple of
+                 the entry's position in the root entry's data, its type,
+                 its loadFn, and the position and length of its contents
+                 in the file; or None if the file has no usable index"""
+        
+        fileObj = open(fileName, "rb")
+        try:
+            size = getsize(fileName)
+            header = fileObj.read(len(GameSaver.BINARY_MAGIC) + 1)
+            if header[:-1] == GameSaver.BINARY_MAGIC:
+                fileFormat = GameSaver.FORMAT_BINARY
+                footerLength = GameSaver.BINARY_INDEX_FOOTER_LENGTH
+            elif GameSaver.detectCompression(header) is None:
+                fileFormat = GameSaver.FORMAT_TEXT
+                footerLength = GameSaver.INDEX_FOOTER_LENGTH
+            else:
+                return None
+            if size < len(header) + footerLength:
+                return None
+            fileObj.seek(size - footerLength)
+            footer = fileObj.read(footerLength)
+            if fileFormat == GameSaver.FORMAT_BINARY:
+                if footer[8:] != GameSaver.BINARY_INDEX_MAGIC:
+                    return None
+                indexPos = struct.unpack("<Q", footer[:8])[0]
+            else:
+                footer = str(footer, "utf-8", "replace")
+                if not footer.startswith(GameSaver.INDEX_FOOTER_MARKER + " "):
+                    return None
+                indexPos = int(footer[len(GameSaver.INDEX_FOOTER_MARKER) + 1:])
+            if indexPos > size - footerLength:
+                return None
+            fileObj.seek(indexPos)
+            data = fileObj.read(size - footerLength - indexPos)
+        finally:
+            fileObj.close()
+        
+        entries = []
+        # A damaged index is treated as no index at all
+        try:
+            if fileFormat == GameSaver.FORMAT_BINARY:
+                if data[0] != GameSaver.BINARY_TAG_INDEX:
+                    return None
+                numEntries, pos = GameSaver.decodeVarint(data, 1)
+                for i in range(numEntries):
+                    itemIndex, pos = GameSaver.decodeVarint(data, pos)
+                    objType, pos = GameSaver.parseBinaryString(data, pos)
+                    loadFn, pos = GameSaver.parseBinaryString(data, pos)
+                    itemPos, pos = GameSaver.decodeVarint(data, pos)
+                    length, pos = GameSaver.decodeVarint(data, pos)
+                    entries.append((itemIndex, objType, loadFn, itemPos, length))
+            else:
+                lines = str(data, "utf-8").split("\n")
+                if lines[0] != GameSaver.INDEX_MARKER:
+                    return None
+                for i in range(int(lines[1])):
+                    itemIndex, objType, loadFn, itemPos, length = lines[2 + i*5:7 + i*5]
+                    entries.append((int(itemIndex), objType, loadFn, int(itemPos), int(length)))
+        except (IndexError, ValueError, UnicodeDecodeError):
+            return None
+        return fileFormat, entries
+    
+    @staticmethod
+    def loadSection(fileName, loadFn, objType = None):
+        """Load a single one of the entries held by the root entry of a
+        file, such as that for a particular field of the saved object,
+        including any changes to it recorded in the file's journal.
+        
+        If the file was saved with an index, only the entry in question
+        is read; otherwise the file is loaded lazily, and the entry
+        found among those loaded.
+        
+        To restore the object's field from the entry, place the entry
+        in a new GameSaveEntry and pass that to the object's
+        "loadFromSaveData" method.
+        
+        Params: fileName -- The name of the file to read from.
+                loadFn -- The loadFn of the entry to load.
+                objType -- If not None, the type of the entry to load.
+        
+        Returns: The GameSaveEntry, or None if the root entry
+                 holds no entry with the given loadFn and type"""
+        
+        result = None
+        try:
+            indexed = GameSaver.readIndex(fileName)
+            if indexed is None:
+                for datum in GameSaver.loadGame(fileName, lazy = True).peekDataList():
+                    if isinstance(datum, GameSaveEntry) and datum.loadFn == loadFn and \
+                       (objType is None or datum.objType == objType):
+                        return datum
+                return None
+            fileFormat, entries = indexed
+            for itemIndex, itemType, itemLoadFn, itemPos, length in entries:
+                if itemLoadFn == loadFn and (objType is None or itemType == objType):
+                    break
+            else:
+                return None
+            fileObj = open(fileName, "rb")
+            if fileFormat == GameSaver.FORMAT_BINARY:
+                fileObj.seek(len(GameSaver.BINARY_MAGIC) + 1)
+                symbols = GameSaver.readBinarySymbols(fileObj)
+            fileObj.seek(itemPos)
+            data = fileObj.read(length)
+            fileObj.close()
+            if fileFormat == GameSaver.FORMAT_BINARY:
+                result = GameSaver.parseBinaryEntry(data, 0, symbols)[0]
+            else:
+                result = GameSaver.readEntry(io.StringIO(str(data, "utf-8"), newline = "\n"))
+            for path, entry in GameSaver.readJournal(fileName, fileFormat):
+                if path[0][0] != itemIndex:
+                    continue
+                if GameSaver.toText(path[0][1]) != GameSaver.toText(itemLoadFn):
+                    raise IOError("Loading: Journal does not match the file to which it belongs; path:", path)
+                if len(path) == 1:
+                    result = entry
+                else:
+                    GameSaver.applyJournal(result, ((path[1:], entry),))
+        except IOError:
+            print("Loading: IOError!  Failed to open file \"" + fileName + "\"!")
+            raise
         
         return result
     
+    @staticmethod
+    def readMetadata(fileName):
+        """Read the metadata written at the start of a file by
+        "saveGame", without reading the rest of the file. (A compressed
+        file is decompressed only as far as the end of its metadata.)
+        
+        Params: fileName -- The name of the file to read from.
+        
+        Returns: A dictionary of the metadata, or None if
+                 the file was saved without metadata"""
+        
+        entry = None
+        rawFileObj = None
+        fileObj = None
+        try:
+            fileObj = open(fileName, "rb")
+            header = fileObj.read(len(GameSaver.BINARY_MAGIC) + 1)
+            compression = GameSaver.detectCompression(header)
+            if compression is not None:
+                fileObj.close()
+                rawFileObj = open(fileName, "rb")
+                fileObj = GameSaver.openDecompressedReader(rawFileObj, compression)
+                header = fileObj.read(len(GameSaver.BINARY_MAGIC) + 1)
+            if header[:-1] == GameSaver.BINARY_MAGIC:
+                # Enough for the metadata's tag and the longest
+                # length-prefix that we might expect
+                prefix = fileObj.read(11)
+                if len(prefix) > 0 and prefix[0] == GameSaver.BINARY_TAG_METADATA:
+                    size, pos = GameSaver.decodeVarint(prefix, 1)
+                    data = prefix[pos:pos + size]
+                    if len(data) < size:
+                        data += fileObj.read(size - len(data))
+                    entry = GameSaver.parseBinaryEntry(data, 0)[0]
+            elif header.startswith(GameSaver.METADATA_MARKER.encode("utf-8")):
+                fileObj.close()
+                if compression is None:
+                    fileObj = open(fileName, "r")
+                else:
+                    rawFileObj.close()
+                    rawFileObj = open(fileName, "rb")
+                    fileObj = io.TextIOWrapper(GameSaver.openDecompressedReader(rawFileObj, compression),
+                                               encoding = "utf-8")
+                entry = GameSaver.readTextMetadata(fileObj)
+        except IOError:
+            print("Loading: IOError!  Failed to open file \"" + fileName + "\"!")
+            raise
+        finally:
+            if fileObj is not None:
+                fileObj.close()
+            if rawFileObj is not None:
+                rawFileObj.close()
+        
+        if entry is None:
+            return None
+        return GameSaver.restoreMetadata(entry)
+    
+    @staticmethod
+    def readMetadataFiles(fileNames, workers = None):
+        """Read the metadata of several files, such as those of a game's
+        save-slots, at once. Each file's metadata is read by "readMetadata"
+        on a pool of threads, so that waiting on one file to be opened and
+        read needn't hold up the others.
+        
+        Params: fileNames -- The names of the files to read from.
+                workers -- The number of threads to use; if None,
+                           up to GameSaver.metadataScanWorkers.
+        
+        Returns: A dictionary mapping each file's name to a dictionary
+                 of its metadata, or to None if the file has no metadata
+                 or couldn't be read"""
+        
+        fileNames = list(fileNames)
+        if workers is None:
+            workers = min(GameSaver.metadataScanWorkers, len(fileNames))
+        
+        def readOne(fileName):
+            try:
+                return GameSaver.readMetadata(fileName)
+            except (IOError, ValueError):
+                return None
+        
+        if workers <= 1 or len(fileNames) <= 1:
+            return {fileName : readOne(fileName) for fileName in fileNames}
+        with concurrent.futures.ThreadPoolExecutor(max_workers = workers,
+                                                   thread_name_prefix = "GameSaverScan") as executor:
+            return dict(zip(fileNames, executor.map(readOne, fileNames)))
+    
+    @staticmethod
+    def parseGameEvents(fileName, handler):
+        """Read a file as a series of events passed to a handler, rather
+        than as a tree of entries: the start of each entry, each simple
+        value held by it, and its end, in the order in which they occur
+        in the file. Only the part of the file at hand is held at once,
+        so that files of any size may be scanned in little memory. The
+        handler may skip the contents of any entry; in the binary format,
+        skipped entries are passed over without being read.
+        
+        The format of the file, and the method by which it was compressed,
+        if it was, are detected automatically. Any metadata written at the
+        start of the file is passed over, and any changes recorded in the
+        file's journal are not applied.
+        
+        Params: fileName -- The name of the file to read from.
+                handler -- The GameSaveEventHandler to pass events to."""
+        
+        rawFileObj = None
+        fileObj = None
+        try:
+            fileObj = open(fileName, "rb")
+            header = fileObj.read(len(GameSaver.BINARY_MAGIC) + 1)
+            compression = GameSaver.detectCompression(header)
+            if compression is not None:
+                fileObj.close()
+                rawFileObj = open(fileName, "rb")
+                fileObj = GameSaver.openDecompressedReader(rawFileObj, compression)
+                header = fileObj.read(len(GameSaver.BINARY_MAGIC) + 1)
+            if header[:-1] == GameSaver.BINARY_MAGIC:
+                if header[-1] > GameSaver.BINARY_VERSION:
+                    raise IOError("Loading: Unsupported binary version in file \"" + fileName + "\":", header[-1])
+                reader = BufferedByteReader(fileObj, canSeek = compression is None)
+                symbols = None
+                data, pos = reader.fill(1)
+                if pos < len(data) and data[pos] == GameSaver.BINARY_TAG_METADATA:
+                    reader.skip(reader.decode(GameSaver.parseBinaryRecordLength)[0])
+                    data, pos = reader.fill(1)
+                if pos < len(data) and data[pos] == GameSaver.BINARY_TAG_SYMBOLS:
+                    symbols = reader.decode(GameSaver.parseBinarySymbols)[0]
+                GameSaver.parseBinaryEvents(reader, handler, symbols)
+            else:
+                fileObj.close()
+                if compression is None:
+                    fileObj = open(fileName, "r")
+                else:
+                    rawFileObj.close()
+                    rawFileObj = open(fileName, "rb")
+                    fileObj = io.TextIOWrapper(GameSaver.openDecompressedReader(rawFileObj, compression),
+                                               encoding = "utf-8")
+                reader = BufferedLineReader(fileObj)
+                if header.startswith(GameSaver.METADATA_MARKER.encode("utf-8")):
+                    GameSaver.readTextMetadata(reader)
+                GameSaver.parseTextEvents(reader, handler)
+        except IOError:
+            print("Loading: IOError!  Failed to open file \"" + fileName + "\"!")
+            raise
+        finally:
+            if fileObj is not None:
+                fileObj.close()
+            if rawFileObj is not None:
+                rawFileObj.close()
+    
+    @staticmethod
+    def parseTextEvents(fileObj, handler):
+        """An internal method used to pass the contents of an entry
+        in the text format to a GameSaveEventHandler.
+        
+        Nested entries are handled via an explicit stack, rather
+        than via recursion, so that deeply-nested data can't exceed
+        Python's recursion limit.
+        
+        Params: fileObj -- The file object to read from, positioned
+                           at the start of the entry.
+                handler -- The GameSaveEventHandler to pass events to."""
+        
+        readline = fileObj.readline
+        intern = sys.intern
+        marker = GameSaver.ENTRY_MARKER + "\n"
+        startEntry = handler.startEntry
+        scalar = handler.scalar
+        # Each frame holds the type and loadFn of an entry,
+        # and the number of its items that have yet to be read
+        stack = []
+        input = marker
+        while True:
+            if input == marker:
+                objType = intern(readline()[:-1])
+                loadFn = intern(readline()[:-1])
+                numItems = int(readline())
+                if startEntry(objType, loadFn, numItems) is False:
+                    GameSaver.skipTextEvents(fileObj, numItems)
+                else:
+                    stack.append([objType, loadFn, numItems])
+            elif input == "":
+                raise IOError("Loading: Unexpected end of file within entry", stack[-1][0], stack[-1][1])
+            else:
+                if input.endswith("\n"):
+                    input = input[:-1]
+                scalar(input, frame[0], frame[1])
+            while len(stack) > 0 and stack[-1][2] == 0:
+                frame = stack.pop()
+                handler.endEntry(frame[0], frame[1])
+            if len(stack) == 0:
+                return
+            frame = stack[-1]
+            frame[2] -= 1
+            input = readline()
+    
+    @staticmethod
+    def skipTextEvents(fileObj, numItems):
+        """An internal method used to read past the contents of
+        an entry in the text format without handling them.
+        
+        Params: fileObj -- The file object to read from, positioned
+                           at the entry's first item.
+                numItems -- The number of items held by the entry."""
+        
+        readline = fileObj.readline
+        marker = GameSaver.ENTRY_MARKER + "\n"
+        # The number of items yet to be read of each entry passed into
+        counts = [numItems]
+        while len(counts) > 0:
+            if counts[-1] == 0:
+                counts.pop()
+                continue
+            counts[-1] -= 1
+            input = readline()
+            if input == marker:
+                readline()
+                readline()
+                counts.append(int(readline()))
+            elif input == "":
+                raise IOError("Loading: Unexpected end of file within a skipped entry")
+    
+    @staticmethod
+    def parseBinaryEvents(reader, handler, symbols = None):
+        """An internal method used to pass the contents of an entry
+        in the binary format to a GameSaveEventHandler.
+        
+        Params: reader -- The BufferedByteReader to read from,
+                          positioned at the entry's tag.
+                handler -- The GameSaveEventHandler to pass events to.
+                symbols -- The list of type- and loadFn-strings to which
+                           the entry refers, or None."""
+        
+        tagEntry = GameSaver.BINARY_TAG_ENTRY
+        parseBinaryRecordLength = GameSaver.parseBinaryRecordLength
+        parseBinaryEntryHeader = GameSaver.parseBinaryEntryHeader
+        parseBinaryValue = GameSaver.parseBinaryValue
+        startEntry = handler.startEntry
+        scalar = handler.scalar
+        # Each frame holds the type and loadFn of an entry,
+        # and the number of its items that have yet to be read
+        stack = []
+        isEntry = True
+        while True:
+            if isEntry:
+                # The end of the entry is noted, so that it
+                # may be skipped if the handler so wishes
+                end = reader.tell() + reader.decode(parseBinaryRecordLength)[0]
+                entry, numItems = reader.decode(parseBinaryEntryHeader, symbols)
+                if startEntry(entry.objType, entry.loadFn, numItems) is False:
+                    reader.skip(end - reader.tell())
+                else:
+                    stack.append([entry.objType, entry.loadFn, numItems])
+            else:
+                value = reader.decode(parseBinaryValue)[0]
+                scalar(value, frame[0], frame[1])
+            while len(stack) > 0 and stack[-1][2] == 0:
+                frame = stack.pop()
+                handler.endEntry(frame[0], frame[1])
+            if len(stack) == 0:
+                return
+            frame = stack[-1]
+            frame[2] -= 1
+            data, pos = reader.fill(1)
+            if pos >= len(data):
+                raise IOError("Loading: Malformed binary data; unexpected end of file within entry",
+                              frame[0], frame[1])
+            isEntry = data[pos] == tagEntry
+    
     @staticmethod
     def destroy():
         """Clean up GameSaveEntry's data, in particular the function
@@ -435,4 +5799,16 @@ class GameSaver(object):
         for key in list(GameSaver.specialTypeDictionary.keys()):
             GameSaver.specialTypeDictionary[key] = None
         GameSaver.specialTypeDictionary = {}
+        GameSaver.saveableClassDictionary = {}
         GameSaver.isSubclass = None
+        GameSaver.clearDispatchCaches()
+        GameSaver.forgetCachedFile()
+        GameSaver.journalBases = {}
+        GameSaver.waitForAsyncSaves()
+        with GameSaver.asyncSaveLock:
+            if GameSaver.asyncSaveExecutor is not None:
+                GameSaver.asyncSaveExecutor.shutdown()
+                GameSaver.asyncSaveExecutor = None
+            if GameSaver.parallelSaveExecutor is not None:
+                GameSaver.parallelSaveExecutor.shutdown()
+                GameSaver.parallelSaveExecutor = None